@@ -3,10 +3,10 @@ FastAPI Backend - API Integration Layer
 Connects React frontend with Python automation backend
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks, UploadFile, File
+from fastapi import FastAPI, HTTPException, UploadFile, File, Query, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
-from pydantic import BaseModel
+from fastapi.responses import FileResponse, PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, Field
 from typing import List, Optional, Dict
 import asyncio
 from pathlib import Path
@@ -16,6 +16,13 @@ from datetime import datetime
 from resume_tailor import ResumeTailor
 from human_emulator import HumanEmulator
 from database_manager import ApplicationDatabase
+from exporters import EXPORT_FORMATS, stream_export
+from io_executor import IOExecutor
+from job_dedup import JobDedupIndex
+from match_scorer import MatchScorer
+from pulse_broadcaster import PulseBroadcaster
+from structured_output import MalformedOutputError
+from submission_queue import STATES, SubmissionQueue
 from stealth_applicant import StealthJobApplicant
 
 
@@ -34,10 +41,19 @@ app.add_middleware(
 resume_tailor = ResumeTailor()
 human_emulator = HumanEmulator()
 db = ApplicationDatabase()
+job_index = JobDedupIndex()
+
+# One publisher shared by every /ws/pulse connection
+pulse = PulseBroadcaster(human_emulator.get_pulse_status)
+
+# Database calls and file I/O run here, never on the event loop thread
+io_executor = IOExecutor()
 applicant: Optional[StealthJobApplicant] = None
+submission_queue: Optional[SubmissionQueue] = None
 
 # Store master resume in memory
 master_resume: Optional[Dict] = None
+match_scorer: Optional[MatchScorer] = None
 
 
 # ============================================================================
@@ -65,6 +81,31 @@ class ApplicationRequest(BaseModel):
     auto_submit: bool = False
 
 
+class JobRankRequest(BaseModel):
+    jobs: List[JobData]
+    top_k: Optional[int] = Field(None, ge=1)
+    min_match: int = Field(0, ge=0, le=100)
+
+
+class ApplicationRecord(BaseModel):
+    company: str
+    job_title: str
+    job_url: str
+    location: Optional[str] = ""
+    resume_version: str
+    resume_path: str
+    cover_letter_used: bool = False
+    tailoring_score: int = 0
+    key_matches: List[str] = []
+    notes: Optional[str] = ""
+
+
+class StatusUpdate(BaseModel):
+    app_id: str
+    status: str
+    notes: Optional[str] = None
+
+
 class PulseStatus(BaseModel):
     status: str
     cooldown_remaining: int
@@ -82,6 +123,7 @@ class ApplicationResult(BaseModel):
     resume_path: str
     cover_letter: str
     tailoring_score: int
+    submission_id: Optional[int] = None
 
 
 # ============================================================================
@@ -90,18 +132,34 @@ class ApplicationResult(BaseModel):
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize browser automation on startup."""
-    global applicant
+    """Initialize browser automation and resume queued submissions on startup."""
+    global applicant, submission_queue
     applicant = StealthJobApplicant(headless=False)
     await applicant.initialize()
     print("✅ Browser automation initialized")
+    
+    submission_queue = SubmissionQueue.from_env(
+        submit_to_browser,
+        on_status=db.update_status,
+        executor=io_executor,
+        # Retries and queued jobs obey the same pacing as the request path
+        pacer=human_emulator.can_proceed
+    )
+    await submission_queue.start()
+    pulse.start()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Clean up browser on shutdown."""
+    await pulse.stop()
+    if submission_queue:
+        await submission_queue.stop()
     if applicant:
         await applicant.close()
+    await resume_tailor.transport.close()
+    io_executor.shutdown()
+    db.close()
     print("✅ Browser closed")
 
 
@@ -118,16 +176,13 @@ async def root():
 @app.post("/api/master-resume")
 async def upload_master_resume(data: MasterResumeData):
     """Upload or update master resume."""
-    global master_resume
+    global master_resume, match_scorer
     
     master_resume = data.dict()
+    match_scorer = MatchScorer(master_resume)
     
     # Save to disk
-    resume_path = Path("resumes/master/master_resume.json")
-    resume_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(resume_path, 'w') as f:
-        json.dump(master_resume, f, indent=2)
+    await io_executor.write_json(Path("resumes/master/master_resume.json"), master_resume)
     
     return {
         "message": "Master resume uploaded successfully",
@@ -142,8 +197,7 @@ async def get_master_resume():
         # Try to load from disk
         resume_path = Path("resumes/master/master_resume.json")
         if resume_path.exists():
-            with open(resume_path, 'r') as f:
-                return json.load(f)
+            return await io_executor.read_json(resume_path)
         raise HTTPException(status_code=404, detail="Master resume not found")
     
     return master_resume
@@ -160,65 +214,329 @@ async def get_pulse_status():
 async def reset_batch():
     """Reset batch counter after human approval."""
     human_emulator.reset_batch()
+    pulse.notify()
+    if submission_queue:
+        submission_queue.wake()
     return {"message": "Batch reset successfully"}
 
 
 @app.post("/api/tailor-resume")
-async def tailor_resume(job: JobData):
+async def tailor_resume(job: JobData, grounded_cover_letter: bool = False, dedupe: bool = True):
     """
     Tailor resume for a specific job.
     Returns tailored resume and cover letter.
+    
+    The cover letter is generated in parallel with tailoring; pass
+    grounded_cover_letter=true to have it written from the tailored
+    bullets instead (sequential, slower).
+    
+    A near-duplicate of an already tailored posting (the same role
+    reposted on another board) reuses that tailored version and only
+    writes a new cover letter; the response then carries `duplicate_of`.
+    Pass dedupe=false to force a fresh tailoring.
+    """
+    if not master_resume:
+        raise HTTPException(status_code=400, detail="Master resume not uploaded")
+    
+    job_dict = job.dict()
+    duplicate = await io_executor.run(
+        job_index.query, job_dict, exclude=resume_tailor.generate_job_hash(job_dict)
+    ) if dedupe else None
+    reusable = await io_executor.run(load_tailored_version, duplicate['job_hash']) if duplicate else None
+    if reusable:
+        version_id, output_path, tailored = reusable
+        cover_letter = await resume_tailor.generate_cover_letter_async(tailored, job_dict)
+        return {
+            "tailored_resume": tailored,
+            "cover_letter": cover_letter,
+            "validation": resume_tailor.validate_truthfulness(master_resume, tailored),
+            "version_id": version_id,
+            "file_path": str(output_path),
+            "duplicate_of": duplicate
+        }
+    
+    # Tailor resume and generate cover letter (awaited so the event loop keeps serving)
+    try:
+        tailored, cover_letter = await resume_tailor.tailor_with_cover_letter(
+            master_resume,
+            job.dict(),
+            grounded=grounded_cover_letter
+        )
+    except MalformedOutputError as e:
+        raise HTTPException(status_code=502, detail=f"Model output unusable after retry: {e}")
+    
+    # Deterministic fabrication check against the master resume
+    validation = resume_tailor.validate_truthfulness(master_resume, tailored)
+    version_id, output_path = await save_tailored_version(job.dict(), tailored)
+    
+    return {
+        "tailored_resume": tailored,
+        "cover_letter": cover_letter,
+        "validation": validation,
+        "version_id": version_id,
+        "file_path": str(output_path)
+    }
+
+
+@app.post("/api/tailor-resume/stream")
+async def tailor_resume_stream(job: JobData):
+    """
+    Streaming variant of /api/tailor-resume (Server-Sent Events).
+    
+    Emits a `role` event per tailored experience entry as soon as the
+    model has finished writing it, a `cover_letter` event, and a closing
+    `metadata` event with skills, alignment score, the fabrication check
+    and the saved version.
+    Failures are reported as an `error` event.
     """
     if not master_resume:
         raise HTTPException(status_code=400, detail="Master resume not uploaded")
     
-    # Tailor resume
-    tailored = resume_tailor.tailor_resume(
-        master_resume,
-        job.dict()
+    job_data = job.dict()
+    
+    async def events():
+        # The letter is written from the master experience, so it can run alongside
+        cover_letter = asyncio.ensure_future(resume_tailor.generate_cover_letter_async(master_resume, job_data))
+        
+        try:
+            async for event in resume_tailor.tailor_resume_stream(master_resume, job_data):
+                if event['type'] == 'role':
+                    yield sse_event('role', {'index': event['index'], **event['role']})
+                    continue
+                
+                tailored = event['tailored_resume']
+                yield sse_event('cover_letter', {'cover_letter': await cover_letter})
+                
+                validation = resume_tailor.validate_truthfulness(master_resume, tailored)
+                version_id, output_path = await save_tailored_version(job_data, tailored)
+                yield sse_event('metadata', {
+                    'tailored_skills': tailored['tailored_skills'],
+                    'metadata': tailored['metadata'],
+                    'validation': validation,
+                    'version_id': version_id,
+                    'file_path': str(output_path)
+                })
+        except Exception as e:
+            yield sse_event('error', {'error': f"{type(e).__name__}: {e}"})
+        finally:
+            cover_letter.cancel()
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
     )
+
+
+def sse_event(event: str, data: Dict) -> str:
+    """One Server-Sent Events frame."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@app.post("/api/jobs/rank")
+async def rank_jobs(request: JobRankRequest):
+    """
+    Score jobs against the master resume locally (no LLM call).
+    Returns them best-first with a 0-100 match, filtered by min_match / top_k.
+    """
+    if not master_resume:
+        raise HTTPException(status_code=400, detail="Master resume not uploaded")
     
-    # Generate cover letter
-    cover_letter = resume_tailor.generate_cover_letter(
-        tailored,
-        job.dict()
+    ranked = match_scorer.rank(
+        [job.dict() for job in request.jobs],
+        top_k=request.top_k,
+        min_match=request.min_match
     )
     
-    # Save tailored version
-    job_hash = resume_tailor.generate_job_hash(job.dict())
-    output_path = Path(f"resumes/tailored/resume_{job.company}_{job_hash}.json")
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    return {"ranked": ranked, "total": len(request.jobs), "kept": len(ranked)}
+
+
+@app.post("/api/tailor-resume/bulk")
+async def tailor_resume_bulk(
+    jobs: List[JobData],
+    top_k: Optional[int] = Query(None, ge=1),
+    min_match: int = Query(0, ge=0, le=100)
+):
+    """
+    Tailor many jobs in one request.
+    Streams NDJSON: one line per job as it completes (result or error),
+    then a summary line with throughput in jobs per minute.
+    
+    With top_k / min_match, jobs are pre-ranked by the local match scorer
+    and only the best ones are sent to the model. Event indexes always
+    refer to positions in the submitted list.
+    
+    Near-duplicates are not tailored: a repost of an already tailored
+    job yields a `duplicate` event with the existing version, and a
+    repeat within the batch yields one pointing at `duplicate_of_index`.
+    """
+    if not master_resume:
+        raise HTTPException(status_code=400, detail="Master resume not uploaded")
+    
+    job_dicts = [job.dict() for job in jobs]
+    selected = list(range(len(job_dicts)))
+    if top_k is not None or min_match:
+        selected = [r['index'] for r in match_scorer.rank(job_dicts, top_k=top_k, min_match=min_match)]
+    
+    selected, duplicates = await io_executor.run(split_duplicates, job_dicts, selected)
+    
+    async def events():
+        for event in duplicates:
+            yield json.dumps(event) + "\n"
+        
+        async for event in resume_tailor.tailor_bulk(master_resume, [job_dicts[i] for i in selected]):
+            if event['type'] == 'summary':
+                event['skipped'] = len(job_dicts) - len(selected) - len(duplicates)
+                event['duplicates'] = len(duplicates)
+            else:
+                event['index'] = selected[event['index']]
+            if event['type'] == 'result':
+                tailored = event.pop('tailored_resume')
+                validation = resume_tailor.validate_truthfulness(master_resume, tailored)
+                version_id, output_path = await save_tailored_version(job_dicts[event['index']], tailored)
+                event.update({
+                    'version_id': version_id,
+                    'file_path': str(output_path),
+                    'cache_hit': tailored['metadata']['cache_hit'],
+                    'validation_passed': validation['passed'],
+                    'warnings': validation['warnings']
+                })
+            yield json.dumps(event) + "\n"
+    
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
+def split_duplicates(job_dicts: List[Dict], selected: List[int]):
+    """
+    Separate near-duplicates out of a batch: (indexes still to tailor,
+    duplicate events). A job matching an already tailored posting
+    reuses its version; a job matching an earlier one in the batch is
+    suppressed. Blocking (signatures, DB lookups, file reads): run it on
+    the I/O executor.
+    """
+    
+    batch = JobDedupIndex(path=None, threshold=job_index.threshold)
+    remaining, duplicates = [], []
+    
+    for i in selected:
+        job = job_dicts[i]
+        signature = job_index.signature(job)
+        event = {'index': i, 'company': job['company'], 'title': job['title'], 'type': 'duplicate'}
+        
+        duplicate = job_index.query(job, signature, exclude=resume_tailor.generate_job_hash(job))
+        reusable = load_tailored_version(duplicate['job_hash']) if duplicate else None
+        if reusable:
+            version_id, output_path, _ = reusable
+            event.update({'duplicate_of': duplicate, 'version_id': version_id, 'file_path': str(output_path)})
+            duplicates.append(event)
+            continue
+        
+        earlier = batch.query(job, signature)
+        if earlier:
+            event.update({'duplicate_of_index': int(earlier['job_hash']), 'similarity': earlier['similarity']})
+            duplicates.append(event)
+            continue
+        
+        batch.add(str(i), job, signature)
+        remaining.append(i)
+    
+    return remaining, duplicates
+
+
+def load_tailored_version(job_hash: str):
+    """
+    (version_id, path, tailored resume) for a job hash, if it was
+    tailored from the current master. Blocking: run it on the I/O executor.
+    """
+    
+    version = db.get_resume_version_by_hash(job_hash)
+    if not version or str(version['Base_Resume']) != str(master_resume['version']):
+        return None
+    
+    output_path = Path(version['File_Path'])
+    try:
+        with open(output_path, 'r') as f:
+            return version['Version_ID'], output_path, json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+async def save_tailored_version(job: Dict, tailored: Dict):
+    """Write a tailored resume to disk and record it as a resume version."""
     
-    with open(output_path, 'w') as f:
-        json.dump(tailored, f, indent=2)
+    # Save tailored version
+    job_hash = resume_tailor.generate_job_hash(job)
+    output_path = Path(f"resumes/tailored/resume_{job['company']}_{job_hash}.json")
+    await io_executor.write_json(output_path, tailored)
     
     # Track in database
-    version_id = db.add_resume_version({
+    version_id = await io_executor.run(db.add_resume_version, {
         'job_hash': job_hash,
         'base_resume': master_resume['version'],
-        'company': job.company,
-        'title': job.title,
+        'company': job['company'],
+        'title': job['title'],
         'file_path': str(output_path)
     })
     
+    # Later reposts of this job can reuse the version
+    await io_executor.run(job_index.add, job_hash, job)
+    
+    return version_id, output_path
+
+
+@app.get("/api/tailor-resume/cache")
+async def get_tailoring_cache_stats():
+    """Hit/miss counters for the tailoring cache, the bullet rewrite cache and the near-duplicate job index."""
     return {
-        "tailored_resume": tailored,
-        "cover_letter": cover_letter,
-        "version_id": version_id,
-        "file_path": str(output_path)
+        **resume_tailor.cache.stats(),
+        'bullets': resume_tailor.bullet_cache.stats(),
+        'jobs': job_index.stats()
     }
 
 
+@app.get("/api/tailor-resume/usage")
+async def get_tailoring_token_usage():
+    """Per-call and total model token counts, prompt-cache reads and output failure counts."""
+    return resume_tailor.usage_stats()
+
+
+@app.get("/api/metrics", response_class=PlainTextResponse)
+async def get_llm_metrics():
+    """Model call latency quantiles, tokens, cost, cache hits and retries in Prometheus text format."""
+    return PlainTextResponse(resume_tailor.metrics.prometheus(), media_type="text/plain; version=0.0.4")
+
+
+@app.get("/api/metrics/summary")
+async def get_llm_metrics_summary():
+    """
+    JSON view of the model call metrics: per-endpoint totals and
+    p50/p95/p99 latency, plus the most expensive recent calls with
+    the job hash that caused each.
+    """
+    return resume_tailor.metrics.summary()
+
+
 @app.post("/api/submit-application", response_model=ApplicationResult)
-async def submit_application(
-    request: ApplicationRequest,
-    background_tasks: BackgroundTasks
-):
+async def submit_application(request: ApplicationRequest):
     """
     Submit job application.
-    Can run in background if auto_submit is True.
+    With auto_submit, browser submission is put on the persistent
+    submission queue and the application's Status follows the job
+    (Queued, Submitting, Applied or Submission Failed).
+    
+    Tailorings that fail the fabrication check are never auto-submitted;
+    they are recorded with Status 'Needs Review' and come back as
+    'needs_review'. A near-duplicate of a job that was
+    already applied to is rejected with 409 before any quota is used.
     """
     
+    duplicate = await io_executor.run(job_index.query, request.job.dict(), require='application_id')
+    if duplicate:
+        raise HTTPException(status_code=409, detail={
+            'message': "Near-duplicate of a job already applied to",
+            'duplicate_of': duplicate
+        })
+    
     # Check if we can proceed
     can_proceed, reason = human_emulator.can_proceed()
     if not can_proceed:
@@ -226,9 +544,14 @@ async def submit_application(
     
     # First tailor the resume
     tailored_response = await tailor_resume(request.job)
+    validation = tailored_response['validation']
+    
+    # A real score of 0 is kept; only a missing/invalid score falls back
+    alignment_score = tailored_response['tailored_resume']['metadata'].get('alignment_score')
+    tailoring_score = 85 if alignment_score is None else alignment_score
     
     # Create application record
-    app_id = db.add_application({
+    app_id = await io_executor.run(db.add_application, {
         'company': request.job.company,
         'job_title': request.job.title,
         'job_url': request.job.url,
@@ -236,28 +559,52 @@ async def submit_application(
         'resume_version': tailored_response['version_id'],
         'resume_path': tailored_response['file_path'],
         'cover_letter_used': True,
-        'tailoring_score': tailored_response['tailored_resume']['metadata'].get('alignment_score', 85),
+        'tailoring_score': tailoring_score,
         'key_matches': tailored_response['tailored_resume']['metadata'].get('key_matches', []),
-        'notes': f"Auto-submitted via StreamlineRemote"
+        'notes': (
+            f"Auto-submitted via StreamlineRemote" if validation['passed']
+            else "Needs review: " + "; ".join(validation['warnings'])
+        ),
+        'status': 'Applied' if validation['passed'] else 'Needs Review'
     })
     
-    if request.auto_submit:
-        # Submit in background
-        background_tasks.add_task(
-            submit_application_async,
-            request.job.dict(),
-            tailored_response['file_path'],
-            tailored_response['cover_letter']
+    # Only a job that is actually going out blocks later near-duplicates
+    if validation['passed']:
+        await io_executor.run(
+            job_index.mark_applied,
+            (tailored_response.get('duplicate_of') or {}).get('job_hash') or resume_tailor.generate_job_hash(request.job.dict()),
+            app_id
         )
+    
+    if not validation['passed']:
+        return ApplicationResult(
+            application_id=app_id,
+            company=request.job.company,
+            job_title=request.job.title,
+            status='needs_review',
+            resume_path=tailored_response['file_path'],
+            cover_letter=tailored_response['cover_letter'],
+            tailoring_score=tailoring_score
+        )
+    
+    if request.auto_submit:
+        # Survives restarts; retried with backoff by the queue workers
+        submission_id = await submission_queue.enqueue(app_id, {
+            'job_data': request.job.dict(),
+            'resume_path': tailored_response['file_path'],
+            'cover_letter': tailored_response['cover_letter']
+        })
+        pulse.notify()
         
         return ApplicationResult(
             application_id=app_id,
             company=request.job.company,
             job_title=request.job.title,
-            status='submitting',
+            status='queued',
             resume_path=tailored_response['file_path'],
             cover_letter=tailored_response['cover_letter'],
-            tailoring_score=tailored_response['tailored_resume']['metadata'].get('alignment_score', 85)
+            tailoring_score=tailoring_score,
+            submission_id=submission_id
         )
     
     return ApplicationResult(
@@ -267,45 +614,103 @@ async def submit_application(
         status='ready',
         resume_path=tailored_response['file_path'],
         cover_letter=tailored_response['cover_letter'],
-        tailoring_score=tailored_response['tailored_resume']['metadata'].get('alignment_score', 85)
+        tailoring_score=tailoring_score
     )
 
 
-async def submit_application_async(job_data: Dict, resume_path: str, cover_letter: str):
-    """Background task for submitting application."""
+async def submit_to_browser(job_data: Dict, resume_path: str, cover_letter: str) -> bool:
+    """Submission queue handler: one browser submission attempt."""
+    if applicant is None:
+        raise RuntimeError("Browser automation not initialized")
+    
     try:
         success = await applicant.apply_to_job(
             job_data,
             resume_path,
             cover_letter
         )
-        
-        # Update database
-        if success:
-            print(f"✅ Successfully applied to {job_data['company']}")
-        else:
-            print(f"❌ Failed to apply to {job_data['company']}")
-            
-    except Exception as e:
-        print(f"Error in background submission: {str(e)}")
-
-
-@app.get("/api/applications")
-async def get_applications(status: Optional[str] = None, limit: int = 50):
-    """Get list of applications with optional status filter."""
+    finally:
+        pulse.notify()
     
-    if status:
-        apps = db.get_applications_by_status(status)
+    if success:
+        print(f"✅ Successfully applied to {job_data['company']}")
     else:
-        apps = db.df.head(limit)
+        print(f"❌ Failed to apply to {job_data['company']}")
     
-    return apps.to_dict(orient='records')
+    return success
+
+
+@app.get("/api/submissions/queue")
+async def get_submission_queue_stats():
+    """Submission queue depth per state, worker count and recent throughput."""
+    return await submission_queue.stats()
+
+
+@app.post("/api/submissions/workers")
+async def set_submission_workers(count: int = Query(..., ge=0, le=16)):
+    """Resize the submission worker pool while running (0 pauses submissions)."""
+    submission_queue.set_workers(count)
+    return await submission_queue.stats()
+
+
+@app.get("/api/submissions")
+async def get_submissions(state: Optional[str] = None, limit: int = Query(50, ge=1, le=500)):
+    """Most recent submission jobs, optionally filtered by state."""
+    if state is not None and state not in STATES:
+        raise HTTPException(status_code=400, detail=f"Unknown state: {state}")
+    return {"jobs": await submission_queue.jobs(state, limit)}
+
+
+@app.get("/api/submissions/{submission_id}")
+async def get_submission(submission_id: int):
+    """One submission job: state, attempts, next retry time and last error."""
+    job = await submission_queue.get(submission_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Submission not found")
+    return job
+
+
+@app.get("/api/applications")
+async def get_applications(
+    status: Optional[str] = None,
+    company: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    min_score: Optional[int] = None,
+    max_score: Optional[int] = None,
+    source: Optional[str] = None,
+    sort_by: str = 'Date_Applied',
+    order: str = 'desc',
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500)
+):
+    """
+    Get a page of applications, filtered and sorted server-side.
+    Pass the returned next_cursor to fetch the following page.
+    """
+    try:
+        return await io_executor.run(
+            db.query_applications,
+            sort_by=sort_by,
+            order=order,
+            cursor=cursor,
+            limit=limit,
+            status=status,
+            company=company,
+            date_from=date_from,
+            date_to=date_to,
+            min_score=min_score,
+            max_score=max_score,
+            source=source
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @app.get("/api/statistics")
 async def get_statistics():
     """Get application statistics."""
-    return db.get_summary_stats()
+    return await io_executor.run(db.get_summary_stats)
 
 
 @app.post("/api/applications/{app_id}/status")
@@ -315,24 +720,45 @@ async def update_application_status(
     notes: Optional[str] = None
 ):
     """Update application status."""
-    db.update_status(app_id, status, notes or "")
+    try:
+        await io_executor.run(db.update_status, app_id, status, notes or "")
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Application not found")
     return {"message": f"Status updated to {status}"}
 
 
+@app.post("/api/applications/batch")
+async def add_applications_batch(records: List[ApplicationRecord]):
+    """Record many applications with a single database write."""
+    app_ids = await io_executor.run(db.add_applications, [record.dict() for record in records])
+    return {"application_ids": app_ids, "count": len(app_ids)}
+
+
+@app.post("/api/applications/status/batch")
+async def update_application_statuses(updates: List[StatusUpdate]):
+    """Apply many status updates with a single database write."""
+    updated = await io_executor.run(db.update_statuses, [update.dict() for update in updates])
+    
+    requested = {update.app_id for update in updates}
+    return {
+        "updated": updated,
+        "not_found": sorted(requested - set(updated))
+    }
+
+
 @app.get("/api/resume/{version_id}")
 async def get_resume_version(version_id: str):
     """Download specific resume version."""
     
     # Find resume in database
-    versions_df = pd.read_excel(db.db_path, sheet_name='Resume_Versions')
-    version = versions_df[versions_df['Version_ID'] == version_id]
+    version = await io_executor.run(db.get_resume_version, version_id)
     
-    if version.empty:
+    if version is None:
         raise HTTPException(status_code=404, detail="Resume version not found")
     
-    file_path = Path(version.iloc[0]['File_Path'])
+    file_path = Path(version['File_Path'])
     
-    if not file_path.exists():
+    if not await io_executor.run(file_path.exists):
         raise HTTPException(status_code=404, detail="Resume file not found")
     
     return FileResponse(
@@ -342,20 +768,81 @@ async def get_resume_version(version_id: str):
     )
 
 
+@app.get("/api/applications/export")
+async def export_applications(
+    format: str = 'csv',
+    status: Optional[str] = None,
+    company: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    min_score: Optional[int] = None,
+    max_score: Optional[int] = None,
+    source: Optional[str] = None
+):
+    """
+    Stream applications as CSV, XLSX or Parquet.
+    Accepts the same filters as /api/applications; rows are written in chunks.
+    """
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unsupported format: {format}")
+    
+    if format == 'parquet':
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise HTTPException(status_code=501, detail="Parquet export requires pyarrow")
+    
+    # Filters are validated and matched before the response starts, so bad values get a 400
+    try:
+        chunks = await io_executor.run(
+            db.iter_applications,
+            status=status,
+            company=company,
+            date_from=date_from,
+            date_to=date_to,
+            min_score=min_score,
+            max_score=max_score,
+            source=source
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    media_type, extension = EXPORT_FORMATS[format]
+    
+    return StreamingResponse(
+        stream_export(format, chunks),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="job_applications.{extension}"'}
+    )
+
+
+@app.get("/api/applications/report")
+async def download_applications_report():
+    """Generate and download the formatted applications workbook."""
+    report_path = await io_executor.run(db.export_excel)
+    
+    return FileResponse(
+        report_path,
+        media_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        filename=report_path.name
+    )
+
+
 @app.post("/api/health-check")
 async def health_check():
     """Check system health and browser status."""
     
     browser_status = "connected" if applicant and applicant.browser else "disconnected"
+    emulator_status = pulse.current()
     
     return {
         "api": "healthy",
         "browser": browser_status,
         "database": "connected",
         "emulator": {
-            "status": human_emulator.get_pulse_status()['status'],
-            "health_score": human_emulator.get_pulse_status()['health_score']
-        }
+            "status": emulator_status['status'],
+            "health_score": emulator_status['health_score']
+        },
+        "pulse": pulse.stats()
     }
 
 
@@ -363,22 +850,31 @@ async def health_check():
 # WebSocket for Real-time Updates (Optional Enhancement)
 # ============================================================================
 
-from fastapi import WebSocket
-
 @app.websocket("/ws/pulse")
 async def websocket_pulse(websocket: WebSocket):
-    """WebSocket endpoint for real-time pulse status updates."""
+    """
+    WebSocket endpoint for real-time pulse status updates.
+    
+    Sends {"type": "snapshot", "data": {...}} on connect, then
+    {"type": "diff", "changes": {...}} with only the fields that changed.
+    Clients that fall too far behind are closed with code 1013 (try again later).
+    """
     await websocket.accept()
+    subscriber = pulse.subscribe()
     
     try:
         while True:
-            status = human_emulator.get_pulse_status()
-            await websocket.send_json(status)
-            await asyncio.sleep(2)  # Update every 2 seconds
+            message = await subscriber.get()
+            if message is None:
+                await websocket.close(code=1013)
+                break
+            await websocket.send_text(message)
+    except WebSocketDisconnect:
+        pass
     except Exception as e:
         print(f"WebSocket error: {str(e)}")
     finally:
-        await websocket.close()
+        pulse.unsubscribe(subscriber)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,87 @@
+"""
+Benchmark: bulk tailoring throughput (jobs/minute) against the local fake model
+Run from backend/:  python benchmarks/bench_bulk_tailoring.py
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from llm_transport import FakeTransport
+from resume_tailor import ResumeTailor
+from tailoring_cache import TailoringCache
+
+
+JOBS = 50
+LATENCY = 0.2  # seconds per fake model call
+CONCURRENCY = [1, 4, 16]
+
+MASTER = {
+    "version": "1.0",
+    "experience": [{
+        "company": "Tech Corp",
+        "title": "Software Engineer",
+        "duration": "2022 - Present",
+        "bullets": ["Built scalable microservices handling 1M+ daily requests using Python and FastAPI"]
+    }],
+    "skills": {"technical": ["Python", "FastAPI"], "tools": ["Git", "AWS"], "soft_skills": []}
+}
+
+
+def build_jobs(count: int):
+    return [{
+        'company': f"Company {i}",
+        'title': 'Backend Engineer',
+        'jd': f"Posting {i}: Python, APIs, CI/CD.",
+        'key_requirements': ['Python', 'API Development']
+    } for i in range(count)]
+
+
+def make_tailor(concurrency: int, failure_rate: float = 0.0) -> ResumeTailor:
+    return ResumeTailor(
+        api_key="benchmark",
+        cache=TailoringCache(cache_dir=None),
+        max_concurrency=concurrency,
+        transport=FakeTransport(latency=LATENCY, jitter=LATENCY / 4, failure_rate=failure_rate)
+    )
+
+
+async def sequential(jobs) -> float:
+    tailor = make_tailor(1)
+    start = time.perf_counter()
+    for job in jobs:
+        await tailor.tailor_resume_async(MASTER, job)
+    return len(jobs) / (time.perf_counter() - start) * 60
+
+
+async def bulk(jobs, concurrency: int, failure_rate: float = 0.0) -> dict:
+    tailor = make_tailor(concurrency, failure_rate)
+    async for event in tailor.tailor_bulk(MASTER, jobs):
+        if event['type'] == 'summary':
+            event['peak_in_flight'] = tailor.transport.peak_in_flight
+            return event
+
+
+async def main():
+    jobs = build_jobs(JOBS)
+
+    print(f"{JOBS} jobs, fake model latency {LATENCY * 1000:.0f} ms")
+    print(f"{'mode':>18} | {'jobs/min':>9} | {'peak in flight':>14} | {'failed':>6}")
+    print('-' * 58)
+    print(f"{'sequential':>18} | {await sequential(jobs):>9.1f} | {1:>14} | {0:>6}")
+
+    for concurrency in CONCURRENCY:
+        summary = await bulk(jobs, concurrency)
+        print(f"{f'bulk x{concurrency}':>18} | {summary['jobs_per_minute']:>9.1f} | "
+              f"{summary['peak_in_flight']:>14} | {summary['failed']:>6}")
+
+    summary = await bulk(jobs, CONCURRENCY[-1], failure_rate=0.1)
+    print(f"{'bulk x16, 10% err':>18} | {summary['jobs_per_minute']:>9.1f} | "
+          f"{summary['peak_in_flight']:>14} | {summary['failed']:>6}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
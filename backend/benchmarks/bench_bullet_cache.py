@@ -0,0 +1,113 @@
+"""
+Benchmark: output tokens per tailoring with and without the bullet rewrite cache
+Run from backend/:  python benchmarks/bench_bullet_cache.py
+"""
+
+import asyncio
+import json
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from llm_transport import FakeTransport
+from resume_tailor import ResumeTailor
+from structured_output import BULLET_REWRITE_TOOL_NAME
+from tailoring_cache import BulletCache, TailoringCache
+
+
+JOBS = 30
+CLUSTERS = [
+    ["Python", "API Integration"],
+    ["Client Onboarding", "API Integration"],
+    ["Python", "CI/CD", "AWS"]
+]
+
+MASTER = {
+    "version": "1.0",
+    "experience": [{
+        "company": f"Company {i}",
+        "title": "Senior Software Engineer",
+        "duration": f"{2014 + 2 * i} - {2016 + 2 * i}",
+        "bullets": [
+            f"Built scalable microservices handling {i + 1}M+ daily requests using Python and FastAPI",
+            f"Reduced deployment time by {30 + i * 5}% by implementing CI/CD pipelines with GitHub Actions",
+            "Onboarded enterprise clients onto REST API integrations with payment providers",
+            "Migrated a monolithic Django application to containerized services on AWS ECS"
+        ]
+    } for i in range(4)],
+    "skills": {
+        "technical": ["Python", "FastAPI", "Django", "PostgreSQL"],
+        "tools": ["Git", "Docker", "AWS", "GitHub Actions"],
+        "soft_skills": ["Client Communication", "Mentoring"]
+    }
+}
+
+PENDING_LINE = re.compile(r"^\[(r\d+b\d+)\] (.*)$", re.MULTILINE)
+
+
+def rewrite(bullet: str) -> str:
+    return f"Delivered: {bullet[0].lower()}{bullet[1:]} (aligned with the role's priorities)"
+
+
+def fake_model(request) -> str:
+    """Rewrites whatever it is asked to, so output size tracks the work requested."""
+
+    if request["max_tokens"] < 1000:
+        return "Hi there."
+
+    common = {"skills": MASTER["skills"], "alignment_score": 80, "key_matches": ["Python"]}
+    if request["tool_choice"]["name"] == BULLET_REWRITE_TOOL_NAME:
+        pending = PENDING_LINE.findall(request["messages"][0]["content"])
+        return json.dumps({"rewrites": [{"id": i, "bullet": rewrite(b)} for i, b in pending], **common})
+
+    return json.dumps({
+        "experience": [{**role, "bullets": [rewrite(b) for b in role["bullets"]]} for role in MASTER["experience"]],
+        **common
+    })
+
+
+def build_jobs(count: int):
+    return [{
+        'company': f"Startup {i}",
+        'title': 'Integration Engineer',
+        'jd': f"Posting {i}: " + ', '.join(CLUSTERS[i % len(CLUSTERS)]),
+        'key_requirements': CLUSTERS[i % len(CLUSTERS)]
+    } for i in range(count)]
+
+
+async def run(jobs, use_bullet_cache: bool) -> dict:
+    tailor = ResumeTailor(
+        api_key="benchmark",
+        cache=TailoringCache(cache_dir=None),
+        transport=FakeTransport(latency=0, reply=fake_model),
+        bullet_cache=BulletCache(path=None, max_entries=20000 if use_bullet_cache else 0)
+    )
+    for job in jobs:
+        await tailor.tailor_resume_async(MASTER, job)
+
+    outputs = [entry['output_tokens'] for entry in tailor.token_log]
+    return {
+        'first': sum(outputs[:len(CLUSTERS)]) / len(CLUSTERS),
+        'warm': sum(outputs[len(CLUSTERS):]) / (len(outputs) - len(CLUSTERS)),
+        'total': sum(outputs),
+        'bullets': tailor.bullet_cache.stats()
+    }
+
+
+async def main():
+    jobs = build_jobs(JOBS)
+    cold = await run(jobs, use_bullet_cache=False)
+    warm = await run(jobs, use_bullet_cache=True)
+
+    print(f"{JOBS} jobs over {len(CLUSTERS)} requirement clusters, 4 roles x 4 bullets")
+    print(f"{'':>20} | {'first/cluster':>13} | {'warm avg':>8} | {'total out':>9}")
+    print('-' * 60)
+    for name, result in (('no bullet cache', cold), ('bullet cache', warm)):
+        print(f"{name:>20} | {result['first']:>13.0f} | {result['warm']:>8.0f} | {result['total']:>9,}")
+    print(f"\nbullet cache: {warm['bullets']}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
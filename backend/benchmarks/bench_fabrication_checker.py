@@ -0,0 +1,67 @@
+"""
+Benchmark: fabrication checker recall on a seeded corpus, and time per resume
+Run from backend/:  python benchmarks/bench_fabrication_checker.py
+"""
+
+import copy
+import json
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fabrication_checker import FabricationChecker, summarize
+
+
+CORPUS = Path(__file__).resolve().parent / "fabrication_corpus.json"
+
+
+def apply_case(clean: dict, case: dict) -> dict:
+    """Seed one fabrication into a copy of the clean tailored resume."""
+
+    tailored = copy.deepcopy(clean)
+    for location, text in case.get('bullets', {}).items():
+        role, bullet = (int(i) for i in location.split('.'))
+        tailored['experience'][role]['bullets'][bullet] = text
+    for role, fields in case.get('role', {}).items():
+        tailored['experience'][int(role)].update(fields)
+    for role, text in case.get('add_bullet', {}).items():
+        tailored['experience'][int(role)]['bullets'].append(text)
+    tailored['skills'].update(case.get('skills', {}))
+    return tailored
+
+
+def main():
+    corpus = json.loads(CORPUS.read_text())
+    checker = FabricationChecker(corpus['master'])
+    clean = corpus['clean']
+
+    false_positives = checker.check(clean['experience'], clean['skills'])
+    print(f"clean resume: {len(false_positives)} issues {false_positives or ''}")
+
+    detected = 0
+    print(f"\n{'case':<28} | {'expected':<26} | {'found':<26} | ok")
+    print('-' * 90)
+    for case in corpus['cases']:
+        tailored = apply_case(clean, case)
+        found = sorted({issue['type'] for issue in checker.check(tailored['experience'], tailored['skills'])})
+        ok = set(case['expect']) <= set(found)
+        detected += ok
+        print(f"{case['name']:<28} | {','.join(case['expect']):<26} | {','.join(found):<26} | {'yes' if ok else 'NO'}")
+
+    print(f"\nrecall: {detected}/{len(corpus['cases'])}")
+
+    worst = apply_case(clean, corpus['cases'][-1])
+    number = 2000
+    check_us = min(timeit.repeat(
+        lambda: summarize(checker.check(worst['experience'], worst['skills'])), number=number, repeat=3
+    )) / number * 1e6
+    build_us = min(timeit.repeat(lambda: FabricationChecker(corpus['master']), number=200, repeat=3)) / 200 * 1e6
+
+    print(f"check + report: {check_us:.1f} µs/resume (budget 1000 µs)")
+    print(f"checker build (once per master resume): {build_us:.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Micro-benchmark: indexed lookups vs full-table scans in ApplicationDatabase
+Run from backend/:  python benchmarks/bench_index_lookup.py
+"""
+
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from database_manager import ApplicationDatabase
+from storage_backends import APPLICATION_COLUMNS
+
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+FLAT_TOLERANCE = 1.5
+STATUSES = ['Applied'] * 90 + ['Rejected'] * 8 + ['Interview'] * 2
+
+
+def build_frame(rows: int) -> pd.DataFrame:
+    """Synthetic applications table with a realistic status mix."""
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame({col: [''] * rows for col in APPLICATION_COLUMNS})
+    df['Application_ID'] = [f"APP_20250101_{i:07d}" for i in range(rows)]
+    df['Company'] = [f"Company {i}" for i in rng.integers(0, rows // 10 + 1, rows)]
+    df['Status'] = rng.choice(STATUSES, rows)
+    # Keep the selective filter at a fixed size so only table growth varies
+    df.loc[:, 'Status'] = df['Status'].where(df['Status'] != 'Interview', 'Rejected')
+    df.loc[rng.choice(rows, 20, replace=False), 'Status'] = 'Interview'
+    df['Tailoring_Score'] = rng.integers(50, 100, rows)
+    return df
+
+
+def time_us(stmt, number: int = 200) -> float:
+    return min(timeit.repeat(stmt, number=number, repeat=3)) / number * 1e6
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        db = ApplicationDatabase(Path(tmp) / "applications.xlsx", backend='sqlite')
+        db.logger.setLevel('WARNING')
+
+        print(f"{'rows':>10} | {'id scan':>10} | {'id cold':>10} | {'id index':>10} | "
+              f"{'status scan':>12} | {'status index':>12}   (µs/op)")
+        print('-' * 83)
+
+        status_times = []
+        for rows in SIZES:
+            db.df = build_frame(rows)
+            target = f"APP_20250101_{rows // 2:07d}"
+            df = db.df
+
+            id_scan = time_us(lambda: df[df['Application_ID'] == target].iloc[0].to_dict(), number=20)
+            id_cold = time_us(lambda: (db._row_cache.clear(), db.get_application(target)))
+            id_index = time_us(lambda: db.get_application(target))
+            status_scan = time_us(lambda: df[df['Status'] == 'Interview'], number=20)
+            status_index = time_us(lambda: db.get_applications_by_status('Interview'))
+
+            status_times.append(status_index)
+
+            print(f"{rows:>10,} | {id_scan:>10.1f} | {id_cold:>10.1f} | {id_index:>10.1f} | "
+                  f"{status_scan:>12.1f} | {status_index:>12.1f}")
+
+        db.close()
+
+    # The status index touches only the matching rows, so its cost must not track table size
+    growth = status_times[-1] / status_times[0]
+    print(f"\nstatus index {SIZES[0]:,} -> {SIZES[-1]:,} rows: {growth:.2f}x "
+          f"({'flat' if growth <= FLAT_TOLERANCE else 'NOT FLAT'}, tolerance {FLAT_TOLERANCE}x)")
+    if growth > FLAT_TOLERANCE:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark: event-loop responsiveness while handlers write to the database, inline vs. on the I/O executor
+Run from backend/:  python benchmarks/bench_io_offload.py
+"""
+
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from database_manager import ApplicationDatabase
+from io_executor import IOExecutor
+
+
+WRITES = 40
+CONCURRENCY = 8
+PROBE_INTERVAL = 0.005
+
+
+def application(i: int) -> dict:
+    return {
+        'company': f"Company {i}",
+        'job_title': 'Backend Engineer',
+        'job_url': f"https://example.com/jobs/{i}",
+        'location': 'Remote',
+        'resume_version': f"V_{i:08x}",
+        'resume_path': f"resumes/tailored/resume_{i}.json",
+        'cover_letter_used': True,
+        'tailoring_score': 80,
+        'key_matches': ['Python'],
+        'notes': ''
+    }
+
+
+async def probe(stop: asyncio.Event, lags: list):
+    """Stand-in for a health check / pulse tick: how late does a short sleep wake up?"""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append((time.perf_counter() - started - PROBE_INTERVAL) * 1000)
+
+
+async def run(backend: str, offload: bool) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        db = ApplicationDatabase(db_path=str(Path(tmp) / "applications.xlsx"), backend=backend)
+        io_executor = IOExecutor(max_workers=4)
+        slots = asyncio.Semaphore(CONCURRENCY)
+
+        async def handler(i: int):
+            async with slots:
+                if offload:
+                    await io_executor.run(db.add_application, application(i))
+                else:
+                    db.add_application(application(i))
+                    await asyncio.sleep(0)
+
+        stop, lags = asyncio.Event(), []
+        probe_task = asyncio.ensure_future(probe(stop, lags))
+        started = time.perf_counter()
+        await asyncio.gather(*(handler(i) for i in range(WRITES)))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await probe_task
+
+        io_executor.shutdown()
+        db.close()
+
+    lags.sort()
+    return {
+        'elapsed': elapsed,
+        'p50': statistics.median(lags),
+        'p99': lags[min(len(lags) - 1, int(0.99 * len(lags)))],
+        'max': lags[-1]
+    }
+
+
+async def main():
+    print(f"{WRITES} add_application calls, {CONCURRENCY} concurrent handlers; "
+          f"loop lag measured by a {PROBE_INTERVAL * 1000:.0f} ms probe")
+    print(f"{'backend':>8} | {'mode':>8} | {'total s':>7} | {'lag p50 ms':>10} | {'lag p99 ms':>10} | {'lag max ms':>10}")
+    print('-' * 70)
+    for backend in ('excel', 'sqlite'):
+        for offload in (False, True):
+            result = await run(backend, offload)
+            print(f"{backend:>8} | {'executor' if offload else 'inline':>8} | {result['elapsed']:>7.2f} | "
+                  f"{result['p50']:>10.2f} | {result['p99']:>10.2f} | {result['max']:>10.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
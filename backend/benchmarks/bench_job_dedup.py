@@ -0,0 +1,189 @@
+"""
+Benchmark: near-duplicate job detection (MinHash + LSH) vs. exact job hashes and brute-force comparison
+Run from backend/:  python benchmarks/bench_job_dedup.py
+"""
+
+import hashlib
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from job_dedup import JobDedupIndex
+from resume_tailor import ResumeTailor
+
+
+STORED = 5000
+REPOSTS = 300
+LOOKALIKES = 300
+
+SKILLS = ["Python", "Go", "Kubernetes", "AWS", "PostgreSQL", "React", "TypeScript", "Kafka", "Terraform",
+          "Django", "FastAPI", "GraphQL", "Redis", "Airflow", "Spark", "Snowflake", "dbt", "Docker"]
+DUTIES = ["design and build {s} services", "own the {s} platform end to end", "mentor engineers on {s}",
+          "improve reliability of our {s} stack", "partner with product on {s} features",
+          "migrate legacy systems to {s}", "write tests and documentation for {s} tooling",
+          "review code and drive {s} best practices", "scale {s} pipelines to millions of events"]
+TITLES = ["Backend Engineer", "Senior Software Engineer", "Data Engineer", "Platform Engineer",
+          "Full Stack Developer", "Integration Engineer", "Site Reliability Engineer"]
+ABOUT = ["We are a {adj} company building {product} for {customer}.",
+         "Our customers range from {customer} to {customer} across {region}.",
+         "You will join a {team} group of about {n} people spread over {m} time zones.",
+         "We value {value}, {value}, and {value}.",
+         "Engineers here own their services in production and take part in {oncall}.",
+         "Everyone gets {perk}, {perk} and {n} days of paid time off.",
+         "We hire people from every background and do not expect candidates to tick every box."]
+FILLERS = {
+    'adj': ["remote-first", "bootstrapped", "venture-backed", "employee-owned", "public", "mission-driven"],
+    'product': ["invoicing software", "logistics APIs", "clinical trial tooling", "a payroll platform",
+                "fraud detection", "developer tooling", "an analytics warehouse", "a hiring marketplace"],
+    'customer': ["two-person shops", "hospitals", "public companies", "freight brokers", "universities",
+                 "retailers", "banks", "game studios", "city governments"],
+    'region': ["North America", "Europe", "Latin America", "Asia Pacific", "forty countries"],
+    'team': ["product engineering", "infrastructure", "data platform", "payments", "growth"],
+    'value': ["clear writing", "small pull requests", "shipping behind feature flags", "blameless reviews",
+              "pairing", "async communication", "measuring outcomes", "customer empathy"],
+    'oncall': ["a light on-call rotation", "a follow-the-sun rotation", "a weekly support shift"],
+    'perk': ["a learning budget", "a home office stipend", "a wellness allowance", "a conference budget",
+             "a coworking membership", "parental leave"]
+}
+BOARD_HEADERS = ["About the job", "Job description", "Full job description", "Overview"]
+BOARD_FOOTERS = ["Apply via LinkedIn Easy Apply.", "Posted on Indeed. Salary estimate not provided.",
+                 "Visit our careers page to learn more about benefits.", ""]
+
+
+def make_job(rng: random.Random, i: int) -> dict:
+    company = f"Company {i % 1500}"
+    skills = rng.sample(SKILLS, 5)
+    sentences = [f"{company} is hiring a remote engineer to join a fast growing team."]
+    # Boilerplate is per company, so a company's other roles share it
+    company_rng = random.Random(company)
+    sentences += [re.sub(r"\{(\w+)\}", lambda m: (str(company_rng.randint(2, 9) if m.group(1) == 'm' else company_rng.randint(10, 90)) if m.group(1) in 'nm'
+                                                   else company_rng.choice(FILLERS[m.group(1)])), line)
+                  for line in ABOUT]
+    sentences += [duty.format(s=s).capitalize() + "." for s in skills for duty in rng.sample(DUTIES, 2)]
+    sentences += [f"Requirements: {rng.randint(2, 8)}+ years with {skills[0]} and {skills[1]}.",
+                  "We offer competitive pay, equity and flexible hours."]
+    return {'company': company, 'title': rng.choice(TITLES), 'jd': ' '.join(sentences),
+            'key_requirements': skills[:3], 'sentences': sentences}
+
+
+def repost(rng: random.Random, job: dict) -> dict:
+    """Same role on another board: header, footer, a reordered line, light rewording."""
+    sentences = [rng.choice(BOARD_HEADERS)] + list(job['sentences'])
+    i, j = rng.sample(range(1, len(sentences) - 2), 2)
+    sentences[i], sentences[j] = sentences[j], sentences[i]
+    sentences[-1] = sentences[-1].replace("competitive pay", "a competitive salary")
+    sentences.append(rng.choice(BOARD_FOOTERS))
+    return {**job, 'jd': ' '.join(sentences)}
+
+
+def lookalike(rng: random.Random, job: dict) -> dict:
+    """Different role at the same company sharing the boilerplate."""
+    other = make_job(rng, int(job['company'].split()[-1]))
+    return {**other, 'company': job['company']}
+
+
+def legacy_job_hash(job: dict) -> str:
+    """The old generate_job_hash: company + title + first 100 JD characters."""
+    return hashlib.md5(f"{job['company']}{job['title']}{job['jd'][:100]}".encode()).hexdigest()[:8]
+
+
+def check_changed_tail_repost(rng: random.Random, tailor: ResumeTailor) -> bool:
+    """
+    Regression check: a repost whose JD differs only in its tail must be
+    flagged, not excluded as the query's own entry. The API passes the
+    incoming job's hash as `exclude`; with the old 100-character hash a
+    changed-tail repost shares the stored posting's key.
+    """
+
+    job = make_job(rng, 0)
+    changed = {**job, 'jd': job['jd'] + " Applications close at the end of the month; apply via our careers page."}
+    ok = True
+
+    for name, key in (('job hash', tailor.generate_job_hash), ('legacy 100-char hash', legacy_job_hash)):
+        index = JobDedupIndex(path=None)
+        index.add(key(job), job)
+        found = index.query(changed, exclude=key(changed))
+        itself = index.query(job, exclude=key(job))
+        passed = found is not None and found['job_hash'] == key(job) and itself is None
+        ok &= passed
+        print(f"changed-tail repost keyed by {name}: "
+              f"{'flagged' if found else 'MISSED'} (similarity {found['similarity'] if found else '-'}), "
+              f"identical posting {'excluded' if itself is None else 'FLAGGED AS ITS OWN DUPLICATE'}")
+
+    return ok
+
+
+def check_reindex_keeps_applied(rng: random.Random, tailor: ResumeTailor) -> bool:
+    """
+    Regression check: submit -> re-tailor -> submit. Re-tailoring re-adds
+    the job under its own hash; the application_id from mark_applied
+    must survive, so the second submit is still rejected.
+    """
+
+    job = make_job(rng, 1)
+    job_hash = tailor.generate_job_hash(job)
+    index = JobDedupIndex(path=None)
+
+    index.add(job_hash, job)
+    index.mark_applied(job_hash, "APP_20250101_0001")
+    index.add(job_hash, job)
+    found = index.query(job, require='application_id')
+
+    passed = found is not None and found.get('application_id') == "APP_20250101_0001"
+    print(f"re-tailored applied job: {'still blocked' if passed else 'APPLIED MARKER LOST'}")
+    return passed
+
+
+def main():
+    rng = random.Random(7)
+    jobs = [make_job(rng, i) for i in range(STORED)]
+    tailor = ResumeTailor.__new__(ResumeTailor)
+    index = JobDedupIndex(path=None)
+
+    started = time.perf_counter()
+    signatures = [index.signature(job) for job in jobs]
+    sign_us = (time.perf_counter() - started) / STORED * 1e6
+    # Indexed by position, so a match maps straight back to jobs[i]
+    for i, (job, signature) in enumerate(zip(jobs, signatures)):
+        index.add(str(i), job, signature)
+
+    picked = rng.sample(range(STORED), REPOSTS)
+    reposts = [repost(rng, jobs[i]) for i in picked]
+    lookalikes = [lookalike(rng, job) for job in rng.sample(jobs, LOOKALIKES)]
+
+    exact = sum(tailor.generate_job_hash(job) == tailor.generate_job_hash(jobs[i]) for job, i in zip(reposts, picked))
+
+    started = time.perf_counter()
+    found = [index.query(job) for job in reposts]
+    query_us = (time.perf_counter() - started) / REPOSTS * 1e6
+    caught = sum(f is not None and f['job_hash'] == str(i) for f, i in zip(found, picked))
+    false_hits = sum(index.query(job) is not None for job in lookalikes)
+
+    # Brute force: compare every query signature against every stored one
+    matrix = np.stack(signatures)
+    started = time.perf_counter()
+    for job in reposts:
+        (matrix == index.signature(job)).mean(axis=1).argmax()
+    brute_us = (time.perf_counter() - started) / REPOSTS * 1e6
+
+    print(f"{STORED} stored postings, {REPOSTS} cross-board reposts, {LOOKALIKES} same-company lookalikes")
+    print(f"signature: {sign_us:.0f} µs/posting")
+    print(f"exact job hash catches:  {exact}/{REPOSTS}")
+    print(f"MinHash LSH catches:     {caught}/{REPOSTS}")
+    print(f"lookalikes flagged:      {false_hits}/{LOOKALIKES}")
+    print(f"query: {query_us:.0f} µs (LSH, avg {index.stats()['avg_candidates']} candidates) "
+          f"vs {brute_us:.0f} µs (brute force over {STORED})")
+
+    print()
+    if not (check_changed_tail_repost(rng, tailor) & check_reindex_keeps_applied(rng, tailor)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Micro-benchmark: keyset paging over the cached sort order vs. sorting the view per page
+Run from backend/:  python benchmarks/bench_keyset_paging.py
+"""
+
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from database_manager import ApplicationDatabase
+from bench_index_lookup import build_frame
+
+
+SIZES = [10_000, 100_000, 1_000_000]
+FLAT_TOLERANCE = 2.0
+LIMIT = 50
+
+
+def time_ms(stmt, number: int = 20) -> float:
+    return min(timeit.repeat(stmt, number=number, repeat=3)) / number * 1e3
+
+
+def sort_per_page(db: ApplicationDatabase, cursor_id: str):
+    """The previous query path: mask past the cursor, then sort what is left."""
+    view = db.df
+    ordered = view[view['Application_ID'] > cursor_id].sort_values('Application_ID')
+    return ordered.head(LIMIT)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        db = ApplicationDatabase(Path(tmp) / "applications.xlsx", backend='sqlite')
+        db.logger.setLevel('WARNING')
+
+        print(f"{'rows':>10} | {'sort/page':>10} | {'cold sort':>10} | {'first page':>10} | "
+              f"{'mid page':>10} | {'filtered':>10}   (ms/page)")
+        print('-' * 78)
+
+        mid_times = []
+        for rows in SIZES:
+            db.df = build_frame(rows)
+            query = db.query_applications
+            mid_id = f"APP_20250101_{rows // 2:07d}"
+            mid = db._encode_cursor(mid_id, mid_id, 'Application_ID', 'asc')
+
+            per_page = time_ms(lambda: sort_per_page(db, mid_id), number=3)
+            cold = time_ms(lambda: (db._sort_cache.clear(), query('Application_ID', 'asc', limit=LIMIT)), number=3)
+            first = time_ms(lambda: query('Application_ID', 'asc', limit=LIMIT))
+            middle = time_ms(lambda: query('Application_ID', 'asc', mid, LIMIT))
+            filtered = time_ms(lambda: query('Application_ID', 'asc', mid, LIMIT, status='Interview'))
+
+            mid_times.append(middle)
+
+            print(f"{rows:>10,} | {per_page:>10.2f} | {cold:>10.2f} | {first:>10.2f} | "
+                  f"{middle:>10.2f} | {filtered:>10.2f}")
+
+        db.close()
+
+    # A cached page is a bisect plus a slice, so its cost must not track table size
+    growth = mid_times[-1] / mid_times[0]
+    print(f"\nmid-table page {SIZES[0]:,} -> {SIZES[-1]:,} rows: {growth:.2f}x "
+          f"({'flat' if growth <= FLAT_TOLERANCE else 'NOT FLAT'}, tolerance {FLAT_TOLERANCE}x)")
+    if growth > FLAT_TOLERANCE:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
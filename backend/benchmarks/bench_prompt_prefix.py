@@ -0,0 +1,88 @@
+"""
+Benchmark: prompt tokens per tailoring call, legacy single prompt vs cached prefix
+Run from backend/:  python benchmarks/bench_prompt_prefix.py
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from llm_transport import FakeTransport
+from resume_tailor import ResumeTailor, compact_json
+from tailoring_cache import TailoringCache
+
+
+JOBS = 20
+
+MASTER = {
+    "version": "1.0",
+    "experience": [{
+        "company": f"Company {i}",
+        "title": "Senior Software Engineer",
+        "duration": f"{2014 + 2 * i} - {2016 + 2 * i}",
+        "bullets": [
+            f"Built scalable microservices handling {i + 1}M+ daily requests using Python and FastAPI",
+            f"Reduced deployment time by {30 + i * 5}% by implementing CI/CD pipelines with GitHub Actions",
+            "Mentored 5 junior engineers on REST API design and code review practices",
+            "Migrated a monolithic Django application to containerized services on AWS ECS",
+            "Designed PostgreSQL schemas and query plans for reporting workloads"
+        ]
+    } for i in range(5)],
+    "skills": {
+        "technical": ["Python", "FastAPI", "Django", "PostgreSQL", "Redis", "Kafka"],
+        "tools": ["Git", "Docker", "Kubernetes", "AWS", "Terraform", "GitHub Actions"],
+        "soft_skills": ["Team Leadership", "Mentoring", "Technical Writing"]
+    }
+}
+
+
+def build_jobs(count: int):
+    return [{
+        'company': f"Startup {i}",
+        'title': 'Backend Engineer',
+        'jd': f"Posting {i}: we need a backend engineer with Python, API design and CI/CD experience. " * 3,
+        'key_requirements': ['Python', 'API Development', 'CI/CD']
+    } for i in range(count)]
+
+
+def legacy_prompt(tailor: ResumeTailor, master_resume, job_data) -> str:
+    """Pre-refactor prompt: the same text as one uncached message with indent=2 dumps."""
+    text = tailor._tailoring_prefix(master_resume) + tailor._build_tailoring_prompt(job_data)
+    for value in (master_resume['experience'], master_resume['skills'], job_data['key_requirements']):
+        text = text.replace(compact_json(value), json.dumps(value, indent=2))
+    return text
+
+
+async def main():
+    jobs = build_jobs(JOBS)
+
+    tailor = ResumeTailor(
+        api_key="benchmark",
+        cache=TailoringCache(cache_dir=None),
+        transport=FakeTransport(latency=0)
+    )
+    legacy_tokens = sum(len(legacy_prompt(tailor, MASTER, job)) // 4 for job in jobs)
+
+    for job in jobs:
+        await tailor.tailor_resume_async(MASTER, job)
+    totals = tailor.usage_stats()['totals']
+
+    # Prompt caching bills cache writes at 1.25x and cache reads at 0.1x base input
+    billed = (totals['input_tokens']
+              + 1.25 * totals['cache_creation_input_tokens']
+              + 0.1 * totals['cache_read_input_tokens'])
+
+    print(f"{JOBS} tailoring calls, 5-role master resume")
+    print(f"  legacy prompt tokens (indent=2, uncached): {legacy_tokens:>8,}")
+    print(f"  uncached input tokens:                     {totals['input_tokens']:>8,}")
+    print(f"  cache write tokens:                        {totals['cache_creation_input_tokens']:>8,}")
+    print(f"  cache read tokens:                         {totals['cache_read_input_tokens']:>8,}")
+    print(f"  billed-equivalent input tokens:            {billed:>8,.0f}  "
+          f"({billed / legacy_tokens:.0%} of legacy)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,106 @@
+"""
+Benchmark: /ws/pulse cost by number of open dashboards, per-connection polling vs. the shared broadcaster
+Run from backend/:  python benchmarks/bench_pulse_broadcast.py
+"""
+
+import asyncio
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pulse_broadcaster import PulseBroadcaster
+
+
+TICKS = 50
+INTERVAL = 0.01
+CHANGE_RATE = 0.3  # fraction of ticks where some pulse field actually changes
+
+
+class Emulator:
+    """Pulse source whose state only changes on some ticks; counts how often it is computed."""
+
+    def __init__(self):
+        self.rng = random.Random(5)
+        self.batch = 0
+        self.calls = 0
+
+    def get_pulse_status(self) -> dict:
+        self.calls += 1
+        if self.rng.random() < CHANGE_RATE:
+            self.batch = (self.batch + 1) % 4
+        return {
+            'status': 'active',
+            'cooldown_remaining': 0,
+            'batch_progress': f"{self.batch}/3",
+            'next_action_eta': None,
+            'health_score': 94,
+            'reason': None
+        }
+
+
+async def per_connection(clients: int) -> dict:
+    """The old handler: every connection polls and sends the full JSON each tick."""
+
+    emulator, sent = Emulator(), [0]
+
+    async def connection():
+        for _ in range(TICKS):
+            sent[0] += len(json.dumps(emulator.get_pulse_status()))
+            await asyncio.sleep(INTERVAL)
+
+    started, cpu = time.perf_counter(), time.process_time()
+    await asyncio.gather(*(connection() for _ in range(clients)))
+    return {'cpu': time.process_time() - cpu, 'source_calls': emulator.calls, 'bytes': sent[0]}
+
+
+async def broadcast(clients: int, slow: int = 0) -> dict:
+    """One publisher task; clients just drain their queues. `slow` clients never read."""
+
+    emulator, sent = Emulator(), [0]
+    pulse = PulseBroadcaster(emulator.get_pulse_status, interval=INTERVAL, queue_size=8)
+
+    async def connection(subscriber):
+        while True:
+            message = await subscriber.get()
+            if message is None:
+                return
+            sent[0] += len(message)
+
+    started, cpu = time.perf_counter(), time.process_time()
+    pulse.start()
+    readers = [asyncio.ensure_future(connection(pulse.subscribe())) for _ in range(clients)]
+    stalled = [pulse.subscribe() for _ in range(slow)]
+    while pulse.ticks < TICKS:
+        await asyncio.sleep(INTERVAL)
+    await pulse.stop()
+    await asyncio.gather(*readers)
+    return {
+        'cpu': time.process_time() - cpu,
+        'source_calls': emulator.calls,
+        'bytes': sent[0],
+        'dropped': pulse.dropped,
+        'stalled': len(stalled)
+    }
+
+
+async def main():
+    print(f"{TICKS} ticks, pulse changes on ~{CHANGE_RATE:.0%} of ticks")
+    print(f"{'clients':>7} | {'mode':>11} | {'cpu ms':>7} | {'source calls':>12} | {'KB sent':>8}")
+    print('-' * 58)
+    for clients in (1, 10, 100, 500):
+        for name, run in (('per-conn', per_connection), ('broadcaster', broadcast)):
+            result = await run(clients)
+            print(f"{clients:>7} | {name:>11} | {result['cpu'] * 1000:>7.1f} | "
+                  f"{result['source_calls']:>12} | {result['bytes'] / 1024:>8.1f}")
+
+    result = await broadcast(50, slow=5)
+    print(f"\n50 readers + 5 stalled clients: {result['dropped']} dropped, readers unaffected "
+          f"({result['bytes'] / 1024:.1f} KB delivered)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
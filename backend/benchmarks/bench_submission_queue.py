@@ -0,0 +1,72 @@
+"""
+Benchmark: submission queue throughput by worker count and store (simulated browser submissions)
+Run from backend/:  python benchmarks/bench_submission_queue.py
+"""
+
+import asyncio
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from submission_queue import SubmissionQueue, create_queue_store
+
+
+JOBS = 60
+SUBMIT_SECONDS = 0.05
+FAILURE_RATE = 0.2
+
+
+async def run(backend: str, workers: int) -> dict:
+    rng = random.Random(3)
+
+    async def submit(job_data: dict, resume_path: str, cover_letter: str) -> bool:
+        await asyncio.sleep(SUBMIT_SECONDS)
+        return rng.random() >= FAILURE_RATE
+
+    statuses = []
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = SubmissionQueue(
+            create_queue_store(backend, tmp), submit,
+            on_status=lambda app_id, status, notes: statuses.append(status),
+            workers=workers, backoff_seconds=0.01, poll_interval=0.05
+        )
+        await queue.start()
+
+        started = time.perf_counter()
+        for i in range(JOBS):
+            await queue.enqueue(f"APP_{i:04d}", {'job_data': {}, 'resume_path': '', 'cover_letter': ''})
+        while True:
+            stats = await queue.stats()
+            if stats['states']['succeeded'] + stats['states']['failed'] == JOBS:
+                break
+            await asyncio.sleep(0.01)
+        elapsed = time.perf_counter() - started
+
+        await queue.stop()
+
+    return {
+        'elapsed': elapsed,
+        'per_minute': JOBS / elapsed * 60,
+        'succeeded': stats['states']['succeeded'],
+        'retries': stats['retries'],
+        'write_backs': len(statuses)
+    }
+
+
+async def main():
+    print(f"{JOBS} submissions of {SUBMIT_SECONDS * 1000:.0f} ms, {FAILURE_RATE:.0%} of attempts fail (3 attempts max)")
+    print(f"{'store':>8} | {'workers':>7} | {'seconds':>7} | {'jobs/min':>8} | {'succeeded':>9} | {'retries':>7}")
+    print('-' * 62)
+    for backend in ('sqlite', 'journal'):
+        for workers in (1, 2, 4, 8):
+            result = await run(backend, workers)
+            print(f"{backend:>8} | {workers:>7} | {result['elapsed']:>7.2f} | {result['per_minute']:>8.0f} | "
+                  f"{result['succeeded']:>9} | {result['retries']:>7}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,111 @@
+"""
+Benchmark: single-pass workbook writer vs the legacy write-then-reformat save
+Run from backend/:  python benchmarks/bench_workbook_save.py
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import openpyxl
+import pandas as pd
+from openpyxl.styles import Alignment
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from database_manager import coerce_schema
+from storage_backends import (
+    APPLICATION_COLUMNS,
+    COLUMN_WIDTHS,
+    HEADER_FILL,
+    HEADER_FONT,
+    RESUME_VERSION_COLUMNS,
+    summary_frame,
+    write_workbook
+)
+
+
+SIZES = [1_000, 5_000, 20_000]
+STATS = {
+    'total_applications': 0,
+    'this_week': 0,
+    'response_rate': '0.0%',
+    'interview_rate': '0.0%',
+    'avg_tailoring_score': 0
+}
+
+
+def build_frame(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    df = pd.DataFrame({col: [None] * rows for col in APPLICATION_COLUMNS})
+    df['Application_ID'] = [f"APP_20250101_{i:06d}" for i in range(rows)]
+    df['Date_Applied'] = '2025-01-01'
+    df['Company'] = [f"Company {i}" for i in rng.integers(0, 500, rows)]
+    df['Job_Title'] = 'Senior Backend Engineer'
+    df['Job_URL'] = [f"https://linkedin.com/jobs/{i}" for i in range(rows)]
+    df['Status'] = rng.choice(['Applied', 'Rejected', 'Interview'], rows)
+    df['Resume_Path'] = 'resumes/tailored/resume_Company_abcd1234.json'
+    df['Tailoring_Score'] = rng.integers(50, 100, rows)
+    df['Key_Matches'] = 'Python, FastAPI, AWS'
+    return coerce_schema(df)
+
+
+def legacy_save(path: Path, applications: pd.DataFrame, summary: pd.DataFrame) -> int:
+    """The pre-refactor _save(): two appending ExcelWriters plus a reformat pass."""
+
+    written = 0
+
+    with pd.ExcelWriter(path, engine='openpyxl', mode='a', if_sheet_exists='replace') as writer:
+        applications.to_excel(writer, sheet_name='Applications', index=False)
+    written += path.stat().st_size
+
+    with pd.ExcelWriter(path, engine='openpyxl', mode='a', if_sheet_exists='replace') as writer:
+        summary.to_excel(writer, sheet_name='Summary', index=False)
+    written += path.stat().st_size
+
+    wb = openpyxl.load_workbook(path)
+    ws = wb['Applications']
+    for cell in ws[1]:
+        cell.fill = HEADER_FILL
+        cell.font = HEADER_FONT
+        cell.alignment = Alignment(horizontal='center', vertical='center')
+    for col, width in COLUMN_WIDTHS.items():
+        ws.column_dimensions[col].width = width
+    ws.freeze_panes = 'A2'
+    wb.save(path)
+    written += path.stat().st_size
+
+    return written
+
+
+def main():
+    summary = summary_frame(STATS)
+    versions = pd.DataFrame(columns=RESUME_VERSION_COLUMNS)
+
+    print(f"{'rows':>8} | {'legacy s':>9} | {'legacy MB':>9} | {'single s':>9} | {'single MB':>9}")
+    print('-' * 56)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in SIZES:
+            applications = build_frame(rows)
+
+            legacy_path = Path(tmp) / f"legacy_{rows}.xlsx"
+            write_workbook(legacy_path, applications, summary, versions)
+            start = time.perf_counter()
+            legacy_bytes = legacy_save(legacy_path, applications, summary)
+            legacy_s = time.perf_counter() - start
+
+            single_path = Path(tmp) / f"single_{rows}.xlsx"
+            start = time.perf_counter()
+            write_workbook(single_path, applications, summary, versions)
+            single_s = time.perf_counter() - start
+            single_bytes = single_path.stat().st_size
+
+            print(f"{rows:>8,} | {legacy_s:>9.2f} | {legacy_bytes / 1e6:>9.2f} | "
+                  f"{single_s:>9.2f} | {single_bytes / 1e6:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,133 +3,224 @@ Excel Database Manager
 Tracks all applications with version control for tailored resumes
 """
 
+import base64
+import json
+import os
+import threading
+from collections import defaultdict
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
-import openpyxl
-from openpyxl.styles import Font, PatternFill, Alignment
+from typing import Dict, Iterator, List, Optional, Set, Union
 import logging
 
+from storage_backends import (
+    APPLICATION_COLUMNS,
+    RESUME_VERSION_COLUMNS,
+    StorageBackend,
+    create_storage
+)
+from summary_stats import SummaryStats
+
+
+# In-memory dtypes for the Applications table. Low-cardinality text is
+# categorical, dates are datetime64 and missing values are nullable (NA/NaT)
+# rather than '' sentinels.
+APPLICATION_SCHEMA = {
+    'Application_ID': 'string',
+    'Date_Applied': 'datetime64[ns]',
+    'Company': 'category',
+    'Job_Title': 'string',
+    'Job_URL': 'string',
+    'Location': 'category',
+    'Status': 'category',
+    'Resume_Version': 'string',
+    'Resume_Path': 'string',
+    'Cover_Letter_Used': 'category',
+    'Tailoring_Score': 'UInt8',
+    'Key_Matches': 'string',
+    'Response_Date': 'datetime64[ns]',
+    'Response_Type': 'category',
+    'Interview_Date': 'datetime64[ns]',
+    'Notes': 'string',
+    'Follow_Up_Date': 'datetime64[ns]'
+}
+
+SORTABLE_COLUMNS = ['Date_Applied', 'Company', 'Job_Title', 'Status', 'Tailoring_Score', 'Application_ID']
+
+DATE_COLUMNS = [col for col, dtype in APPLICATION_SCHEMA.items() if dtype.startswith('datetime')]
+CATEGORY_COLUMNS = [col for col, dtype in APPLICATION_SCHEMA.items() if dtype == 'category']
+
+
+def coerce_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast an Applications frame (from any storage engine) to APPLICATION_SCHEMA."""
+    
+    df = df.reindex(columns=APPLICATION_COLUMNS)
+    typed = {}
+    
+    for col, dtype in APPLICATION_SCHEMA.items():
+        values = df[col].replace('', None)
+        if col in DATE_COLUMNS:
+            typed[col] = pd.to_datetime(values, errors='coerce')
+        elif col == 'Tailoring_Score':
+            typed[col] = pd.to_numeric(values, errors='coerce').round().clip(0, 100).astype(dtype)
+        else:
+            typed[col] = values.astype(dtype)
+    
+    return pd.DataFrame(typed)
+
+
+def concat_typed(base: pd.DataFrame, new: pd.DataFrame) -> pd.DataFrame:
+    """Append typed frames, unioning categories so columns stay categorical."""
+    
+    for col in CATEGORY_COLUMNS:
+        categories = base[col].cat.categories.union(new[col].cat.categories)
+        base[col] = base[col].cat.set_categories(categories)
+        new[col] = new[col].cat.set_categories(categories)
+    
+    return pd.concat([base, new], ignore_index=True)
+
+
+def to_records(df: pd.DataFrame) -> List[Dict]:
+    """JSON-safe records: dates as YYYY-MM-DD, NA/NaT as None."""
+    
+    out = df.copy()
+    for col in DATE_COLUMNS:
+        if col in out:
+            out[col] = out[col].dt.strftime('%Y-%m-%d')
+    out = out.astype(object)
+    
+    return out.where(out.notna(), None).to_dict(orient='records')
+
+
+def _scalar(value):
+    """Plain Python value for one cell, as Series.to_dict() on a row would give."""
+    if value is pd.NA:
+        return None
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
 
 class ApplicationDatabase:
     """
     Manages Excel spreadsheet for tracking job applications.
     Includes versioning for tailored resumes.
+    
+    Persistence is delegated to a storage engine: 'excel' keeps the
+    workbook as the store (legacy), 'write-behind' journals each change
+    and coalesces workbook saves in a background worker, and 'sqlite'
+    commits one row per write and produces applications.xlsx on demand
+    via export_excel().
     """
     
-    def __init__(self, db_path: str = "database/applications.xlsx"):
+    def __init__(self, db_path: str = "database/applications.xlsx",
+                 backend: Union[str, StorageBackend, None] = None):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Initialize or load existing database
-        if not self.db_path.exists():
-            self._create_new_database()
-        
-        self.df = pd.read_excel(self.db_path, sheet_name='Applications')
-        
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
-    
-    def _create_new_database(self):
-        """Create new Excel database with proper schema."""
-        
-        # Define columns
-        columns = [
-            'Application_ID',
-            'Date_Applied',
-            'Company',
-            'Job_Title',
-            'Job_URL',
-            'Location',
-            'Status',
-            'Resume_Version',
-            'Resume_Path',
-            'Cover_Letter_Used',
-            'Tailoring_Score',
-            'Key_Matches',
-            'Response_Date',
-            'Response_Type',
-            'Interview_Date',
-            'Notes',
-            'Follow_Up_Date'
-        ]
-        
-        # Create empty DataFrame
-        df = pd.DataFrame(columns=columns)
-        
-        # Create Excel writer with multiple sheets
-        with pd.ExcelWriter(self.db_path, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='Applications', index=False)
-            
-            # Add a summary sheet
-            summary_df = pd.DataFrame({
-                'Metric': [
-                    'Total Applications',
-                    'Applications This Week',
-                    'Response Rate',
-                    'Interview Rate',
-                    'Average Tailoring Score'
-                ],
-                'Value': [0, 0, '0%', '0%', 0]
-            })
-            summary_df.to_excel(writer, sheet_name='Summary', index=False)
-            
-            # Add resume versions sheet
-            versions_df = pd.DataFrame(columns=[
-                'Version_ID',
-                'Job_Hash',
-                'Created_Date',
-                'Base_Resume',
-                'Company',
-                'Title',
-                'File_Path'
-            ])
-            versions_df.to_excel(writer, sheet_name='Resume_Versions', index=False)
-        
-        # Apply formatting
-        self._apply_formatting()
-        
-        self.logger.info(f"Created new database: {self.db_path}")
-    
-    def _apply_formatting(self):
-        """Apply professional Excel formatting."""
-        
-        wb = openpyxl.load_workbook(self.db_path)
-        ws = wb['Applications']
-        
-        # Header formatting
-        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        header_font = Font(bold=True, color="FFFFFF", size=11)
-        
-        for cell in ws[1]:
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-        
-        # Set column widths
-        column_widths = {
-            'A': 15,  # Application_ID
-            'B': 12,  # Date_Applied
-            'C': 20,  # Company
-            'D': 30,  # Job_Title
-            'E': 50,  # Job_URL
-            'F': 15,  # Location
-            'G': 12,  # Status
-            'H': 15,  # Resume_Version
-            'I': 50,  # Resume_Path
-            'J': 15,  # Cover_Letter_Used
-            'K': 15,  # Tailoring_Score
-            'L': 30,  # Key_Matches
-        }
         
-        for col, width in column_widths.items():
-            ws.column_dimensions[col].width = width
+        # Guards the in-memory tables against concurrent writers/flushers
+        self.lock = threading.RLock()
         
-        # Freeze header row
-        ws.freeze_panes = 'A2'
+        # Initialize or load existing database
+        self.storage = create_storage(backend or os.environ.get("DB_BACKEND", "excel"), self.db_path)
+        self.df = self.storage.load_applications()
+        self._load_resume_versions()
+        self.storage.attach(self)
         
-        wb.save(self.db_path)
+        self.logger.info(f"Loaded database: {self.db_path} ({self.storage.name} storage)")
+    
+    @property
+    def df(self) -> pd.DataFrame:
+        """Applications table; rows buffered by add_application are merged lazily."""
+        if self._pending_rows:
+            new_rows = coerce_schema(pd.DataFrame(self._pending_rows, columns=APPLICATION_COLUMNS))
+            self._df = concat_typed(self._df, new_rows)
+            self._pending_rows = []
+        return self._df
+    
+    @df.setter
+    def df(self, value: pd.DataFrame):
+        self._df = coerce_schema(value.reset_index(drop=True))
+        self._pending_rows: List[Dict] = []
+        self._row_cache: Dict[int, Dict] = {}
+        self._sort_cache: Dict[str, tuple] = {}
+        self._rebuild_indexes()
+        self.stats = SummaryStats.from_frame(self._df)
+    
+    def _row_count(self) -> int:
+        return len(self._df) + len(self._pending_rows)
+    
+    # ------------------------------------------------------------------
+    # Indexes: row positions keyed by Application_ID (primary) and by
+    # Status / Company (secondary), kept current on every write.
+    # ------------------------------------------------------------------
+    
+    def _rebuild_indexes(self):
+        self._id_index: Dict[str, int] = {}
+        self._status_index: Dict[str, Set[int]] = defaultdict(set)
+        self._company_index: Dict[str, Set[int]] = defaultdict(set)
+        
+        for pos, (app_id, status, company) in enumerate(zip(
+            self._df['Application_ID'], self._df['Status'], self._df['Company']
+        )):
+            self._index_row(pos, app_id, status, company)
+    
+    def _index_row(self, pos: int, app_id: str, status: str, company: str):
+        self._id_index[app_id] = pos
+        self._status_index[status].add(pos)
+        self._company_index[company].add(pos)
+    
+    def _get_cell(self, pos: int, column: str):
+        if pos >= len(self._df):
+            return self._pending_rows[pos - len(self._df)][column]
+        return self._df.at[pos, column]
+    
+    def _set_cell(self, pos: int, column: str, value):
+        if column in SORTABLE_COLUMNS:
+            self._sort_cache.pop(column, None)
+        
+        # Rows still in the insert buffer are updated in place, avoiding a concat
+        if pos >= len(self._df):
+            self._pending_rows[pos - len(self._df)][column] = value
+            return
+        
+        self._row_cache.pop(pos, None)
+        series = self._df[column]
+        if isinstance(series.dtype, pd.CategoricalDtype) and not pd.isna(value) \
+                and value not in series.cat.categories:
+            self._df[column] = series.cat.add_categories([value])
+        self._df.at[pos, column] = value
+    
+    def memory_report(self) -> Dict:
+        """Resident size of the applications table, per column (deep)."""
+        
+        with self.lock:
+            df = self.df
+            usage = df.memory_usage(deep=True, index=False)
+            return {
+                'rows': len(df),
+                'total_bytes': int(usage.sum()),
+                'columns': {
+                    col: {'dtype': str(df[col].dtype), 'bytes': int(usage[col])}
+                    for col in df.columns
+                }
+            }
+    
+    def _rows_at(self, positions) -> pd.DataFrame:
+        return self.df.take(np.fromiter(sorted(positions), dtype=np.intp, count=len(positions)))
+    
+    def _row_dict(self, pos: int) -> Dict:
+        """One stored row as a dict, cached per position until the row is written."""
+        row = self._row_cache.get(pos)
+        if row is None:
+            row = {column: _scalar(self._df[column].array[pos]) for column in self._df.columns}
+            self._row_cache[pos] = row
+        return row
     
     def add_application(self, application_data: Dict) -> str:
         """
@@ -146,63 +237,134 @@ class ApplicationDatabase:
                 'cover_letter_used': bool,
                 'tailoring_score': int,
                 'key_matches': List[str],
-                'notes': str (optional)
+                'notes': str (optional),
+                'status': str (optional, default 'Applied')
             }
         
         Returns:
             Application ID
         """
         
+        with self.lock:
+            new_row = self._buffer_application(application_data)
+            self.storage.insert_application(new_row)
+        
+        app_id = new_row['Application_ID']
+        self.logger.info(f"Added application: {app_id} - {application_data['company']}")
+        
+        return app_id
+    
+    def add_applications(self, applications: List[Dict]) -> List[str]:
+        """
+        Add many applications with a single concat and a single persist.
+        
+        Args:
+            applications: list of add_application() payloads
+        
+        Returns:
+            Application IDs, in input order
+        """
+        
+        with self.lock:
+            new_rows = [self._buffer_application(data) for data in applications]
+            self.storage.insert_applications(new_rows)
+        
+        self.logger.info(f"Added {len(new_rows)} applications")
+        
+        return [row['Application_ID'] for row in new_rows]
+    
+    def _buffer_application(self, application_data: Dict) -> Dict:
+        """Build one application row and buffer it in memory. Caller holds self.lock."""
+        
         # Generate application ID
-        app_id = f"APP_{datetime.now().strftime('%Y%m%d')}_{len(self.df) + 1:04d}"
+        app_id = f"APP_{datetime.now().strftime('%Y%m%d')}_{self._row_count() + 1:04d}"
         
         # Create new row
         new_row = {
             'Application_ID': app_id,
-            'Date_Applied': datetime.now().strftime('%Y-%m-%d'),
+            'Date_Applied': pd.Timestamp.now().normalize(),
             'Company': application_data['company'],
             'Job_Title': application_data['job_title'],
             'Job_URL': application_data['job_url'],
-            'Location': application_data.get('location', ''),
-            'Status': 'Applied',
+            'Location': application_data.get('location') or None,
+            'Status': application_data.get('status') or 'Applied',
             'Resume_Version': application_data['resume_version'],
             'Resume_Path': application_data['resume_path'],
             'Cover_Letter_Used': 'Yes' if application_data.get('cover_letter_used') else 'No',
             'Tailoring_Score': application_data.get('tailoring_score', 0),
             'Key_Matches': ', '.join(application_data.get('key_matches', [])),
-            'Response_Date': '',
-            'Response_Type': '',
-            'Interview_Date': '',
+            'Response_Date': None,
+            'Response_Type': None,
+            'Interview_Date': None,
             'Notes': application_data.get('notes', ''),
-            'Follow_Up_Date': ''
+            'Follow_Up_Date': None
         }
         
-        # Append to DataFrame
-        self.df = pd.concat([self.df, pd.DataFrame([new_row])], ignore_index=True)
+        # Merged into self.df on next read
+        self._index_row(self._row_count(), app_id, new_row['Status'], new_row['Company'])
+        self._pending_rows.append(new_row)
+        self._sort_cache.clear()
+        self.stats.add(new_row)
         
-        # Save to Excel
-        self._save()
-        
-        self.logger.info(f"Added application: {app_id} - {application_data['company']}")
-        
-        return app_id
+        return new_row
     
     def update_status(self, app_id: str, status: str, notes: str = ""):
         """Update application status."""
         
-        mask = self.df['Application_ID'] == app_id
-        self.df.loc[mask, 'Status'] = status
+        with self.lock:
+            changes = self._apply_status(app_id, status, notes)
+            self.storage.update_application(app_id, changes)
+        
+        self.logger.info(f"Updated {app_id}: {status}")
+    
+    def update_statuses(self, updates: List[Dict]) -> List[str]:
+        """
+        Apply many status changes with a single persist.
+        
+        Args:
+            updates: [{'app_id': str, 'status': str, 'notes': str (optional)}, ...]
+        
+        Returns:
+            IDs that were updated; unknown IDs are skipped
+        """
+        
+        with self.lock:
+            applied = []
+            for update in updates:
+                if update['app_id'] not in self._id_index:
+                    continue
+                changes = self._apply_status(update['app_id'], update['status'], update.get('notes') or "")
+                applied.append((update['app_id'], changes))
+            
+            self.storage.update_applications(applied)
+        
+        self.logger.info(f"Updated {len(applied)} of {len(updates)} applications")
+        
+        return [app_id for app_id, _ in applied]
+    
+    def _apply_status(self, app_id: str, status: str, notes: str = "") -> Dict:
+        """Apply one status change in memory and return the changed columns. Caller holds self.lock."""
+        
+        pos = self._id_index[app_id]
+        changes = {'Status': status}
         
         if notes:
-            existing_notes = self.df.loc[mask, 'Notes'].values[0]
-            updated_notes = f"{existing_notes}\n{datetime.now().strftime('%Y-%m-%d')}: {notes}"
-            self.df.loc[mask, 'Notes'] = updated_notes
+            existing_notes = self._get_cell(pos, 'Notes')
+            existing_notes = '' if pd.isna(existing_notes) else existing_notes
+            changes['Notes'] = f"{existing_notes}\n{datetime.now().strftime('%Y-%m-%d')}: {notes}"
         
         if status == 'Response Received':
-            self.df.loc[mask, 'Response_Date'] = datetime.now().strftime('%Y-%m-%d')
+            changes['Response_Date'] = pd.Timestamp.now().normalize()
         
-        self._save()
-        self.logger.info(f"Updated {app_id}: {status}")
+        old_status = self._get_cell(pos, 'Status')
+        self._status_index[old_status].discard(pos)
+        self._status_index[status].add(pos)
+        
+        self.stats.change({column: self._get_cell(pos, column) for column in changes}, changes)
+        for column, value in changes.items():
+            self._set_cell(pos, column, value)
+        
+        return changes
     
     def add_resume_version(self, version_data: Dict) -> str:
         """
@@ -223,8 +385,8 @@ class ApplicationDatabase:
         
         version_id = f"V_{version_data['job_hash']}"
         
-        # Load resume versions sheet
-        versions_df = pd.read_excel(self.db_path, sheet_name='Resume_Versions')
+        # Re-tailoring the same job refreshes its version instead of adding a duplicate row
+        existing = self._versions.get(version_id)
         
         new_version = {
             'Version_ID': version_id,
@@ -236,81 +398,297 @@ class ApplicationDatabase:
             'File_Path': version_data['file_path']
         }
         
-        versions_df = pd.concat([versions_df, pd.DataFrame([new_version])], ignore_index=True)
-        
-        # Save
-        with pd.ExcelWriter(self.db_path, engine='openpyxl', mode='a', if_sheet_exists='replace') as writer:
-            versions_df.to_excel(writer, sheet_name='Resume_Versions', index=False)
+        with self.lock:
+            self._versions.pop(version_id, None)
+            self._versions[version_id] = new_version
+            self._versions_by_hash[new_version['Job_Hash']] = version_id
+            self.storage.insert_resume_version(new_version)
         
-        self.logger.info(f"Added resume version: {version_id}")
+        self.logger.info(f"{'Refreshed' if existing else 'Added'} resume version: {version_id}")
         
         return version_id
     
+    def get_application(self, app_id: str) -> Optional[Dict]:
+        """Point lookup by Application_ID via the primary-key index."""
+        with self.lock:
+            pos = self._id_index.get(app_id)
+            if pos is None:
+                return None
+            if pos >= len(self._df):
+                return dict(self._pending_rows[pos - len(self._df)])
+            return dict(self._row_dict(pos))
+    
     def get_applications_by_status(self, status: str) -> pd.DataFrame:
         """Get all applications with specific status."""
-        return self.df[self.df['Status'] == status]
+        with self.lock:
+            return self._rows_at(self._status_index.get(status, ()))
     
-    def get_summary_stats(self) -> Dict:
-        """Generate summary statistics."""
+    def get_applications_by_company(self, company: str) -> pd.DataFrame:
+        """Get all applications to a specific company."""
+        with self.lock:
+            return self._rows_at(self._company_index.get(company, ()))
+    
+    def filter_applications(self, **filters) -> pd.DataFrame:
+        """
+        Server-side filtering; see _filter_positions() for the supported
+        filters.
+        """
+        with self.lock:
+            return self.df.iloc[self._filter_positions(**filters)]
+    
+    def iter_applications(self, chunk_size: int = 5000, **filters) -> Iterator[pd.DataFrame]:
+        """
+        Iterate over filtered rows in chunks without copying the whole table.
+        
+        Filters are applied here, before anything is yielded, so invalid
+        values raise ValueError to the caller rather than part-way through
+        a stream. Matching row positions are fixed up front; rows are only
+        ever appended, so later inserts never shift a chunk.
+        """
+        with self.lock:
+            positions = self._filter_positions(**filters)
+        
+        return self._iter_chunks(positions, chunk_size)
+    
+    def _iter_chunks(self, positions: np.ndarray, chunk_size: int) -> Iterator[pd.DataFrame]:
+        for start in range(0, len(positions), chunk_size):
+            with self.lock:
+                chunk = self.df.iloc[positions[start:start + chunk_size]]
+            yield chunk
+    
+    def _filter_positions(self, status: Optional[str] = None, company: Optional[str] = None,
+                          date_from: Optional[str] = None, date_to: Optional[str] = None,
+                          min_score: Optional[int] = None, max_score: Optional[int] = None,
+                          source: Optional[str] = None) -> np.ndarray:
+        """
+        Row positions matching the filters. Caller holds self.lock.
         
-        total = len(self.df)
+        Status and company go through the hash indexes; the remaining
+        predicates are vectorized over that subset. Dates are inclusive
+        YYYY-MM-DD bounds; source matches the Job_URL (e.g. 'linkedin').
+        """
+        
+        positions = None
+        if status is not None:
+            positions = set(self._status_index.get(status, ()))
+        if company is not None:
+            by_company = self._company_index.get(company, set())
+            positions = set(by_company) if positions is None else positions & by_company
+        
+        view = self._rows_at(positions) if positions is not None else self.df
+        
+        mask = pd.Series(True, index=view.index)
+        if date_from:
+            mask &= view['Date_Applied'] >= pd.Timestamp(date_from)
+        if date_to:
+            mask &= view['Date_Applied'] <= pd.Timestamp(date_to)
+        if min_score is not None:
+            mask &= view['Tailoring_Score'].ge(min_score).fillna(False)
+        if max_score is not None:
+            mask &= view['Tailoring_Score'].le(max_score).fillna(False)
+        if source:
+            mask &= view['Job_URL'].str.contains(source, case=False, regex=False).fillna(False)
+        
+        # The frame keeps a RangeIndex, so labels are positions
+        return view.index[mask.to_numpy()].to_numpy()
+    
+    def query_applications(self, sort_by: str = 'Date_Applied', order: str = 'desc',
+                           cursor: Optional[str] = None, limit: int = 50, **filters) -> Dict:
+        """
+        Keyset-paginated listing.
         
-        # This week
-        today = datetime.now()
-        week_start = today - pd.Timedelta(days=7)
-        this_week = len(self.df[pd.to_datetime(self.df['Date_Applied']) >= week_start])
+        Rows are ordered by (sort_by, Application_ID); the cursor encodes the
+        last row's key so the next page starts strictly after it, whatever
+        was inserted in between. Accepts the same filters as
+        filter_applications().
+        
+        The table is sorted once per column (see _sort_order()); a page is
+        a binary search to the cursor plus a slice, so later pages cost the
+        same as the first.
+        
+        Returns:
+            {'items': [...], 'next_cursor': str or None, 'total': int}
+        """
         
-        # Response rate
-        responses = len(self.df[self.df['Response_Date'].notna()])
-        response_rate = (responses / total * 100) if total > 0 else 0
+        if sort_by not in SORTABLE_COLUMNS:
+            raise ValueError(f"Cannot sort by {sort_by}")
+        if order not in ('asc', 'desc'):
+            raise ValueError(f"Invalid order: {order}")
+        descending = order == 'desc'
         
-        # Interview rate
-        interviews = len(self.df[self.df['Interview_Date'].notna()])
-        interview_rate = (interviews / total * 100) if total > 0 else 0
+        with self.lock:
+            positions, keys, ids = self._sort_order(sort_by)
+            valued, missing = positions[:len(keys)], positions[len(keys):]
+            
+            # Runs of positions in page order; missing sort keys are ordered last
+            if not cursor:
+                runs = [valued[::-1], missing[::-1]] if descending else [valued, missing]
+            else:
+                value, last_id = self._decode_cursor(cursor, sort_by, order)
+                side = 'left' if descending else 'right'
+                try:
+                    if value is None:
+                        start = len(keys) + np.searchsorted(ids[len(keys):], last_id, side)
+                    else:
+                        if isinstance(value, pd.Timestamp):
+                            value = value.to_datetime64()
+                        tie = np.searchsorted(keys, value, 'left'), np.searchsorted(keys, value, 'right')
+                        start = tie[0] + np.searchsorted(ids[tie[0]:tie[1]], last_id, side)
+                except TypeError:
+                    raise ValueError("Malformed cursor")
+                
+                if not descending:
+                    runs = [positions[start:]]
+                elif value is None:
+                    runs = [positions[len(keys):start][::-1]]
+                else:
+                    runs = [positions[:start][::-1], missing[::-1]]
+            
+            matched = None
+            total = len(positions)
+            if any(condition is not None for condition in filters.values()):
+                matched = np.zeros(len(positions), dtype=bool)
+                matched[self._filter_positions(**filters)] = True
+                total = int(matched.sum())
+            
+            picked, wanted = [], limit + 1
+            for run in runs:
+                if matched is not None:
+                    run = run[matched[run]]
+                picked.append(run[:wanted])
+                wanted -= len(picked[-1])
+                if not wanted:
+                    break
+            
+            page_positions = np.concatenate(picked)
+            page = self.df.iloc[page_positions[:limit]]
         
-        # Average tailoring score
-        avg_score = self.df['Tailoring_Score'].mean() if total > 0 else 0
+        next_cursor = None
+        if len(page_positions) > limit:
+            next_cursor = self._encode_cursor(page[sort_by].iloc[-1], page['Application_ID'].iloc[-1],
+                                              sort_by, order)
         
         return {
-            'total_applications': total,
-            'this_week': this_week,
-            'response_rate': f"{response_rate:.1f}%",
-            'interview_rate': f"{interview_rate:.1f}%",
-            'avg_tailoring_score': round(avg_score, 1)
+            'items': to_records(page),
+            'next_cursor': next_cursor,
+            'total': total
         }
     
-    def update_summary_sheet(self):
-        """Update the summary sheet with latest stats."""
-        
-        stats = self.get_summary_stats()
-        
-        summary_df = pd.DataFrame({
-            'Metric': [
-                'Total Applications',
-                'Applications This Week',
-                'Response Rate',
-                'Interview Rate',
-                'Average Tailoring Score'
-            ],
-            'Value': [
-                stats['total_applications'],
-                stats['this_week'],
-                stats['response_rate'],
-                stats['interview_rate'],
-                stats['avg_tailoring_score']
-            ]
-        })
-        
-        with pd.ExcelWriter(self.db_path, engine='openpyxl', mode='a', if_sheet_exists='replace') as writer:
-            summary_df.to_excel(writer, sheet_name='Summary', index=False)
-    
-    def _save(self):
-        """Save DataFrame to Excel."""
-        with pd.ExcelWriter(self.db_path, engine='openpyxl', mode='a', if_sheet_exists='replace') as writer:
-            self.df.to_excel(writer, sheet_name='Applications', index=False)
-        
-        self.update_summary_sheet()
-        self._apply_formatting()
+    def _sort_order(self, sort_by: str):
+        """
+        Row positions ordered by (sort_by, Application_ID) ascending, rows
+        without a sort key last. Caller holds self.lock.
+        
+        Returns (positions, keys, ids) as arrays in that order, where keys
+        covers only the rows that have a value, so a cursor is located by
+        binary search. Cached per column until a write touches it.
+        """
+        
+        order = self._sort_cache.get(sort_by)
+        if order is None:
+            ids = self.df['Application_ID']
+            if sort_by == 'Application_ID':
+                positions = ids.argsort(kind='stable').to_numpy()
+            else:
+                # A stable sort on the key over rows already in id order breaks ties by id
+                by_id = self._sort_order('Application_ID')[0]
+                key = self.df[sort_by]
+                if isinstance(key.dtype, pd.CategoricalDtype):
+                    key = key.astype('string')
+                codes, uniques = pd.factorize(key.take(by_id), sort=True)
+                codes[codes < 0] = len(uniques)
+                positions = by_id[np.argsort(codes, kind='stable')]
+            
+            keys = self.df[sort_by].take(positions).dropna()
+            order = (
+                positions,
+                keys.to_numpy(dtype='int64' if sort_by == 'Tailoring_Score' else None),
+                ids.take(positions).to_numpy(dtype=object)
+            )
+            self._sort_cache[sort_by] = order
+        return order
+    
+    @staticmethod
+    def _encode_cursor(value, app_id: str, sort_by: str, order: str) -> str:
+        if pd.isna(value):
+            value = None
+        elif isinstance(value, pd.Timestamp):
+            value = value.isoformat()
+        elif hasattr(value, 'item'):
+            value = value.item()
+        payload = json.dumps({'s': sort_by, 'o': order, 'v': value, 'id': app_id})
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+    
+    @staticmethod
+    def _decode_cursor(cursor: str, sort_by: str, order: str):
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (ValueError, UnicodeDecodeError):
+            raise ValueError("Malformed cursor")
+
+        if not isinstance(payload, dict) or not {'s', 'o', 'v', 'id'} <= payload.keys() \
+                or not isinstance(payload['id'], str):
+            raise ValueError("Malformed cursor")
+        if payload['s'] != sort_by or payload['o'] != order:
+            raise ValueError("Cursor does not match the requested sort")
+
+        # The value is compared against the sort column, so it must have that column's type
+        value = payload['v']
+        expected = int if sort_by == 'Tailoring_Score' else str
+        if value is not None and (not isinstance(value, expected) or isinstance(value, bool)):
+            raise ValueError("Malformed cursor")
+        if value is not None and sort_by in DATE_COLUMNS:
+            try:
+                value = pd.Timestamp(value)
+            except ValueError:
+                raise ValueError("Malformed cursor")
+        return value, payload['id']
+    
+    def get_summary_stats(self) -> Dict:
+        """Generate summary statistics from the running aggregates (O(1))."""
+        with self.lock:
+            return self.stats.snapshot()
+    
+    def _load_resume_versions(self):
+        """Load the versions table once into dicts keyed by Version_ID and Job_Hash."""
+        
+        self._versions: Dict[str, Dict] = {}
+        self._versions_by_hash: Dict[str, str] = {}
+        
+        versions_df = self.storage.load_resume_versions().reindex(columns=RESUME_VERSION_COLUMNS)
+        for record in versions_df.to_dict(orient='records'):
+            # Later duplicates win, collapsing legacy repeated V_<hash> rows
+            self._versions.pop(record['Version_ID'], None)
+            self._versions[record['Version_ID']] = record
+            self._versions_by_hash[record['Job_Hash']] = record['Version_ID']
+    
+    def get_resume_version(self, version_id: str) -> Optional[Dict]:
+        """Look up one resume version by Version_ID."""
+        with self.lock:
+            version = self._versions.get(version_id)
+            return dict(version) if version else None
+    
+    def get_resume_version_by_hash(self, job_hash: str) -> Optional[Dict]:
+        """Look up the resume version tailored for a job hash."""
+        with self.lock:
+            version_id = self._versions_by_hash.get(job_hash)
+            return dict(self._versions[version_id]) if version_id else None
+    
+    def get_resume_versions(self) -> pd.DataFrame:
+        """Get all tracked resume versions."""
+        with self.lock:
+            return pd.DataFrame(list(self._versions.values()), columns=RESUME_VERSION_COLUMNS)
+    
+    def export_excel(self, path: Optional[str] = None) -> Path:
+        """
+        Write the formatted applications workbook (Applications, Summary,
+        Resume_Versions) as a report. Defaults to db_path.
+        """
+        return self.storage.export_excel(Path(path) if path else self.db_path)
+    
+    def close(self):
+        """Release the storage engine."""
+        self.storage.close()
 
 
 # Example usage
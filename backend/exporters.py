@@ -0,0 +1,98 @@
+"""
+Streaming Application Exports
+Chunked CSV / XLSX (openpyxl write-only) / Parquet writers for the export endpoint
+"""
+
+import tempfile
+from typing import Iterable, Iterator
+
+import pandas as pd
+from openpyxl import Workbook
+
+from storage_backends import APPLICATION_COLUMNS, append_applications_sheet
+
+
+EXPORT_FORMATS = {
+    'csv': ('text/csv', 'csv'),
+    'xlsx': ('application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', 'xlsx'),
+    'parquet': ('application/vnd.apache.parquet', 'parquet')
+}
+
+# Spill to disk once an in-progress XLSX/Parquet file exceeds this size
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+READ_BLOCK_BYTES = 64 * 1024
+
+
+def iter_csv(chunks: Iterable[pd.DataFrame]) -> Iterator[bytes]:
+    """CSV bytes, one block per chunk; only one chunk is ever in memory."""
+
+    yield (','.join(APPLICATION_COLUMNS) + '\n').encode()
+    for chunk in chunks:
+        yield chunk.to_csv(header=False, index=False, date_format='%Y-%m-%d').encode()
+
+
+def iter_xlsx(chunks: Iterable[pd.DataFrame]) -> Iterator[bytes]:
+    """
+    XLSX built with openpyxl in write-only mode (rows are serialized as
+    they are appended, never held as cell objects), then streamed back.
+    Same formatted Applications sheet as the stored workbook.
+    """
+
+    wb = Workbook(write_only=True)
+    append_applications_sheet(wb, chunks)
+
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES) as buffer:
+        wb.save(buffer)
+        yield from _read_blocks(buffer)
+
+
+def iter_parquet(chunks: Iterable[pd.DataFrame]) -> Iterator[bytes]:
+    """Parquet with one row group per chunk. Requires pyarrow."""
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES) as buffer:
+        writer = None
+        for chunk in chunks:
+            # Plain (non-dictionary) columns keep the schema identical across chunks
+            table = pa.Table.from_pandas(_plain_frame(chunk), preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(buffer, table.schema)
+            writer.write_table(table)
+
+        if writer is None:
+            empty = pd.DataFrame(columns=APPLICATION_COLUMNS, dtype='string')
+            writer = pq.ParquetWriter(buffer, pa.Table.from_pandas(empty, preserve_index=False).schema)
+        writer.close()
+
+        yield from _read_blocks(buffer)
+
+
+def _plain_frame(chunk: pd.DataFrame) -> pd.DataFrame:
+    plain = chunk.copy()
+    for col in plain.columns:
+        if isinstance(plain[col].dtype, pd.CategoricalDtype):
+            plain[col] = plain[col].astype('string')
+    return plain
+
+
+def _read_blocks(buffer) -> Iterator[bytes]:
+    buffer.seek(0)
+    while True:
+        block = buffer.read(READ_BLOCK_BYTES)
+        if not block:
+            return
+        yield block
+
+
+WRITERS = {
+    'csv': iter_csv,
+    'xlsx': iter_xlsx,
+    'parquet': iter_parquet
+}
+
+
+def stream_export(fmt: str, chunks: Iterable[pd.DataFrame]) -> Iterator[bytes]:
+    """Dispatch to the writer for fmt ('csv', 'xlsx' or 'parquet')."""
+    return WRITERS[fmt](chunks)
@@ -0,0 +1,262 @@
+"""
+Fabrication Checker
+Deterministic claim-level diff of a tailored resume against the master resume
+"""
+
+import re
+from typing import Dict, List, Optional, Set, Tuple
+
+
+# Tools and technologies worth checking in free text, lowercased. Aliases map
+# to one canonical spelling so "k8s" and "Kubernetes" are the same claim.
+TECH_TERMS = [
+    'python', 'java', 'javascript', 'typescript', 'go', 'golang', 'rust', 'ruby', 'php', 'scala',
+    'kotlin', 'swift', 'c++', 'c#', '.net', 'r', 'sql', 'nosql', 'graphql', 'bash',
+    'react', 'angular', 'vue', 'next.js', 'node.js', 'express', 'django', 'flask', 'fastapi',
+    'spring', 'rails', 'laravel', 'pandas', 'numpy', 'pytorch', 'tensorflow', 'scikit-learn',
+    'spark', 'hadoop', 'airflow', 'dbt', 'kafka', 'rabbitmq', 'celery', 'redis', 'memcached',
+    'postgresql', 'postgres', 'mysql', 'sqlite', 'mongodb', 'dynamodb', 'cassandra', 'elasticsearch',
+    'snowflake', 'bigquery', 'redshift', 'aws', 'amazon web services', 'gcp', 'google cloud', 'azure',
+    'ec2', 's3', 'lambda', 'ecs', 'eks', 'docker', 'kubernetes', 'k8s', 'terraform', 'ansible',
+    'jenkins', 'github actions', 'gitlab ci', 'circleci', 'git', 'jira', 'confluence',
+    'prometheus', 'grafana', 'datadog', 'splunk', 'tableau', 'power bi', 'looker', 'excel',
+    'salesforce', 'hubspot', 'zendesk', 'sap', 'figma', 'selenium', 'playwright', 'pytest',
+    'jest', 'linux', 'nginx', 'grpc', 'rest', 'soap', 'oauth', 'stripe', 'twilio',
+    'openai', 'langchain', 'llm', 'machine learning', 'deep learning', 'nlp', 'computer vision'
+]
+
+ALIASES = {
+    'golang': 'go',
+    'postgres': 'postgresql',
+    'k8s': 'kubernetes',
+    'amazon web services': 'aws',
+    'google cloud': 'gcp',
+    'node': 'node.js',
+    'js': 'javascript',
+    'ts': 'typescript'
+}
+
+# Bare one-letter / common-word terms only count when written as a skill, not in prose
+PROSE_EXCLUDED = {'r', 'go', 'rest', 'lambda', 'spring', 'express', 'excel'}
+
+_TECH_PATTERN = re.compile(
+    r"(?<![\w.+#])(" + '|'.join(re.escape(t) for t in sorted(TECH_TERMS, key=len, reverse=True)) + r")(?![\w+#])",
+    re.IGNORECASE
+)
+_NUMBER_PATTERN = re.compile(
+    r"(?<![\w.])(\d+(?:,\d{3})*(?:\.\d+)?)\s*(%|percent\b|k\b|m\b|b\b|x\b|thousand\b|million\b|billion\b)?",
+    re.IGNORECASE
+)
+_DURATION_PATTERN = re.compile(
+    r"(?<![\w.])(\d+(?:\.\d+)?)\+?\s*(?:-\s*)?(years?|yrs?|months?|mos?|weeks?|days?|hours?|hrs?)\b"
+    r"(?:\s*(?:per|a|/)\s*(year|month|week|day|hour)\b)?",
+    re.IGNORECASE
+)
+
+_UNITS = {'percent': '%', 'thousand': 'k', 'million': 'm', 'billion': 'b'}
+_DURATION_UNITS = {'y': 'year', 'm': 'month', 'w': 'week', 'd': 'day', 'h': 'hour'}
+
+# Issue types that mean the tailored resume states something the master does not
+BLOCKING = {'number', 'percentage', 'duration', 'tool', 'company', 'role_changed', 'company_mention', 'invented_skill'}
+
+LABELS = {
+    'number': "Number not in master resume",
+    'percentage': "Percentage not in master resume",
+    'duration': "Duration not in master resume",
+    'tool': "Tool not in master resume",
+    'company': "Company not in master resume",
+    'role_changed': "Role details changed",
+    'company_mention': "Mentions another role's company",
+    'invented_skill': "Skill not in master resume",
+    'added_bullets': "Added bullets"
+}
+
+
+def _normalize_number(value: str) -> str:
+    number = float(value.replace(',', ''))
+    return str(int(number)) if number.is_integer() else str(number)
+
+
+def _number_claim(value: str, unit: str) -> Tuple[str, str]:
+    """('60', '%'), ('1', 'm') for 1M / 1 million, ('40000', '') for 40,000."""
+    unit = unit.lower()
+    return _normalize_number(value), _UNITS.get(unit, unit)
+
+
+def _duration_claim(value: str, unit: str, rate: str) -> Tuple[str, str, str]:
+    """('3', 'year', '') for 3 years, ('10', 'hour', 'week') for 10 hours per week."""
+    return _normalize_number(value), _DURATION_UNITS[unit[0].lower()], rate.lower()
+
+
+def _canonical(term: str) -> str:
+    term = ' '.join(term.lower().split())
+    return ALIASES.get(term, term)
+
+
+class Evidence:
+    """Claims extracted from one piece of master-resume text."""
+
+    __slots__ = ('numbers', 'percentages', 'durations', 'tools')
+
+    def __init__(self, text: str = ""):
+        self.numbers: Set[Tuple[str, str]] = set()
+        self.percentages: Set[str] = set()
+        self.durations: Set[Tuple[str, str, str]] = set()
+        self.tools: Set[str] = set()
+        if text:
+            self.add(text)
+
+    def add(self, text: str):
+        for value, unit in _NUMBER_PATTERN.findall(text):
+            number, unit = _number_claim(value, unit)
+            if unit == '%':
+                self.percentages.add(number)
+            else:
+                self.numbers.add((number, unit))
+        for value, unit, rate in _DURATION_PATTERN.findall(text):
+            self.durations.add(_duration_claim(value, unit, rate))
+        self.tools.update(_canonical(t) for t in _TECH_PATTERN.findall(text))
+
+
+class FabricationChecker:
+    """
+    Flags claims in a tailored resume that the master resume does not support.
+
+    Built once per master resume. Each tailored role is matched to its
+    master role; every bullet's numbers, percentages and durations must
+    appear in that master role, and its tools anywhere in the master
+    (bullets or skills). Companies and titles may not change, other roles'
+    companies may not be mentioned, and every tailored skill must exist
+    in the master. Pure regex + set work, well under a millisecond per
+    resume.
+    """
+
+    def __init__(self, master_resume: Dict):
+        self.roles: List[Dict] = master_resume.get('experience', [])
+
+        self.role_evidence: List[Evidence] = []
+        for role in self.roles:
+            evidence = Evidence(' '.join([role.get('title', ''), role.get('duration', '')] + role.get('bullets', [])))
+            self.role_evidence.append(evidence)
+
+        self.skills: Set[str] = set()
+        for skills in master_resume.get('skills', {}).values():
+            self.skills.update(_canonical(s) for s in skills)
+
+        self.all_evidence = Evidence()
+        for evidence in self.role_evidence:
+            self.all_evidence.numbers |= evidence.numbers
+            self.all_evidence.percentages |= evidence.percentages
+            self.all_evidence.durations |= evidence.durations
+            self.all_evidence.tools |= evidence.tools
+        self.known_tools = self.all_evidence.tools | self.skills
+
+        self.master_text = ' '.join(
+            ' '.join(role.get('bullets', [])) for role in self.roles
+        ).lower()
+
+        self._company_pattern = None
+        names = [role.get('company', '') for role in self.roles if role.get('company')]
+        if names:
+            self._company_pattern = re.compile(
+                r"\b(" + '|'.join(re.escape(n) for n in sorted(names, key=len, reverse=True)) + r")\b",
+                re.IGNORECASE
+            )
+
+    def _master_index(self, index: int, tailored_role: Dict) -> Optional[int]:
+        company = tailored_role.get('company', '').strip().lower()
+        if index < len(self.roles) and self.roles[index].get('company', '').strip().lower() == company:
+            return index
+        for i, role in enumerate(self.roles):
+            if role.get('company', '').strip().lower() == company:
+                return i
+        return None
+
+    def check(self, tailored_experience: List[Dict], tailored_skills: Optional[Dict] = None) -> List[Dict]:
+        """All unsupported claims as [{'type', 'role', 'bullet', 'value'}]."""
+
+        issues = []
+
+        for r, role in enumerate(tailored_experience):
+            m = self._master_index(r, role)
+            if m is None:
+                issues.append({'type': 'company', 'role': r, 'bullet': None, 'value': role.get('company')})
+                evidence, master = self.all_evidence, None
+            else:
+                evidence, master = self.role_evidence[m], self.roles[m]
+                for field in ('title', 'duration'):
+                    if role.get(field) and role.get(field) != master.get(field):
+                        issues.append({'type': 'role_changed', 'role': r, 'bullet': None,
+                                       'value': f"{field}: {role.get(field)}"})
+                if len(role.get('bullets', [])) > len(master.get('bullets', [])):
+                    issues.append({'type': 'added_bullets', 'role': r, 'bullet': None,
+                                   'value': f"{len(master['bullets'])} -> {len(role['bullets'])}"})
+
+            own_company = (role.get('company') or '').strip().lower()
+            for b, bullet in enumerate(role.get('bullets', [])):
+                issues.extend(self._check_bullet(r, b, bullet, evidence, own_company))
+
+        for category, skills in (tailored_skills or {}).items():
+            for skill in skills:
+                if not self._skill_supported(skill):
+                    issues.append({'type': 'invented_skill', 'role': None, 'bullet': None,
+                                   'value': f"{category}: {skill}"})
+
+        return issues
+
+    def _check_bullet(self, r: int, b: int, bullet: str, evidence: Evidence, own_company: str) -> List[Dict]:
+        issues = []
+        duration_starts = set()
+
+        for match in _DURATION_PATTERN.finditer(bullet):
+            duration_starts.add(match.start())
+            if _duration_claim(match.group(1), match.group(2), match.group(3) or '') not in evidence.durations:
+                issues.append({'type': 'duration', 'role': r, 'bullet': b, 'value': match.group(0)})
+
+        for match in _NUMBER_PATTERN.finditer(bullet):
+            if match.start() in duration_starts:
+                continue  # already checked as a duration
+            number, unit = _number_claim(match.group(1), match.group(2) or '')
+            if unit == '%':
+                if number not in evidence.percentages:
+                    issues.append({'type': 'percentage', 'role': r, 'bullet': b, 'value': f"{number}%"})
+            elif (number, unit) not in evidence.numbers:
+                issues.append({'type': 'number', 'role': r, 'bullet': b, 'value': match.group(0).strip()})
+
+        for term in _TECH_PATTERN.findall(bullet):
+            tool = _canonical(term)
+            if tool in PROSE_EXCLUDED or tool in self.known_tools:
+                continue
+            issues.append({'type': 'tool', 'role': r, 'bullet': b, 'value': term})
+
+        if self._company_pattern is not None:
+            for name in self._company_pattern.findall(bullet):
+                if name.strip().lower() != own_company:
+                    issues.append({'type': 'company_mention', 'role': r, 'bullet': b, 'value': name})
+
+        return issues
+
+    def _skill_supported(self, skill: str) -> bool:
+        canonical = _canonical(skill)
+        if canonical in self.skills or canonical in self.known_tools:
+            return True
+        # Soft skills and phrases may be grounded in bullet text rather than the skills list
+        return re.search(r"(?<!\w)" + re.escape(skill.lower()) + r"(?!\w)", self.master_text) is not None
+
+
+def summarize(issues: List[Dict]) -> Dict:
+    """validate_truthfulness-style report for a list of issues."""
+
+    blocking = [i for i in issues if i['type'] in BLOCKING]
+    return {
+        'passed': not blocking,
+        'issues': issues,
+        'warnings': [_describe(i) for i in issues]
+    }
+
+
+def _describe(issue: Dict) -> str:
+    where = f"role {issue['role']}" if issue['role'] is not None else "skills"
+    if issue['bullet'] is not None:
+        where += f", bullet {issue['bullet']}"
+    return f"{LABELS[issue['type']]} ({where}): {issue['value']}"
@@ -0,0 +1,80 @@
+"""
+Blocking I/O Offload
+Bounded thread pool for database calls and aiofiles-based file reads/writes, keeping the event loop free
+"""
+
+import asyncio
+import functools
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+import aiofiles
+
+
+class IOExecutor:
+    """
+    Runs blocking work off the event loop.
+
+    Database operations (workbook writes, SQLite commits, pandas
+    queries) go through a dedicated pool of max_workers threads, so a
+    burst of writes queues here instead of stalling health checks and
+    WebSockets, and cannot exhaust the loop's default executor. JSON
+    files are serialized on the loop (they are small) and written or
+    read through aiofiles.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or int(os.environ.get("IO_MAX_WORKERS", 4))
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="io")
+        self._lock = threading.Lock()
+
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """Await func(*args, **kwargs) executed on the I/O pool; exceptions propagate."""
+
+        with self._lock:
+            self.submitted += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._pool, functools.partial(func, *args, **kwargs)
+            )
+        except Exception:
+            with self._lock:
+                self.failed += 1
+            raise
+        finally:
+            with self._lock:
+                self.completed += 1
+
+    async def write_json(self, path: Union[str, Path], data: Any, indent: Optional[int] = 2):
+        """Write data as JSON, creating parent directories as needed."""
+
+        path = Path(path)
+        text = json.dumps(data, indent=indent)
+        if not path.parent.exists():
+            await self.run(path.parent.mkdir, parents=True, exist_ok=True)
+        async with aiofiles.open(path, 'w') as f:
+            await f.write(text)
+
+    async def read_json(self, path: Union[str, Path]) -> Any:
+        async with aiofiles.open(path, 'r') as f:
+            return json.loads(await f.read())
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'max_workers': self.max_workers,
+                'pending': self.submitted - self.completed,  # queued or running
+                'completed': self.completed,
+                'failed': self.failed
+            }
+
+    def shutdown(self, wait: bool = True):
+        self._pool.shutdown(wait=wait)
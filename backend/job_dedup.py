@@ -0,0 +1,213 @@
+"""
+Near-Duplicate Job Detection
+MinHash signatures of job postings in an LSH index, so reposts of the same role are caught before tailoring
+"""
+
+import json
+import os
+import re
+import threading
+import zlib
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+_WORD = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+# Mersenne prime modulus for the universal hash family, as in the classic MinHash construction
+_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+
+def shingles(text: str, size: int = 3) -> np.ndarray:
+    """Unique 32-bit hashes of the word n-grams in text (stable across processes)."""
+
+    words = _WORD.findall(text.lower())
+    if len(words) < size:
+        words = words + [''] * (size - len(words))
+    grams = {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+    return np.fromiter((zlib.crc32(g.encode('utf-8')) for g in grams), dtype=np.uint64, count=len(grams))
+
+
+def job_text(job_data: Dict) -> str:
+    """The parts of a posting that identify the role; URL and location are board-specific."""
+    return ' '.join([job_data.get('company', ''), job_data.get('title', ''), job_data.get('jd', '')])
+
+
+class JobDedupIndex:
+    """
+    Near-duplicate detector for job postings.
+
+    Each posting gets a MinHash signature (num_perm minimums of word
+    3-gram hashes under random affine permutations, computed as one
+    NumPy broadcast). Signatures are split into `bands` bands; postings
+    sharing any band land in the same bucket, so a query only compares
+    against its bucket-mates instead of every stored job. Candidates
+    are confirmed by estimated Jaccard similarity >= threshold.
+
+    Entries are keyed by job hash and persisted to an append-only
+    JSON-lines file (replayed on start, last write wins), alongside the
+    application id once the job has been applied to.
+    """
+
+    def __init__(self, path: Optional[str] = "cache/job_signatures.jsonl", threshold: float = 0.7,
+                 num_perm: int = 120, bands: int = 20, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+
+        self.path = Path(path) if path else None
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+
+        # Fixed seed: signatures written by earlier runs stay comparable
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, 1 << 32, size=num_perm, dtype=np.uint64)
+
+        self.signatures: Dict[str, np.ndarray] = {}
+        self.meta: Dict[str, Dict] = {}
+        self._buckets: List[Dict[bytes, set]] = [{} for _ in range(bands)]
+        self._lock = threading.Lock()
+
+        self.queries = 0
+        self.duplicates = 0
+        self.candidates = 0
+
+        if self.path:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._load()
+
+    def signature(self, job_data: Dict) -> np.ndarray:
+        """MinHash signature of a posting (uint64 array of length num_perm)."""
+
+        hashes = shingles(job_text(job_data))
+        if hashes.size == 0:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        permuted = ((hashes[:, None] * self._a + self._b) % _PRIME) & _MAX_HASH
+        return permuted.min(axis=0)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def query(self, job_data: Dict, signature: Optional[np.ndarray] = None,
+              exclude: Optional[str] = None, require: Optional[str] = None) -> Optional[Dict]:
+        """
+        Best stored near-duplicate of job_data, or None.
+        Returns {'job_hash', 'similarity', **meta}. With require, only
+        entries whose meta has that key (e.g. 'application_id') count.
+        exclude names the query's own entry (its job hash); it is only
+        skipped while its stored signature is identical to the query's,
+        so a changed posting filed under the same key is still reported.
+        """
+
+        if signature is None:
+            signature = self.signature(job_data)
+
+        with self._lock:
+            self.queries += 1
+            candidates = set()
+            for band, key in enumerate(self._band_keys(signature)):
+                candidates.update(self._buckets[band].get(key, ()))
+            if exclude in candidates and np.array_equal(self.signatures[exclude], signature):
+                candidates.discard(exclude)
+            if require is not None:
+                candidates = {c for c in candidates if self.meta[c].get(require) is not None}
+            self.candidates += len(candidates)
+
+            best, best_similarity = None, 0.0
+            for job_hash in candidates:
+                similarity = float(np.mean(self.signatures[job_hash] == signature))
+                if similarity > best_similarity:
+                    best, best_similarity = job_hash, similarity
+
+            if best is None or best_similarity < self.threshold:
+                return None
+            self.duplicates += 1
+            return {'job_hash': best, 'similarity': round(best_similarity, 3), **self.meta[best]}
+
+    def add(self, job_hash: str, job_data: Dict, signature: Optional[np.ndarray] = None, **meta):
+        """
+        Index a posting under its job hash. Re-adding replaces the
+        signature but keeps earlier meta (e.g. the application_id from
+        mark_applied) unless overridden.
+        """
+
+        if signature is None:
+            signature = self.signature(job_data)
+
+        with self._lock:
+            meta = {**self.meta.get(job_hash, {}),
+                    'company': job_data.get('company'), 'title': job_data.get('title'), **meta}
+            self._remember(job_hash, signature, meta)
+        self._append({'job_hash': job_hash, 'signature': signature.tolist(), 'meta': meta})
+
+    def mark_applied(self, job_hash: str, application_id: str):
+        """Record that a posting was applied to, so its reposts can be suppressed."""
+
+        with self._lock:
+            if job_hash not in self.meta:
+                return
+            self.meta[job_hash]['application_id'] = application_id
+            meta = dict(self.meta[job_hash])
+        self._append({'job_hash': job_hash, 'meta': meta})
+
+    def _remember(self, job_hash: str, signature: np.ndarray, meta: Dict):
+        previous = self.signatures.get(job_hash)
+        if previous is not None:
+            for band, key in enumerate(self._band_keys(previous)):
+                self._buckets[band].get(key, set()).discard(job_hash)
+
+        self.signatures[job_hash] = signature
+        self.meta[job_hash] = meta
+        for band, key in enumerate(self._band_keys(signature)):
+            self._buckets[band].setdefault(key, set()).add(job_hash)
+
+    def _append(self, entry: Dict):
+        if self.path:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + '\n')
+
+    def _load(self):
+        if not self.path.exists():
+            return
+
+        lines = 0
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                lines += 1
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn final line from a crash
+                if 'signature' in entry:
+                    signature = np.array(entry['signature'], dtype=np.uint64)
+                    if signature.size == self.num_perm:
+                        self._remember(entry['job_hash'], signature, entry['meta'])
+                elif entry['job_hash'] in self.meta:
+                    self.meta[entry['job_hash']] = entry['meta']
+
+        # Superseded lines accumulate; rewrite the file once they dominate
+        if lines > 2 * len(self.signatures):
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for job_hash, signature in self.signatures.items():
+                    f.write(json.dumps({
+                        'job_hash': job_hash, 'signature': signature.tolist(), 'meta': self.meta[job_hash]
+                    }) + '\n')
+            os.replace(tmp_path, self.path)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'jobs': len(self.signatures),
+                'queries': self.queries,
+                'duplicates': self.duplicates,
+                'avg_candidates': round(self.candidates / self.queries, 2) if self.queries else 0.0,
+                'threshold': self.threshold,
+                'num_perm': self.num_perm,
+                'bands': self.bands
+            }
@@ -0,0 +1,227 @@
+"""
+LLM Call Metrics
+Per-call latency, tokens, cost, cache hits and retries, with rolling percentiles per endpoint
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+
+TOKEN_FIELDS = ('input_tokens', 'cache_creation_input_tokens', 'cache_read_input_tokens', 'output_tokens')
+
+# USD per million tokens: (input, cache write, cache read, output)
+PRICING = {
+    'claude-sonnet-4-20250514': (3.00, 3.75, 0.30, 15.00),
+    'claude-opus-4-20250514': (15.00, 18.75, 1.50, 75.00),
+    'claude-3-5-haiku-20241022': (0.80, 1.00, 0.08, 4.00)
+}
+DEFAULT_PRICING = PRICING['claude-sonnet-4-20250514']
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+def usage_tokens(usage) -> Dict[str, int]:
+    """
+    Token counts from a response's usage object (None on error). Cache
+    fields are missing on SDKs without GA prompt caching and None when
+    caching was not used; both count as 0.
+    """
+    return {field: getattr(usage, field, 0) or 0 for field in TOKEN_FIELDS}
+
+
+def call_cost(model: str, tokens: Dict[str, int]) -> float:
+    """USD cost of one call from its token counts."""
+    prices = PRICING.get(model, DEFAULT_PRICING)
+    return sum(tokens[field] * price for field, price in zip(TOKEN_FIELDS, prices)) / 1_000_000
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class EndpointMetrics:
+    """
+    Totals and rolling latency windows for one endpoint (tailoring,
+    cover_letter, ...). Successful and failed calls are timed separately
+    so timeouts and fast rejections do not skew the success percentiles.
+    """
+
+    def __init__(self, window: int):
+        self.latencies = deque(maxlen=window)
+        self.error_latencies = deque(maxlen=window)
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.prompt_cache_hits = 0
+        self.response_cache_hits = 0
+        self.latency_sum = 0.0
+        self.error_latency_sum = 0.0
+        self.cost = 0.0
+        self.tokens = {field: 0 for field in TOKEN_FIELDS}
+
+    @property
+    def successes(self) -> int:
+        return self.calls - self.errors
+
+    def quantiles(self, errors: bool = False) -> Dict[float, float]:
+        ordered = sorted(self.error_latencies if errors else self.latencies)
+        return {q: percentile(ordered, q) for q in QUANTILES}
+
+
+class LLMMetrics:
+    """
+    Records every model call made by ResumeTailor.
+
+    Each call contributes its wall time, token counts, USD cost, whether
+    it read the prompt cache, whether it was a retry, and the hash of the
+    job that caused it. Totals are kept forever; latency percentiles
+    (p50/p95/p99) are over the last `window` successful calls per
+    endpoint, with failed calls in a window of their own.
+    Tailoring-cache hits, which skip the model, are counted separately.
+    """
+
+    def __init__(self, window: int = 1000, log_size: int = 200):
+        self.window = window
+        self.endpoints: Dict[str, EndpointMetrics] = {}
+        self.log = deque(maxlen=log_size)
+        self.started = time.time()
+        self._lock = threading.Lock()
+
+    def _endpoint(self, endpoint: str) -> EndpointMetrics:
+        metrics = self.endpoints.get(endpoint)
+        if metrics is None:
+            metrics = self.endpoints[endpoint] = EndpointMetrics(self.window)
+        return metrics
+
+    def record_call(self, endpoint: str, model: str, seconds: float, usage=None,
+                    job_hash: Optional[str] = None, attempt: int = 1, error: Optional[str] = None) -> Dict:
+        """Record one model call; usage is the response's usage object (None on error)."""
+
+        tokens = usage_tokens(usage)
+        entry = {
+            'endpoint': endpoint,
+            'job_hash': job_hash,
+            'seconds': round(seconds, 4),
+            **tokens,
+            'cost_usd': round(call_cost(model, tokens), 6),
+            'prompt_cache_hit': tokens['cache_read_input_tokens'] > 0,
+            'attempt': attempt,
+            'error': error,
+            'at': round(time.time(), 3)
+        }
+
+        with self._lock:
+            metrics = self._endpoint(endpoint)
+            metrics.calls += 1
+            if error:
+                metrics.errors += 1
+                metrics.error_latencies.append(seconds)
+                metrics.error_latency_sum += seconds
+            else:
+                metrics.latencies.append(seconds)
+                metrics.latency_sum += seconds
+            metrics.cost += entry['cost_usd']
+            for field in TOKEN_FIELDS:
+                metrics.tokens[field] += tokens[field]
+            if entry['prompt_cache_hit']:
+                metrics.prompt_cache_hits += 1
+            if attempt > 1:
+                metrics.retries += 1
+            self.log.append(entry)
+
+        return entry
+
+    def record_cache_hit(self, endpoint: str):
+        """A response served from the tailoring cache (no model call)."""
+        with self._lock:
+            self._endpoint(endpoint).response_cache_hits += 1
+
+    def summary(self, top: int = 10) -> Dict:
+        """JSON view: per-endpoint totals and percentiles, plus the most expensive recent calls."""
+
+        with self._lock:
+            endpoints = {}
+            for name, metrics in self.endpoints.items():
+                endpoints[name] = {
+                    'calls': metrics.calls,
+                    'errors': metrics.errors,
+                    'retries': metrics.retries,
+                    'prompt_cache_hits': metrics.prompt_cache_hits,
+                    'response_cache_hits': metrics.response_cache_hits,
+                    'tokens': dict(metrics.tokens),
+                    'cost_usd': round(metrics.cost, 6),
+                    'latency_seconds': self._latency_view(metrics.latencies, metrics.latency_sum,
+                                                          metrics.successes, metrics.quantiles()),
+                    'error_latency_seconds': self._latency_view(metrics.error_latencies, metrics.error_latency_sum,
+                                                                metrics.errors, metrics.quantiles(errors=True))
+                }
+            recent = list(self.log)
+
+        return {
+            'uptime_seconds': round(time.time() - self.started, 1),
+            'endpoints': endpoints,
+            'total_cost_usd': round(sum(e['cost_usd'] for e in endpoints.values()), 6),
+            'most_expensive': sorted(recent, key=lambda e: e['cost_usd'], reverse=True)[:top]
+        }
+
+    @staticmethod
+    def _latency_view(window, total: float, count: int, quantiles: Dict[float, float]) -> Dict:
+        return {
+            'mean': round(total / count, 4) if count else 0.0,
+            **{f"p{int(q * 100)}": round(v, 4) for q, v in quantiles.items()},
+            'window': len(window)
+        }
+
+    def prometheus(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+
+        lines = []
+
+        def family(name: str, kind: str, help_text: str):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        with self._lock:
+            items = sorted(self.endpoints.items())
+
+            for metric, errors, help_text in (
+                ('tailor_llm_latency_seconds', False, 'Successful model call wall time (rolling window quantiles).'),
+                ('tailor_llm_error_latency_seconds', True, 'Failed model call wall time (rolling window quantiles).')
+            ):
+                family(metric, 'summary', help_text)
+                for name, metrics in items:
+                    for q, value in metrics.quantiles(errors).items():
+                        lines.append(f'{metric}{{endpoint="{name}",quantile="{q}"}} {value:.6f}')
+                    total = metrics.error_latency_sum if errors else metrics.latency_sum
+                    count = metrics.errors if errors else metrics.successes
+                    lines.append(f'{metric}_sum{{endpoint="{name}"}} {total:.6f}')
+                    lines.append(f'{metric}_count{{endpoint="{name}"}} {count}')
+
+            for metric, attr, help_text in (
+                ('tailor_llm_calls_total', 'calls', 'Model calls.'),
+                ('tailor_llm_errors_total', 'errors', 'Model calls that raised.'),
+                ('tailor_llm_retries_total', 'retries', 'Model calls that were retries of unusable output.'),
+                ('tailor_llm_prompt_cache_hits_total', 'prompt_cache_hits', 'Model calls that read the prompt cache.'),
+                ('tailor_response_cache_hits_total', 'response_cache_hits', 'Tailorings served without a model call.')
+            ):
+                family(metric, 'counter', help_text)
+                for name, metrics in items:
+                    lines.append(f'{metric}{{endpoint="{name}"}} {getattr(metrics, attr)}')
+
+            family('tailor_llm_tokens_total', 'counter', 'Tokens by kind.')
+            for name, metrics in items:
+                for field in TOKEN_FIELDS:
+                    lines.append(f'tailor_llm_tokens_total{{endpoint="{name}",type="{field}"}} {metrics.tokens[field]}')
+
+            family('tailor_llm_cost_usd_total', 'counter', 'Estimated spend in USD.')
+            for name, metrics in items:
+                lines.append(f'tailor_llm_cost_usd_total{{endpoint="{name}"}} {metrics.cost:.6f}')
+
+        return "\n".join(lines) + "\n"
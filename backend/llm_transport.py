@@ -0,0 +1,202 @@
+"""
+LLM Transports
+Pluggable async messages.create() backends for ResumeTailor (Anthropic API or local fake model)
+"""
+
+import asyncio
+import json
+import random
+import types
+from typing import AsyncIterator, Callable, Dict, Optional, Union
+
+import anthropic
+
+
+class LLMTransport:
+    """
+    Base class for the async model backend behind ResumeTailor.
+
+    A transport takes the same keyword arguments as the SDK's
+    messages.create() and returns an object shaped like the SDK's
+    Message (content blocks with .text, and .usage token counts).
+    stream() takes the same arguments and yields text deltas (or tool
+    input JSON deltas) as they are generated, then the final Message
+    as its last item.
+    """
+
+    name = "base"
+
+    async def create(self, **request):
+        raise NotImplementedError
+
+    async def stream(self, **request) -> AsyncIterator[Union[str, object]]:
+        """
+        Fallback for transports without streaming: one delta, then the
+        message. A tool_use block is yielded as its input JSON, like the
+        input_json_delta events of a real stream.
+        """
+        message = await self.create(**request)
+        for block in message.content:
+            if getattr(block, 'type', None) == 'tool_use':
+                yield json.dumps(block.input)
+            else:
+                yield block.text
+        yield message
+
+    async def close(self):
+        pass
+
+
+class AnthropicTransport(LLMTransport):
+    """Claude Messages API through the SDK's async client."""
+
+    name = "anthropic"
+
+    def __init__(self, api_key: Optional[str] = None, client: Optional[anthropic.AsyncAnthropic] = None):
+        self.client = client or anthropic.AsyncAnthropic(api_key=api_key)
+
+    async def create(self, **request):
+        return await self.client.messages.create(**request)
+
+    async def stream(self, **request) -> AsyncIterator[Union[str, object]]:
+        async with self.client.messages.stream(**request) as stream:
+            async for event in stream:
+                if event.type != "content_block_delta":
+                    continue
+                if event.delta.type == "text_delta":
+                    yield event.delta.text
+                elif event.delta.type == "input_json_delta":
+                    yield event.delta.partial_json
+            yield await stream.get_final_message()
+
+    async def close(self):
+        await self.client.close()
+
+
+class FakeTransportError(Exception):
+    """Injected failure from FakeTransport."""
+
+
+FAKE_TAILORING = {
+    "experience": [],
+    "skills": {"technical": [], "tools": [], "soft_skills": []},
+    "alignment_score": 75,
+    "key_matches": []
+}
+
+FAKE_COVER_LETTER = "Hi, I saw the opening and think my background is a close fit. Happy to chat this week."
+
+
+class FakeTransport(LLMTransport):
+    """
+    Local stand-in model for tests and benchmarks.
+
+    Sleeps for latency (+/- jitter) seconds per call and fails a
+    failure_rate fraction of calls with FakeTransportError. Replies come
+    from reply(request) -> str; the default answers tailoring-sized
+    requests with FAKE_TAILORING and everything else with a short letter.
+    JSON replies to a forced tool_choice come back as a tool_use block,
+    anything else as text (so repair paths can be exercised).
+    stream() spreads the same latency over STREAM_CHUNK-sized deltas.
+    Usage counts ~4 characters per token and mimics prompt caching: a
+    system block marked cache_control is a cache write the first time
+    its text is seen and a cache read afterwards.
+    """
+
+    name = "fake"
+
+    STREAM_CHUNK = 40
+
+    def __init__(self, latency: float = 0.5, jitter: float = 0.0, failure_rate: float = 0.0,
+                 reply: Optional[Callable[[Dict], str]] = None, seed: int = 0):
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.reply = reply or self._default_reply
+        self._random = random.Random(seed)
+        self._cached_prefixes = set()
+
+        self.calls = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def create(self, **request):
+        self.calls += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+        try:
+            delay = self.latency + self._random.uniform(-self.jitter, self.jitter)
+            await asyncio.sleep(max(delay, 0))
+
+            if self._random.random() < self.failure_rate:
+                raise FakeTransportError("injected failure")
+
+            text = self.reply(request)
+        finally:
+            self.in_flight -= 1
+
+        return self._message(request, text)
+
+    async def stream(self, **request) -> AsyncIterator[Union[str, object]]:
+        self.calls += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+        try:
+            if self._random.random() < self.failure_rate:
+                raise FakeTransportError("injected failure")
+
+            text = self.reply(request)
+            chunks = [text[i:i + self.STREAM_CHUNK] for i in range(0, len(text), self.STREAM_CHUNK)]
+            delay = self.latency + self._random.uniform(-self.jitter, self.jitter)
+            for chunk in chunks:
+                await asyncio.sleep(max(delay, 0) / len(chunks))
+                yield chunk
+        finally:
+            self.in_flight -= 1
+
+        yield self._message(request, text)
+
+    def _message(self, request: Dict, text: str):
+        """Message for a reply; JSON replies to a forced tool call come back as tool_use."""
+
+        block = types.SimpleNamespace(type="text", text=text)
+        tool_choice = request.get("tool_choice") or {}
+        if tool_choice.get("type") == "tool":
+            try:
+                block = types.SimpleNamespace(type="tool_use", name=tool_choice["name"], input=json.loads(text))
+            except json.JSONDecodeError:
+                pass
+
+        return types.SimpleNamespace(content=[block], usage=self._usage(request, text))
+
+    def _usage(self, request: Dict, text: str):
+        usage = types.SimpleNamespace(
+            input_tokens=len(json.dumps(request.get("messages", []))) // 4,
+            cache_creation_input_tokens=0,
+            cache_read_input_tokens=0,
+            output_tokens=len(text) // 4
+        )
+
+        system = request.get("system") or []
+        if isinstance(system, str):
+            system = [{"type": "text", "text": system}]
+
+        for block in system:
+            tokens = len(block["text"]) // 4
+            if "cache_control" not in block:
+                usage.input_tokens += tokens
+            elif block["text"] in self._cached_prefixes:
+                usage.cache_read_input_tokens += tokens
+            else:
+                self._cached_prefixes.add(block["text"])
+                usage.cache_creation_input_tokens += tokens
+
+        return usage
+
+    @staticmethod
+    def _default_reply(request: Dict) -> str:
+        if request.get("max_tokens", 0) >= 1000:
+            return json.dumps(FAKE_TAILORING)
+        return FAKE_COVER_LETTER
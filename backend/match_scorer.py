@@ -0,0 +1,156 @@
+"""
+Local Job Match Scorer
+BM25 ranking of job postings against the master resume, computed with NumPy before any LLM call
+"""
+
+import re
+from collections import Counter
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have in is it its of on or our that the their this to
+was we were will with you your who what when where which while within into across over per
+using used use work working team teams role experience years year strong ability etc
+""".split())
+
+# Resume skills say more about fit than words that happen to appear in bullets
+SKILL_WEIGHT = 2.0
+BULLET_WEIGHT = 1.0
+
+# Share of the 0-100 match that comes from covering the posting's key requirements
+REQUIREMENT_WEIGHT = 0.7
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens; keeps tech spellings like c++, c#, node.js."""
+    return [t for t in TOKEN_PATTERN.findall(text.lower()) if t not in STOPWORDS]
+
+
+class MatchScorer:
+    """
+    Ranks many job postings against one master resume.
+
+    The resume's skills and bullets form the BM25 query (skills weighted
+    higher); each posting's title, JD and key requirements form a
+    document. Term counts for all postings are built as one
+    (jobs x resume-terms) matrix, so scoring thousands of postings is a
+    handful of array operations.
+
+    match is a 0-100 figure comparable to the UI's minMatch filter:
+    70% is how much of each key requirement the resume covers, 30% is
+    the BM25 score relative to the best posting in the batch.
+    """
+
+    def __init__(self, master_resume: Dict, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+
+        weights: Dict[str, float] = {}
+        for skills in master_resume.get('skills', {}).values():
+            for skill in skills:
+                for token in tokenize(skill):
+                    weights[token] = max(weights.get(token, 0.0), SKILL_WEIGHT)
+        for exp in master_resume.get('experience', []):
+            for token in tokenize(' '.join([exp.get('title', '')] + exp.get('bullets', []))):
+                weights.setdefault(token, BULLET_WEIGHT)
+
+        self.terms = list(weights)
+        self.term_ids = {term: i for i, term in enumerate(self.terms)}
+        self.query_weights = np.array([weights[t] for t in self.terms], dtype=np.float64)
+
+    def _term_counts(self, jobs: List[Dict]):
+        """Resume-term count matrix and document lengths for a batch of postings."""
+
+        rows, cols = [], []
+        lengths = np.zeros(len(jobs), dtype=np.float64)
+
+        for i, job in enumerate(jobs):
+            text = ' '.join([job.get('title', ''), job.get('jd', '')] + job.get('key_requirements', []))
+            tokens = tokenize(text)
+            lengths[i] = len(tokens)
+            for token in tokens:
+                term_id = self.term_ids.get(token)
+                if term_id is not None:
+                    rows.append(i)
+                    cols.append(term_id)
+
+        counts = np.zeros((len(jobs), len(self.terms)), dtype=np.float64)
+        np.add.at(counts, (np.array(rows, dtype=np.intp), np.array(cols, dtype=np.intp)), 1.0)
+        return counts, lengths
+
+    def _requirement_coverage(self, jobs: List[Dict]) -> np.ndarray:
+        """Mean fraction of each key requirement's tokens found in the resume."""
+
+        coverage = np.ones(len(jobs), dtype=np.float64)
+        for i, job in enumerate(jobs):
+            fractions = []
+            for requirement in job.get('key_requirements', []):
+                tokens = tokenize(requirement)
+                if tokens:
+                    fractions.append(sum(t in self.term_ids for t in tokens) / len(tokens))
+            if fractions:
+                coverage[i] = sum(fractions) / len(fractions)
+        return coverage
+
+    def score(self, jobs: List[Dict]) -> Dict[str, np.ndarray]:
+        """BM25 score, 0-100 match and per-term contributions for every posting."""
+
+        if not jobs or not self.terms:
+            empty = np.zeros(len(jobs))
+            return {'bm25': empty, 'match': empty, 'contributions': np.zeros((len(jobs), 0))}
+
+        counts, lengths = self._term_counts(jobs)
+        n_docs = len(jobs)
+
+        doc_freq = (counts > 0).sum(axis=0)
+        idf = np.log1p((n_docs - doc_freq + 0.5) / (doc_freq + 0.5))
+
+        avg_length = lengths.mean() or 1.0
+        norm = self.k1 * (1 - self.b + self.b * lengths / avg_length)
+        saturated = counts * (self.k1 + 1) / (counts + norm[:, None])
+
+        contributions = saturated * (idf * self.query_weights)
+        bm25 = contributions.sum(axis=1)
+
+        best = bm25.max()
+        relative = bm25 / best if best > 0 else np.zeros(n_docs)
+        coverage = self._requirement_coverage(jobs)
+        match = np.rint(100 * (REQUIREMENT_WEIGHT * coverage + (1 - REQUIREMENT_WEIGHT) * relative))
+
+        return {'bm25': bm25, 'match': match, 'contributions': contributions}
+
+    def rank(self, jobs: List[Dict], top_k: Optional[int] = None,
+             min_match: float = 0, matched_terms: int = 5) -> List[Dict]:
+        """
+        Postings ordered best-first as {'index', 'company', 'title', 'score',
+        'match', 'matched_terms'}, keeping only match >= min_match and at
+        most top_k entries. index refers to the position in jobs.
+        """
+
+        scores = self.score(jobs)
+        bm25, match = scores['bm25'], scores['match']
+
+        keep = np.flatnonzero(match >= min_match)
+        order = keep[np.lexsort((-bm25[keep], -match[keep]))]
+        if top_k is not None:
+            order = order[:top_k]
+
+        ranked = []
+        for i in order:
+            row = scores['contributions'][i]
+            top_terms = [self.terms[t] for t in np.argsort(-row)[:matched_terms] if row[t] > 0]
+            ranked.append({
+                'index': int(i),
+                'company': jobs[i].get('company'),
+                'title': jobs[i].get('title'),
+                'score': round(float(bm25[i]), 3),
+                'match': int(match[i]),
+                'matched_terms': top_terms
+            })
+
+        return ranked
@@ -0,0 +1,146 @@
+"""
+Pulse Broadcaster
+One shared publisher for /ws/pulse: computes pulse state once per tick and fans out only what changed
+"""
+
+import asyncio
+import json
+import logging
+from typing import Callable, Dict, Optional, Set
+
+
+class PulseSubscriber:
+    """One connected client: a bounded queue of encoded messages."""
+
+    def __init__(self, queue_size: int):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped = False
+
+    async def get(self) -> Optional[str]:
+        """Next message, or None once the client has been dropped for falling behind."""
+        return await self.queue.get()
+
+
+class PulseBroadcaster:
+    """
+    Shared pulse publisher.
+
+    A single task calls source() every `interval` seconds, or right away
+    after notify() (batch reset, a submission, ...), diffs the result
+    against the previous snapshot and, if anything changed, encodes one
+    message that every subscriber receives. New subscribers first get
+    the full snapshot; after that only {'type': 'diff', 'changes': {...}}
+    with the fields whose values changed. Work per tick is one source()
+    call and one json.dumps regardless of how many dashboards are open.
+
+    Each subscriber has a bounded queue; a client that lets queue_size
+    messages pile up is dropped (its queue yields None) instead of
+    buffering without limit or slowing everyone else down.
+    """
+
+    def __init__(self, source: Callable[[], Dict], interval: float = 2.0, queue_size: int = 16):
+        self.source = source
+        self.interval = interval
+        self.queue_size = queue_size
+
+        self.logger = logging.getLogger(__name__)
+        self.subscribers: Set[PulseSubscriber] = set()
+        self.snapshot: Optional[Dict] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+        self.ticks = 0
+        self.published = 0
+        self.dropped = 0
+        self.bytes_sent = 0
+
+    def start(self):
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        for subscriber in list(self.subscribers):
+            self._drop(subscriber, slow=False)
+
+    def notify(self):
+        """An emulator event happened: publish on the next loop iteration instead of waiting for the tick."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def current(self) -> Dict:
+        """Latest pulse state (computed now if the publisher has not ticked yet)."""
+        if self.snapshot is None:
+            self.snapshot = self.source()
+        return self.snapshot
+
+    def subscribe(self) -> PulseSubscriber:
+        subscriber = PulseSubscriber(self.queue_size)
+        subscriber.queue.put_nowait(json.dumps({'type': 'snapshot', 'data': self.current()}))
+        self.subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: PulseSubscriber):
+        self.subscribers.discard(subscriber)
+
+    async def _run(self):
+        while True:
+            try:
+                self.publish()
+            except Exception as e:
+                self.logger.error(f"Pulse publish failed: {e}")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    def publish(self):
+        """Compute the pulse once and send the changed fields to every subscriber."""
+
+        self.ticks += 1
+        state = self.source()
+        previous, self.snapshot = self.snapshot, state
+
+        if previous is None:
+            changes = state
+        else:
+            changes = {key: value for key, value in state.items() if previous.get(key) != value}
+            changes.update({key: None for key in previous.keys() - state.keys()})
+        if not changes or not self.subscribers:
+            return
+
+        message = json.dumps({'type': 'diff', 'changes': changes})
+        self.published += 1
+        for subscriber in list(self.subscribers):
+            try:
+                subscriber.queue.put_nowait(message)
+                self.bytes_sent += len(message)
+            except asyncio.QueueFull:
+                self._drop(subscriber)
+
+    def _drop(self, subscriber: PulseSubscriber, slow: bool = True):
+        """Disconnect a client (one that stopped keeping up, or all on shutdown); its backlog is discarded."""
+
+        self.subscribers.discard(subscriber)
+        if subscriber.dropped:
+            return
+        subscriber.dropped = True
+        if slow:
+            self.dropped += 1
+        while not subscriber.queue.empty():
+            subscriber.queue.get_nowait()
+        subscriber.queue.put_nowait(None)
+
+    def stats(self) -> Dict:
+        return {
+            'subscribers': len(self.subscribers),
+            'ticks': self.ticks,
+            'published': self.published,
+            'dropped': self.dropped,
+            'bytes_sent': self.bytes_sent,
+            'interval_seconds': self.interval
+        }
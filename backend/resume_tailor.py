@@ -4,12 +4,36 @@ Uses Claude API to rephrase resume bullets while maintaining truthfulness
 """
 
 import anthropic
+import asyncio
 import json
+import logging
 import os
-from typing import Dict, List, Optional
+import time
+from collections import deque
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from datetime import datetime
 import hashlib
 
+from fabrication_checker import FabricationChecker, summarize
+from llm_metrics import TOKEN_FIELDS, LLMMetrics, usage_tokens
+from llm_transport import AnthropicTransport, LLMTransport
+from stream_parser import ExperienceStreamParser
+from structured_output import (
+    BULLET_REWRITE_TOOL,
+    BULLET_REWRITE_TOOL_NAME,
+    TAILORING_TOOL,
+    TAILORING_TOOL_NAME,
+    MalformedOutputError,
+    OutputStats,
+    parse_tailoring_response
+)
+from tailoring_cache import BulletCache, TailoringCache
+
+
+def compact_json(value) -> str:
+    """Whitespace-free JSON for prompt bodies (fewer tokens than indent=2)."""
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False)
+
 
 class ResumeTailor:
     """
@@ -17,11 +41,43 @@ class ResumeTailor:
     using Claude API with strict truthfulness constraints.
     """
     
-    def __init__(self, api_key: Optional[str] = None):
-        self.client = anthropic.Anthropic(
-            api_key=api_key or os.environ.get("ANTHROPIC_API_KEY")
-        )
+    def __init__(self, api_key: Optional[str] = None, cache: Optional[TailoringCache] = None,
+                 max_concurrency: Optional[int] = None, transport: Optional[LLMTransport] = None,
+                 bullet_cache: Optional[BulletCache] = None):
+        api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
+        self.client = anthropic.Anthropic(api_key=api_key)
+        
+        # Async model calls go through a pluggable transport (FakeTransport in tests)
+        self.transport = transport or AnthropicTransport(api_key=api_key)
         self.model = "claude-sonnet-4-20250514"
+        self.logger = logging.getLogger(__name__)
+        
+        # Upper bound on in-flight model calls from the async path
+        self.max_concurrency = max_concurrency or int(os.environ.get("TAILOR_MAX_CONCURRENCY", 4))
+        self._llm_slots = asyncio.Semaphore(self.max_concurrency)
+        
+        # Identical (JD, requirements, master resume) inputs skip the model call
+        self.cache = cache if cache is not None else TailoringCache()
+        
+        # Jobs sharing a requirement set reuse earlier rewrites of the same bullet
+        self.bullet_cache = bullet_cache if bullet_cache is not None else BulletCache()
+        
+        # (version, master resume, text) of the cacheable prompt prefix
+        self._prefix = None
+        
+        # (master resume, FabricationChecker) built once per master
+        self._checker = None
+        
+        # Malformed output is repaired locally; only unrepairable output is re-requested
+        self.max_attempts = 2
+        self.output_stats = OutputStats()
+        
+        # Per-call token counts (input / cache write / cache read / output)
+        self.token_log = deque(maxlen=1000)
+        self.token_totals = {'calls': 0, **{field: 0 for field in TOKEN_FIELDS}}
+        
+        # Latency, cost, retries and job hash of every model call, per endpoint
+        self.metrics = LLMMetrics()
         
     def load_master_resume(self, resume_path: str) -> Dict:
         """Load the master resume JSON structure."""
@@ -29,9 +85,15 @@ class ResumeTailor:
             return json.load(f)
     
     def generate_job_hash(self, job_data: Dict) -> str:
-        """Generate unique hash for job to track tailored versions."""
-        job_string = f"{job_data['company']}{job_data['title']}{job_data['jd'][:100]}"
-        return hashlib.md5(job_string.encode()).hexdigest()[:8]
+        """
+        Generate unique hash for job to track tailored versions.
+        Covers the whole job description (whitespace-normalized), so
+        postings that only differ past the opening lines get their own
+        version ID and file.
+        """
+        fields = (job_data['company'], job_data['title'], job_data['jd'])
+        job_string = '\x00'.join(' '.join(str(field).split()) for field in fields)
+        return hashlib.sha256(job_string.encode()).hexdigest()[:16]
     
     def tailor_resume(self, master_resume: Dict, job_data: Dict) -> Dict:
         """
@@ -50,19 +112,343 @@ class ResumeTailor:
             Tailored resume with rephrased bullets and metadata
         """
         
-        prompt = self._build_tailoring_prompt(master_resume, job_data)
+        cache_key = self.cache.make_key(master_resume, job_data, self.model)
+        tailored_content = self.cache.get(cache_key)
+        cache_hit = tailored_content is not None
         
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=4000,
-            temperature=0.3,  # Lower temp for consistency
-            messages=[{
-                "role": "user",
-                "content": prompt
-            }]
+        if cache_hit:
+            self.metrics.record_cache_hit('tailoring')
+        else:
+            job_hash = self.generate_job_hash(job_data)
+            plan = self._plan_bullets(master_resume, job_data)
+            request = self._tailoring_request(master_resume, job_data, plan)
+            for attempt in range(1, self.max_attempts + 1):
+                response = self._create('tailoring', request, job_hash, attempt)
+                output = self._accept_tailoring(response, attempt, request["tool_choice"]["name"])
+                if output is not None:
+                    break
+            
+            tailored_content = self._complete_tailoring(master_resume, job_data, output, plan)
+            self.cache.set(cache_key, tailored_content)
+        
+        return self._assemble_tailored_resume(master_resume, job_data, tailored_content, cache_hit)
+    
+    async def tailor_resume_async(self, master_resume: Dict, job_data: Dict) -> Dict:
+        """
+        Non-blocking tailor_resume() for use inside the event loop.
+        Model calls go through the transport and are capped at
+        max_concurrency in flight.
+        """
+        
+        cache_key = self.cache.make_key(master_resume, job_data, self.model)
+        tailored_content = self.cache.get(cache_key)
+        cache_hit = tailored_content is not None
+        
+        if cache_hit:
+            self.metrics.record_cache_hit('tailoring')
+        else:
+            job_hash = self.generate_job_hash(job_data)
+            plan = self._plan_bullets(master_resume, job_data)
+            request = self._tailoring_request(master_resume, job_data, plan)
+            for attempt in range(1, self.max_attempts + 1):
+                response = await self._create_async('tailoring', request, job_hash, attempt)
+                output = self._accept_tailoring(response, attempt, request["tool_choice"]["name"])
+                if output is not None:
+                    break
+            
+            tailored_content = self._complete_tailoring(master_resume, job_data, output, plan)
+            self.cache.set(cache_key, tailored_content)
+        
+        return self._assemble_tailored_resume(master_resume, job_data, tailored_content, cache_hit)
+    
+    async def tailor_resume_stream(self, master_resume: Dict, job_data: Dict) -> AsyncIterator[Dict]:
+        """
+        Streaming tailor_resume_async().
+        
+        Yields {'type': 'role', 'index', 'role'} as soon as each tailored
+        experience entry has been generated, then one
+        {'type': 'complete', 'tailored_resume'} once the whole response
+        is parsed. Cache hits replay the cached roles immediately.
+        """
+        
+        cache_key = self.cache.make_key(master_resume, job_data, self.model)
+        tailored_content = self.cache.get(cache_key)
+        cache_hit = tailored_content is not None
+        
+        if cache_hit:
+            self.metrics.record_cache_hit('tailoring_stream')
+            for index, role in enumerate(tailored_content["experience"]):
+                yield {'type': 'role', 'index': index, 'role': role}
+        else:
+            job_hash = self.generate_job_hash(job_data)
+            request = self._tailoring_request(master_resume, job_data)
+            roles: asyncio.Queue = asyncio.Queue()
+            
+            # The slot is held only while the model streams; parsed roles are
+            # buffered, so a slow SSE client never keeps a concurrency slot
+            upstream = asyncio.ensure_future(self._stream_roles(request, job_hash, roles))
+            try:
+                index = 0
+                while True:
+                    role = await roles.get()
+                    if role is None:
+                        break
+                    yield {'type': 'role', 'index': index, 'role': role}
+                    index += 1
+                response = await upstream
+            finally:
+                # Client went away mid-stream: stop generating
+                upstream.cancel()
+            
+            # Roles have already been sent, so a malformed stream is not re-requested
+            output = self._accept_tailoring(response, self.max_attempts, TAILORING_TOOL_NAME)
+            tailored_content = self._complete_tailoring(master_resume, job_data, output)
+            self.cache.set(cache_key, tailored_content)
+        
+        yield {
+            'type': 'complete',
+            'tailored_resume': self._assemble_tailored_resume(master_resume, job_data, tailored_content, cache_hit)
+        }
+    
+    async def _stream_roles(self, request: Dict, job_hash: str, roles: asyncio.Queue):
+        """
+        Stream one tailoring call inside a concurrency slot, putting each
+        completed experience entry on roles and None when done. Returns
+        the final message.
+        """
+        
+        parser = ExperienceStreamParser()
+        response = None
+        try:
+            async with self._llm_slots:
+                started = time.perf_counter()
+                try:
+                    async for chunk in self.transport.stream(**request):
+                        if not isinstance(chunk, str):
+                            response = chunk
+                            continue
+                        for role in parser.feed(chunk):
+                            roles.put_nowait(role)
+                except Exception as e:
+                    self._record_usage('tailoring_stream', None, time.perf_counter() - started, job_hash, error=e)
+                    raise
+                self._record_usage('tailoring_stream', response, time.perf_counter() - started, job_hash)
+        finally:
+            roles.put_nowait(None)
+        
+        return response
+    
+    async def tailor_with_cover_letter(self, master_resume: Dict, job_data: Dict,
+                                       grounded: bool = False) -> Tuple[Dict, str]:
+        """
+        Tailored resume and cover letter for one job.
+        
+        By default both calls are dispatched together and the letter is
+        written from the master experience, so end-to-end latency is the
+        slower of the two rather than their sum. With grounded=True the
+        letter waits for the tailored bullets and is written from those.
+        
+        If either call fails the other is cancelled (no tokens are spent
+        on a result that will be discarded) and the first error is raised.
+        """
+        
+        if grounded:
+            tailored = await self.tailor_resume_async(master_resume, job_data)
+            cover_letter = await self.generate_cover_letter_async(tailored, job_data)
+            return tailored, cover_letter
+        
+        tasks = [
+            asyncio.ensure_future(self.tailor_resume_async(master_resume, job_data)),
+            asyncio.ensure_future(self.generate_cover_letter_async(master_resume, job_data))
+        ]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            # Also runs when this coroutine is itself cancelled
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        errors = [task.exception() for task in tasks if not task.cancelled() and task.exception()]
+        for error in errors[1:]:
+            self.logger.error(f"Concurrent tailoring call also failed: {error}")
+        if errors:
+            raise errors[0]
+        
+        return tasks[0].result(), tasks[1].result()
+    
+    async def tailor_bulk(self, master_resume: Dict, jobs: List[Dict]) -> AsyncIterator[Dict]:
+        """
+        Tailor many jobs at once, yielding results as they complete.
+        
+        All jobs are scheduled up front and share the max_concurrency
+        limit. Each job yields one {'type': 'result', ...} or
+        {'type': 'error', ...} event (a failure never aborts the batch),
+        followed by a final {'type': 'summary', ...} with throughput.
+        """
+        
+        async def run(index: int, job_data: Dict) -> Dict:
+            event = {'index': index, 'company': job_data.get('company'), 'title': job_data.get('title')}
+            try:
+                event['tailored_resume'] = await self.tailor_resume_async(master_resume, job_data)
+                event['type'] = 'result'
+            except Exception as e:
+                event['type'] = 'error'
+                event['error'] = f"{type(e).__name__}: {e}"
+            return event
+        
+        started = time.perf_counter()
+        tasks = [asyncio.ensure_future(run(i, job)) for i, job in enumerate(jobs)]
+        succeeded = failed = 0
+        
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                event = await next_done
+                if event['type'] == 'result':
+                    succeeded += 1
+                else:
+                    failed += 1
+                yield event
+        finally:
+            # Consumer went away (e.g. client disconnected): stop outstanding calls
+            for task in tasks:
+                task.cancel()
+        
+        elapsed = time.perf_counter() - started
+        yield {
+            'type': 'summary',
+            'total': len(jobs),
+            'succeeded': succeeded,
+            'failed': failed,
+            'elapsed_seconds': round(elapsed, 3),
+            'jobs_per_minute': round(len(jobs) / elapsed * 60, 1) if elapsed > 0 else 0.0,
+            'max_concurrency': self.max_concurrency
+        }
+    
+    def _accept_tailoring(self, response, attempt: int, tool_name: str) -> Optional[Dict]:
+        """
+        Parse (and if needed locally repair) one tailoring response.
+        Returns None when the output is unusable and another attempt is
+        allowed; raises MalformedOutputError on the last attempt.
+        """
+        
+        try:
+            tailored_content, repaired = parse_tailoring_response(response, tool_name)
+        except MalformedOutputError:
+            will_retry = attempt < self.max_attempts
+            tokens = sum(usage_tokens(getattr(response, 'usage', None)).values())
+            self.output_stats.failure(tokens, will_retry)
+            if will_retry:
+                return None
+            raise
+        
+        self.output_stats.success(repaired)
+        return tailored_content
+    
+    def _plan_bullets(self, master_resume: Dict, job_data: Dict) -> Dict:
+        """
+        Split the master bullets (ids like "r0b2" = role 0, bullet 2) into
+        ones with a cached rewrite for this requirement set and ones the
+        model still has to write.
+        """
+        
+        requirements = BulletCache.requirement_key(job_data.get('key_requirements', []))
+        cached, pending = {}, {}
+        
+        for i, role in enumerate(master_resume['experience']):
+            for j, bullet in enumerate(role['bullets']):
+                bullet_id = f"r{i}b{j}"
+                rewrite = self.bullet_cache.get(bullet, requirements)
+                if rewrite is None:
+                    pending[bullet_id] = bullet
+                else:
+                    cached[bullet_id] = rewrite
+        
+        return {'requirements': requirements, 'cached': cached, 'pending': pending}
+    
+    def _complete_tailoring(self, master_resume: Dict, job_data: Dict, output: Dict,
+                            plan: Optional[Dict] = None) -> Dict:
+        """
+        Turn validated model output into tailoring content. Partial
+        (bullet rewrite) output is merged with the cached rewrites into a
+        full experience list, and roles missing from a truncated response
+        are taken unchanged from the master; fresh rewrites are added to
+        the bullet cache.
+        """
+        
+        if 'rewrites' in output:
+            rewrites = output.pop('rewrites')
+            experience = []
+            for i, role in enumerate(master_resume['experience']):
+                bullets = []
+                for j, bullet in enumerate(role['bullets']):
+                    bullet_id = f"r{i}b{j}"
+                    # A bullet the model skipped stays as written in the master
+                    bullets.append(plan['cached'].get(bullet_id) or rewrites.get(bullet_id) or bullet)
+                experience.append({
+                    'company': role.get('company'),
+                    'title': role.get('title'),
+                    'duration': role.get('duration'),
+                    'bullets': bullets
+                })
+            output['experience'] = experience
+        
+        # Roles and skill groups a truncated response never reached stay as in the master
+        output['experience'].extend(
+            {'company': role.get('company'), 'title': role.get('title'),
+             'duration': role.get('duration'), 'bullets': list(role['bullets'])}
+            for role in master_resume['experience'][len(output['experience']):]
         )
+        for group, values in master_resume.get('skills', {}).items():
+            output['skills'].setdefault(group, list(values))
         
-        tailored_content = json.loads(response.content[0].text)
+        requirements = plan['requirements'] if plan else \
+            BulletCache.requirement_key(job_data.get('key_requirements', []))
+        fresh = {}
+        for role, tailored_role in zip(master_resume['experience'], output['experience']):
+            # Pairs are only trusted when the model kept one rewrite per bullet
+            if len(role['bullets']) == len(tailored_role['bullets']):
+                fresh.update(
+                    (original, rewrite) for original, rewrite in zip(role['bullets'], tailored_role['bullets'])
+                    if rewrite != original
+                )
+        self.bullet_cache.set_many(fresh, requirements)
+        
+        return output
+    
+    def _tailoring_request(self, master_resume: Dict, job_data: Dict, plan: Optional[Dict] = None) -> Dict:
+        """
+        messages.create() arguments for a tailoring call. Output is
+        forced through a tool schema: the full submit_tailored_resume, or
+        submit_bullet_rewrites for only the uncached bullets when the
+        plan has cached rewrites. The static prefix is a system block
+        marked for prompt caching; only the job-specific message varies.
+        """
+        
+        pending = plan['pending'] if plan and plan['cached'] else None
+        tool_name = TAILORING_TOOL_NAME if pending is None else BULLET_REWRITE_TOOL_NAME
+        
+        return {
+            "model": self.model,
+            "max_tokens": 4000,
+            "temperature": 0.3,  # Lower temp for consistency
+            # Both tools are always listed so the cached prefix stays identical
+            "tools": [TAILORING_TOOL, BULLET_REWRITE_TOOL],
+            "tool_choice": {"type": "tool", "name": tool_name},
+            "system": [{
+                "type": "text",
+                "text": self._tailoring_prefix(master_resume),
+                "cache_control": {"type": "ephemeral"}
+            }],
+            "messages": [{
+                "role": "user",
+                "content": self._build_tailoring_prompt(job_data, pending)
+            }]
+        }
+    
+    def _assemble_tailored_resume(self, master_resume: Dict, job_data: Dict,
+                                  tailored_content: Dict, cache_hit: bool = False) -> Dict:
+        """Merge model output into the master resume and add metadata."""
         
         # Add metadata
         tailored_resume = {
@@ -74,16 +460,27 @@ class ResumeTailor:
                 "company": job_data["company"],
                 "title": job_data["title"],
                 "tailored_date": datetime.now().isoformat(),
-                "master_resume_version": master_resume.get("version", "1.0")
+                "master_resume_version": master_resume.get("version", "1.0"),
+                "alignment_score": tailored_content.get("alignment_score"),
+                "key_matches": tailored_content.get("key_matches", []),
+                "cache_hit": cache_hit
             }
         }
         
         return tailored_resume
     
-    def _build_tailoring_prompt(self, master_resume: Dict, job_data: Dict) -> str:
-        """Build the LLM prompt for resume tailoring."""
+    def _tailoring_prefix(self, master_resume: Dict) -> str:
+        """
+        Static part of the tailoring prompt: rules, master resume and
+        output schema. Identical for every job, so it is sent as a cached
+        system block and only rebuilt when the master resume changes.
+        """
+        
+        version = master_resume.get('version')
+        if self._prefix is not None and self._prefix[0] == version and self._prefix[1] is master_resume:
+            return self._prefix[2]
         
-        return f"""You are an expert resume writer. Your task is to rephrase resume bullet points to align with a specific job description while maintaining 100% TRUTHFULNESS.
+        prefix = f"""You are an expert resume writer. Your task is to rephrase resume bullet points to align with a specific job description while maintaining 100% TRUTHFULNESS.
 
 CRITICAL RULES:
 1. NEVER add skills, achievements, or experiences that aren't in the original resume
@@ -92,7 +489,37 @@ CRITICAL RULES:
 4. Maintain the same level of impact and specificity
 5. Use action verbs that match the JD's language
 
-TARGET JOB:
+MASTER RESUME EXPERIENCE:
+{compact_json(master_resume['experience'])}
+
+MASTER RESUME SKILLS:
+{compact_json(master_resume['skills'])}
+
+OUTPUT:
+Submit the result with the tool named in the task, including the tailored skills, an alignment_score from 0-100 and the key requirements you matched."""
+        
+        self._prefix = (version, master_resume, prefix)
+        return prefix
+    
+    def _build_tailoring_prompt(self, job_data: Dict, pending: Optional[Dict] = None) -> str:
+        """
+        Build the per-job part of the tailoring prompt. With pending
+        ({bullet id: original}), only those bullets are to be rewritten.
+        """
+        
+        if pending is None:
+            task = (f"Rephrase the experience bullets and skills to highlight relevance to this JD. "
+                    f"Use the company's terminology where possible. Submit every role in the same order, "
+                    f"each with one rewrite per original bullet in the original order, with the "
+                    f"{TAILORING_TOOL_NAME} tool.")
+        else:
+            listed = '\n'.join(f"[{bullet_id}] {bullet}" for bullet_id, bullet in pending.items()) or "(none)"
+            task = (f"The other bullets already have tailored versions. Rephrase ONLY the bullets below "
+                    f"to highlight relevance to this JD, using the company's terminology where possible, "
+                    f"and submit them by id with the {BULLET_REWRITE_TOOL_NAME} tool.\n\n"
+                    f"BULLETS TO REWRITE:\n{listed}")
+        
+        return f"""TARGET JOB:
 Company: {job_data['company']}
 Position: {job_data['title']}
 
@@ -100,41 +527,95 @@ JOB DESCRIPTION:
 {job_data['jd']}
 
 KEY REQUIREMENTS TO MATCH:
-{json.dumps(job_data.get('key_requirements', []), indent=2)}
-
-MASTER RESUME EXPERIENCE:
-{json.dumps(master_resume['experience'], indent=2)}
-
-MASTER RESUME SKILLS:
-{json.dumps(master_resume['skills'], indent=2)}
+{compact_json(job_data.get('key_requirements', []))}
 
 TASK:
-Rephrase the experience bullets and skills to highlight relevance to this JD. Use the company's terminology where possible.
-
-OUTPUT FORMAT (JSON only, no markdown):
-{{
-  "experience": [
-    {{
-      "company": "...",
-      "title": "...",
-      "duration": "...",
-      "bullets": ["rephrased bullet 1", "rephrased bullet 2", ...]
-    }}
-  ],
-  "skills": {{
-    "technical": ["skill1", "skill2"],
-    "tools": ["tool1", "tool2"],
-    "soft_skills": ["skill1", "skill2"]
-  }},
-  "alignment_score": 85,
-  "key_matches": ["matched requirement 1", "matched requirement 2"]
-}}
-
-Return ONLY valid JSON."""
+{task}"""
+    
+    def _create(self, endpoint: str, request: Dict, job_hash: str, attempt: int = 1):
+        """Timed synchronous model call."""
+        
+        started = time.perf_counter()
+        try:
+            response = self.client.messages.create(**request)
+        except Exception as e:
+            self._record_usage(endpoint, None, time.perf_counter() - started, job_hash, attempt, e)
+            raise
+        self._record_usage(endpoint, response, time.perf_counter() - started, job_hash, attempt)
+        return response
+    
+    async def _create_async(self, endpoint: str, request: Dict, job_hash: str, attempt: int = 1):
+        """Timed transport call inside the concurrency limit (time spent queued is not counted)."""
+        
+        async with self._llm_slots:
+            started = time.perf_counter()
+            try:
+                response = await self.transport.create(**request)
+            except Exception as e:
+                self._record_usage(endpoint, None, time.perf_counter() - started, job_hash, attempt, e)
+                raise
+        self._record_usage(endpoint, response, time.perf_counter() - started, job_hash, attempt)
+        return response
+    
+    def _record_usage(self, kind: str, response, seconds: float, job_hash: str,
+                      attempt: int = 1, error: Optional[Exception] = None):
+        """Keep per-call token counts so prompt-cache savings are measurable, and feed the call metrics."""
+        
+        usage = getattr(response, 'usage', None)
+        self.metrics.record_call(
+            kind, self.model, seconds, usage, job_hash, attempt,
+            error=f"{type(error).__name__}: {error}" if error is not None else None
+        )
+        if usage is None:
+            return
+        
+        entry = {'kind': kind, 'job_hash': job_hash, **usage_tokens(usage)}
+        for field in TOKEN_FIELDS:
+            self.token_totals[field] += entry[field]
+        self.token_totals['calls'] += 1
+        self.token_log.append(entry)
+    
+    def usage_stats(self) -> Dict:
+        """Token totals, structured-output failure counts and the most recent per-call counts."""
+        
+        totals = dict(self.token_totals)
+        prompt_tokens = sum(totals[field] for field in TOKEN_FIELDS if field != 'output_tokens')
+        totals['cached_fraction'] = (
+            round(totals['cache_read_input_tokens'] / prompt_tokens, 3) if prompt_tokens else 0.0
+        )
+        return {
+            'totals': totals,
+            'structured_output': self.output_stats.snapshot(),
+            'recent': list(self.token_log)[-20:]
+        }
     
     def generate_cover_letter(self, tailored_resume: Dict, job_data: Dict) -> str:
         """Generate human-sounding cold email/application note."""
         
+        response = self._create(
+            'cover_letter', self._cover_letter_request(tailored_resume, job_data), self.generate_job_hash(job_data)
+        )
+        
+        return response.content[0].text.strip()
+    
+    async def generate_cover_letter_async(self, tailored_resume: Dict, job_data: Dict) -> str:
+        """Non-blocking generate_cover_letter(), sharing the concurrency limit."""
+        
+        response = await self._create_async(
+            'cover_letter', self._cover_letter_request(tailored_resume, job_data), self.generate_job_hash(job_data)
+        )
+        
+        return response.content[0].text.strip()
+    
+    def _cover_letter_request(self, tailored_resume: Dict, job_data: Dict) -> Dict:
+        """
+        messages.create() arguments for a cover letter call. Uses the
+        tailored bullets when given a tailored resume, otherwise the
+        master experience.
+        """
+        
+        experience = tailored_resume.get('tailored_experience') or tailored_resume['experience']
+        
         prompt = f"""Write a SHORT, conversational cold email for a job application. 
 
 TARGET JOB:
@@ -142,7 +623,7 @@ Company: {job_data['company']}
 Position: {job_data['title']}
 
 CANDIDATE BACKGROUND (use this context):
-{json.dumps(tailored_resume['experience'][:2], indent=2)}
+{json.dumps(experience[:2], indent=2)}
 
 REQUIREMENTS:
 - Maximum 4 sentences
@@ -153,43 +634,35 @@ REQUIREMENTS:
 
 Write the email body only (no subject line)."""
 
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=300,
-            temperature=0.7,  # Higher temp for more natural writing
-            messages=[{"role": "user", "content": prompt}]
-        )
-        
-        return response.content[0].text.strip()
+        return {
+            "model": self.model,
+            "max_tokens": 300,
+            "temperature": 0.7,  # Higher temp for more natural writing
+            "messages": [{"role": "user", "content": prompt}]
+        }
     
     def validate_truthfulness(self, original: Dict, tailored: Dict) -> Dict:
         """
         Validation layer to ensure no fabrication occurred.
         Returns a report of changes.
+        
+        Every number, percentage, duration, tool and company in the
+        tailored bullets is diffed against the master resume, and
+        tailored skills must exist in it (see FabricationChecker).
+        Deterministic and sub-millisecond, so it runs on every tailoring.
         """
         
-        validation_report = {
-            "passed": True,
-            "warnings": [],
-            "changes": []
-        }
+        if self._checker is None or self._checker[0] is not original:
+            self._checker = (original, FabricationChecker(original))
         
-        # Check if any new companies or titles were added
-        original_companies = {exp['company'] for exp in original['experience']}
-        tailored_companies = {exp['company'] for exp in tailored['tailored_experience']}
-        
-        if tailored_companies - original_companies:
-            validation_report["passed"] = False
-            validation_report["warnings"].append(
-                f"New companies added: {tailored_companies - original_companies}"
-            )
-        
-        # Compare bullet point count
-        for orig_exp, tail_exp in zip(original['experience'], tailored['tailored_experience']):
-            if len(tail_exp['bullets']) > len(orig_exp['bullets']):
-                validation_report["warnings"].append(
-                    f"Added bullets to {orig_exp['company']}"
-                )
+        issues = self._checker[1].check(tailored['tailored_experience'], tailored.get('tailored_skills'))
+        validation_report = summarize(issues)
+        validation_report["changes"] = [
+            {"company": orig_exp['company'], "bullet": i}
+            for orig_exp, tail_exp in zip(original['experience'], tailored['tailored_experience'])
+            for i, (before, after) in enumerate(zip(orig_exp['bullets'], tail_exp['bullets']))
+            if before != after
+        ]
         
         return validation_report
 
@@ -0,0 +1,654 @@
+"""
+Storage Engines for the Application Database
+Pluggable persistence layer behind ApplicationDatabase (Excel workbook or SQLite)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import pandas as pd
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment
+
+
+APPLICATION_COLUMNS = [
+    'Application_ID',
+    'Date_Applied',
+    'Company',
+    'Job_Title',
+    'Job_URL',
+    'Location',
+    'Status',
+    'Resume_Version',
+    'Resume_Path',
+    'Cover_Letter_Used',
+    'Tailoring_Score',
+    'Key_Matches',
+    'Response_Date',
+    'Response_Type',
+    'Interview_Date',
+    'Notes',
+    'Follow_Up_Date'
+]
+
+RESUME_VERSION_COLUMNS = [
+    'Version_ID',
+    'Job_Hash',
+    'Created_Date',
+    'Base_Resume',
+    'Company',
+    'Title',
+    'File_Path'
+]
+
+SUMMARY_METRICS = [
+    'Total Applications',
+    'Applications This Week',
+    'Response Rate',
+    'Interview Rate',
+    'Average Tailoring Score'
+]
+
+COLUMN_WIDTHS = {
+    'A': 15,  # Application_ID
+    'B': 12,  # Date_Applied
+    'C': 20,  # Company
+    'D': 30,  # Job_Title
+    'E': 50,  # Job_URL
+    'F': 15,  # Location
+    'G': 12,  # Status
+    'H': 15,  # Resume_Version
+    'I': 50,  # Resume_Path
+    'J': 15,  # Cover_Letter_Used
+    'K': 15,  # Tailoring_Score
+    'L': 30,  # Key_Matches
+}
+
+
+def summary_frame(stats: Dict) -> pd.DataFrame:
+    """Build the Summary sheet from get_summary_stats() output."""
+    return pd.DataFrame({
+        'Metric': SUMMARY_METRICS,
+        'Value': [
+            stats['total_applications'],
+            stats['this_week'],
+            stats['response_rate'],
+            stats['interview_rate'],
+            stats['avg_tailoring_score']
+        ]
+    })
+
+
+HEADER_FILL = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+HEADER_FONT = Font(bold=True, color="FFFFFF", size=11)
+HEADER_ALIGNMENT = Alignment(horizontal='center', vertical='center')
+
+
+def excel_rows(df: pd.DataFrame) -> Iterator[list]:
+    """
+    Rows as native Python values for openpyxl: missing cells become None
+    and day-precision timestamps become dates (rendered as yyyy-mm-dd).
+    """
+    plain = df.astype(object)
+    plain = plain.where(plain.notna(), None)
+
+    for row in plain.itertuples(index=False, name=None):
+        yield [
+            (value.date() if value.time() == datetime.min.time() else value.to_pydatetime())
+            if isinstance(value, pd.Timestamp) else value
+            for value in row
+        ]
+
+
+def append_applications_sheet(wb: Workbook, chunks: Iterable[pd.DataFrame]):
+    """
+    Add the formatted Applications sheet to a write-only workbook:
+    styled header, column widths and frozen header row are emitted
+    together with the data, so the file never needs a second pass.
+    """
+
+    ws = wb.create_sheet('Applications')
+
+    for col, width in COLUMN_WIDTHS.items():
+        ws.column_dimensions[col].width = width
+    ws.freeze_panes = 'A2'
+
+    header = []
+    for name in APPLICATION_COLUMNS:
+        cell = WriteOnlyCell(ws, value=name)
+        cell.fill = HEADER_FILL
+        cell.font = HEADER_FONT
+        cell.alignment = HEADER_ALIGNMENT
+        header.append(cell)
+    ws.append(header)
+
+    for chunk in chunks:
+        for row in excel_rows(chunk):
+            ws.append(row)
+
+
+def _append_plain_sheet(wb: Workbook, title: str, df: pd.DataFrame):
+    ws = wb.create_sheet(title)
+    ws.append(list(df.columns))
+    for row in excel_rows(df):
+        ws.append(row)
+
+
+def write_workbook(path: Path, applications: pd.DataFrame,
+                   summary: pd.DataFrame, versions: pd.DataFrame):
+    """
+    Write the complete formatted workbook (all three sheets) in a single
+    pass from memory, without reading the existing file. The new file
+    replaces the old one atomically.
+    """
+
+    wb = Workbook(write_only=True)
+    append_applications_sheet(wb, [applications])
+    _append_plain_sheet(wb, 'Summary', summary)
+    _append_plain_sheet(wb, 'Resume_Versions', versions)
+
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    wb.save(tmp_path)
+    os.replace(tmp_path, path)
+
+
+class StorageBackend:
+    """
+    Base class for ApplicationDatabase persistence engines.
+
+    The database keeps the working DataFrame in memory and reports every
+    mutation to its backend as a row-level event; each backend decides
+    how (and how much) to write.
+    """
+
+    name = "base"
+
+    def __init__(self):
+        self.db = None
+
+    def attach(self, db):
+        """Bind the owning ApplicationDatabase (used for full-table writes)."""
+        self.db = db
+
+    def load_applications(self) -> pd.DataFrame:
+        raise NotImplementedError
+
+    def load_resume_versions(self) -> pd.DataFrame:
+        raise NotImplementedError
+
+    def insert_application(self, row: Dict):
+        raise NotImplementedError
+
+    def update_application(self, app_id: str, changes: Dict):
+        raise NotImplementedError
+
+    def insert_applications(self, rows: List[Dict]):
+        """Persist many new rows; engines override this to write once."""
+        for row in rows:
+            self.insert_application(row)
+
+    def update_applications(self, updates: List[Tuple[str, Dict]]):
+        """Persist many (app_id, changes) pairs; engines override this to write once."""
+        for app_id, changes in updates:
+            self.update_application(app_id, changes)
+
+    def insert_resume_version(self, row: Dict):
+        """Insert or replace (by Version_ID) one resume version row."""
+        raise NotImplementedError
+
+    def export_excel(self, path: Path) -> Path:
+        """Produce the formatted applications workbook as a report."""
+        write_workbook(
+            path,
+            self.db.df,
+            summary_frame(self.db.get_summary_stats()),
+            self.db.get_resume_versions()
+        )
+        return path
+
+    def close(self):
+        pass
+
+
+class ExcelStorage(StorageBackend):
+    """
+    Legacy engine: the workbook itself is the store.
+    Every mutation rewrites the Applications and Summary sheets.
+    """
+
+    name = "excel"
+
+    def __init__(self, db_path: Union[str, Path]):
+        super().__init__()
+        self.db_path = Path(db_path)
+
+        # Initialize database file on first use
+        if not self.db_path.exists():
+            self._create_new_database()
+
+    def _create_new_database(self):
+        """Create new Excel database with proper schema."""
+
+        summary_df = pd.DataFrame({
+            'Metric': SUMMARY_METRICS,
+            'Value': [0, 0, '0%', '0%', 0]
+        })
+
+        write_workbook(
+            self.db_path,
+            pd.DataFrame(columns=APPLICATION_COLUMNS),
+            summary_df,
+            pd.DataFrame(columns=RESUME_VERSION_COLUMNS)
+        )
+
+    def load_applications(self) -> pd.DataFrame:
+        return pd.read_excel(self.db_path, sheet_name='Applications')
+
+    def load_resume_versions(self) -> pd.DataFrame:
+        return pd.read_excel(self.db_path, sheet_name='Resume_Versions')
+
+    def insert_application(self, row: Dict):
+        self.save()
+
+    def update_application(self, app_id: str, changes: Dict):
+        self.save()
+
+    def insert_applications(self, rows: List[Dict]):
+        self.save()
+
+    def update_applications(self, updates: List[Tuple[str, Dict]]):
+        self.save()
+
+    def insert_resume_version(self, row: Dict):
+        self.save()
+
+    def save(self, applications: Optional[pd.DataFrame] = None, stats: Optional[Dict] = None,
+             versions: Optional[pd.DataFrame] = None):
+        """Save the workbook from memory (defaults to the live tables)."""
+
+        write_workbook(
+            self.db_path,
+            self.db.df if applications is None else applications,
+            summary_frame(stats or self.db.get_summary_stats()),
+            self.db.get_resume_versions() if versions is None else versions
+        )
+
+    def export_excel(self, path: Path) -> Path:
+        if Path(path) == self.db_path:
+            self.save()
+            return path
+        return super().export_excel(path)
+
+
+class WriteBehindExcelStorage(ExcelStorage):
+    """
+    Workbook store with write-behind: mutations are applied in memory and
+    appended to a JSONL journal immediately, while a background worker
+    coalesces them into one workbook flush per interval or per N changes.
+    On startup any journal left by a crash is replayed before serving.
+    """
+
+    name = "write-behind"
+
+    def __init__(self, db_path: Union[str, Path], flush_interval: float = 5.0,
+                 max_pending: int = 50, fsync: bool = True):
+        super().__init__(db_path)
+        self.journal_path = self.db_path.with_suffix('.journal')
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.fsync = fsync
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._pending = 0
+        self._first_pending_at: Optional[float] = None
+        self._closed = False
+        self._journal = None
+
+        # Entries left by a crash, replayed by the load_* methods
+        self._replay = self._read_journal()
+
+        self._worker = threading.Thread(target=self._run, name="excel-write-behind", daemon=True)
+
+    def attach(self, db):
+        super().attach(db)
+        self._journal = open(self.journal_path, 'a', encoding='utf-8')
+        self._worker.start()
+        with self._wakeup:
+            self._wakeup.notify()
+
+    # --- journal -----------------------------------------------------------
+
+    def _read_journal(self) -> List[Dict]:
+        if not self.journal_path.exists():
+            return []
+
+        entries = []
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # Torn final write from a crash; everything before it is intact
+                    break
+        return entries
+
+    def _append(self, op: str, payload: Dict):
+        self._append_many([{'op': op, **payload}])
+
+    def _append_many(self, entries: List[Dict]):
+        if not entries:
+            return
+        lines = ''.join(json.dumps(entry, default=str) + '\n' for entry in entries)
+
+        with self._wakeup:
+            self._journal.write(lines)
+            self._journal.flush()
+            if self.fsync:
+                os.fsync(self._journal.fileno())
+
+            self._pending += len(entries)
+            if self._first_pending_at is None:
+                # Start the flush interval clock
+                self._first_pending_at = time.monotonic()
+                self._wakeup.notify()
+            elif self._pending >= self.max_pending:
+                self._wakeup.notify()
+
+    # --- recovery ----------------------------------------------------------
+
+    def load_applications(self) -> pd.DataFrame:
+        applications = super().load_applications()
+        entries = self._replay
+
+        if not entries:
+            return applications
+
+        # Replay is idempotent: inserts already in the workbook are skipped
+        known_ids = set(applications['Application_ID'])
+        inserted = []
+        for entry in entries:
+            if entry['op'] == 'insert_application' and entry['row']['Application_ID'] not in known_ids:
+                known_ids.add(entry['row']['Application_ID'])
+                inserted.append(entry['row'])
+
+        if inserted:
+            applications = pd.concat(
+                [applications, pd.DataFrame(inserted, columns=APPLICATION_COLUMNS)],
+                ignore_index=True
+            )
+
+        for entry in entries:
+            if entry['op'] == 'update_application':
+                mask = applications['Application_ID'] == entry['app_id']
+                for column, value in entry['changes'].items():
+                    applications.loc[mask, column] = value
+
+        self._pending = len(entries)
+        self._first_pending_at = time.monotonic()
+        return applications
+
+    def load_resume_versions(self) -> pd.DataFrame:
+        versions_df = super().load_resume_versions()
+        replayed = [entry['row'] for entry in self._replay if entry['op'] == 'insert_resume_version']
+
+        # Later rows win when the database deduplicates by Version_ID
+        if replayed:
+            versions_df = pd.concat([versions_df, pd.DataFrame(replayed)], ignore_index=True)
+        return versions_df
+
+    # --- mutations ---------------------------------------------------------
+
+    def insert_application(self, row: Dict):
+        self._append('insert_application', {'row': row})
+
+    def update_application(self, app_id: str, changes: Dict):
+        self._append('update_application', {'app_id': app_id, 'changes': changes})
+
+    def insert_applications(self, rows: List[Dict]):
+        self._append_many([{'op': 'insert_application', 'row': row} for row in rows])
+
+    def update_applications(self, updates: List[Tuple[str, Dict]]):
+        self._append_many([
+            {'op': 'update_application', 'app_id': app_id, 'changes': changes}
+            for app_id, changes in updates
+        ])
+
+    def insert_resume_version(self, row: Dict):
+        self._append('insert_resume_version', {'row': row})
+
+    # --- flushing ----------------------------------------------------------
+
+    def _run(self):
+        while True:
+            with self._wakeup:
+                while not self._closed:
+                    if self._pending >= self.max_pending:
+                        break
+                    if self._first_pending_at is not None:
+                        remaining = self._first_pending_at + self.flush_interval - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._wakeup.wait(remaining)
+                    else:
+                        self._wakeup.wait()
+                if self._closed:
+                    return
+
+            try:
+                self.flush()
+            except Exception as e:
+                self.db.logger.error(f"Write-behind flush failed: {e}")
+                time.sleep(self.flush_interval)
+
+    def flush(self):
+        """Write all journaled changes to the workbook in a single save."""
+
+        # Snapshot under the database lock so the worker never sees a half-applied mutation
+        with self.db.lock:
+            with self._lock:
+                if self._pending == 0:
+                    return
+                applications = self.db.df.copy()
+                stats = self.db.get_summary_stats()
+                versions_df = self.db.get_resume_versions()
+                journal_offset = self._journal.tell()
+                flushed = self._pending
+
+        self.save(applications, stats, versions_df)
+
+        # Drop the flushed prefix of the journal, keeping entries written meanwhile
+        with self._lock:
+            self._journal.close()
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                f.seek(journal_offset)
+                tail = f.read()
+            with open(self.journal_path, 'w', encoding='utf-8') as f:
+                f.write(tail)
+                f.flush()
+                os.fsync(f.fileno())
+            self._journal = open(self.journal_path, 'a', encoding='utf-8')
+
+            self._pending -= flushed
+            self._first_pending_at = time.monotonic() if self._pending else None
+
+    def export_excel(self, path: Path) -> Path:
+        if Path(path) == self.db_path:
+            self.flush()
+            return path
+        return super().export_excel(path)
+
+    def close(self):
+        with self._wakeup:
+            self._closed = True
+            self._wakeup.notify()
+        if self._worker.is_alive():
+            self._worker.join()
+        self.flush()
+        self._journal.close()
+
+
+class SQLiteStorage(StorageBackend):
+    """
+    Transactional engine: one indexed SQLite table per sheet, WAL journal.
+    Each mutation commits a single row, so write cost does not grow with
+    history. The Excel workbook is only produced on demand by export_excel().
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: Union[str, Path], import_from: Optional[Path] = None):
+        super().__init__()
+        self.path = Path(path)
+        is_new = not self.path.exists()
+
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+        # Carry over history from the legacy workbook the first time
+        if is_new and import_from is not None and Path(import_from).exists():
+            self._import_workbook(Path(import_from))
+
+    def _create_schema(self):
+        app_cols = ', '.join(
+            f'"{col}" TEXT PRIMARY KEY' if col == 'Application_ID'
+            else f'"{col}" INTEGER' if col == 'Tailoring_Score'
+            else f'"{col}" TEXT'
+            for col in APPLICATION_COLUMNS
+        )
+        version_cols = ', '.join(
+            f'"{col}" TEXT PRIMARY KEY' if col == 'Version_ID' else f'"{col}" TEXT'
+            for col in RESUME_VERSION_COLUMNS
+        )
+
+        with self.conn:
+            self.conn.execute(f"CREATE TABLE IF NOT EXISTS applications ({app_cols})")
+            self.conn.execute('CREATE INDEX IF NOT EXISTS idx_app_status ON applications ("Status")')
+            self.conn.execute('CREATE INDEX IF NOT EXISTS idx_app_company ON applications ("Company")')
+            self.conn.execute('CREATE INDEX IF NOT EXISTS idx_app_date ON applications ("Date_Applied")')
+            self.conn.execute(f"CREATE TABLE IF NOT EXISTS resume_versions ({version_cols})")
+            self.conn.execute('CREATE INDEX IF NOT EXISTS idx_version_hash ON resume_versions ("Job_Hash")')
+
+    def _import_workbook(self, workbook_path: Path):
+        """Copy rows from an existing applications.xlsx into the new store."""
+
+        sheets = pd.read_excel(workbook_path, sheet_name=['Applications', 'Resume_Versions'])
+
+        with self._lock, self.conn:
+            for table, columns, df in (
+                ('applications', APPLICATION_COLUMNS, sheets['Applications']),
+                ('resume_versions', RESUME_VERSION_COLUMNS, sheets['Resume_Versions'])
+            ):
+                df = df.reindex(columns=columns)
+                rows = [
+                    [self._to_sql(value) for value in record]
+                    for record in df.itertuples(index=False, name=None)
+                ]
+                self.conn.executemany(self._insert_sql(table, columns), rows)
+
+    @staticmethod
+    def _to_sql(value):
+        """Convert pandas/numpy scalars into sqlite3-compatible values."""
+        if value is None:
+            return None
+        try:
+            if pd.isna(value):
+                return None
+        except (TypeError, ValueError):
+            pass
+        if isinstance(value, (pd.Timestamp, datetime)):
+            if value.time() == datetime.min.time():
+                return value.strftime('%Y-%m-%d')
+            return value.isoformat(sep=' ')
+        if hasattr(value, 'item'):
+            return value.item()
+        return value
+
+    @staticmethod
+    def _insert_sql(table: str, columns: List[str]) -> str:
+        names = ', '.join(f'"{col}"' for col in columns)
+        placeholders = ', '.join('?' for _ in columns)
+        return f"INSERT OR REPLACE INTO {table} ({names}) VALUES ({placeholders})"
+
+    def _read_table(self, table: str, columns: List[str]) -> pd.DataFrame:
+        names = ', '.join(f'"{col}"' for col in columns)
+        with self._lock:
+            return pd.read_sql_query(f"SELECT {names} FROM {table} ORDER BY rowid", self.conn)
+
+    def load_applications(self) -> pd.DataFrame:
+        return self._read_table('applications', APPLICATION_COLUMNS)
+
+    def load_resume_versions(self) -> pd.DataFrame:
+        return self._read_table('resume_versions', RESUME_VERSION_COLUMNS)
+
+    def insert_application(self, row: Dict):
+        values = [self._to_sql(row.get(col)) for col in APPLICATION_COLUMNS]
+        with self._lock, self.conn:
+            self.conn.execute(self._insert_sql('applications', APPLICATION_COLUMNS), values)
+
+    def update_application(self, app_id: str, changes: Dict):
+        self.update_applications([(app_id, changes)])
+
+    def insert_applications(self, rows: List[Dict]):
+        values = [[self._to_sql(row.get(col)) for col in APPLICATION_COLUMNS] for row in rows]
+        with self._lock, self.conn:
+            self.conn.executemany(self._insert_sql('applications', APPLICATION_COLUMNS), values)
+
+    def update_applications(self, updates: List[Tuple[str, Dict]]):
+        # Group by the set of changed columns so each group is one executemany
+        statements: Dict[Tuple[str, ...], List[List]] = {}
+        for app_id, changes in updates:
+            if not changes:
+                continue
+            columns = tuple(changes)
+            values = [self._to_sql(changes[col]) for col in columns] + [app_id]
+            statements.setdefault(columns, []).append(values)
+
+        with self._lock, self.conn:
+            for columns, rows in statements.items():
+                assignments = ', '.join(f'"{col}" = ?' for col in columns)
+                self.conn.executemany(
+                    f'UPDATE applications SET {assignments} WHERE "Application_ID" = ?',
+                    rows
+                )
+
+    def insert_resume_version(self, row: Dict):
+        values = [self._to_sql(row.get(col)) for col in RESUME_VERSION_COLUMNS]
+        with self._lock, self.conn:
+            self.conn.execute(self._insert_sql('resume_versions', RESUME_VERSION_COLUMNS), values)
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+def create_storage(backend: Union[str, StorageBackend], db_path: Path) -> StorageBackend:
+    """
+    Resolve a backend name ('excel', 'write-behind' or 'sqlite') into a storage engine.
+    The SQLite store lives next to the workbook, e.g. applications.sqlite3.
+    """
+
+    if isinstance(backend, StorageBackend):
+        return backend
+
+    if backend == 'excel':
+        return ExcelStorage(db_path)
+    if backend == 'write-behind':
+        return WriteBehindExcelStorage(
+            db_path,
+            flush_interval=float(os.environ.get("DB_FLUSH_INTERVAL", 5.0)),
+            max_pending=int(os.environ.get("DB_FLUSH_MAX_CHANGES", 50))
+        )
+    if backend == 'sqlite':
+        return SQLiteStorage(db_path.with_suffix('.sqlite3'), import_from=db_path)
+
+    raise ValueError(f"Unknown storage backend: {backend}")
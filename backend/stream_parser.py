@@ -0,0 +1,99 @@
+"""
+Incremental Tailoring Output Parser
+Pulls completed experience entries out of a partially generated JSON response
+"""
+
+import json
+from typing import Dict, List, Optional
+
+
+class ExperienceStreamParser:
+    """
+    Feed the model's text deltas in order; each call returns the
+    experience entries that became complete with that delta.
+
+    The scanner tracks string/escape state and nesting depth, so it only
+    reacts to the top-level "experience" array and is unaffected by
+    braces inside bullet text or by a leading markdown fence. Each delta
+    is scanned once; only the entry (or top-level key) currently being
+    generated is buffered, so feeding a response is linear in its
+    length. The deltas are kept for the full text.
+    """
+
+    def __init__(self):
+        self._chunks: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_parts: Optional[List[str]] = None
+        self._last_string: Optional[str] = None
+        self._key: Optional[str] = None
+        self._in_experience = False
+        self._element_parts: Optional[List[str]] = None
+
+    @property
+    def text(self) -> str:
+        return ''.join(self._chunks)
+
+    def feed(self, delta: str) -> List[Dict]:
+        self._chunks.append(delta)
+        completed = []
+
+        # Offsets in this delta where the open top-level string / entry began
+        string_start = 0
+        element_start = 0
+
+        for i, c in enumerate(delta):
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == '\\':
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    if self._string_parts is not None:
+                        self._string_parts.append(delta[string_start:i])
+                        self._last_string = ''.join(self._string_parts)
+                        self._string_parts = None
+                continue
+
+            if c == '"':
+                self._in_string = True
+                if self._depth == 1:
+                    self._string_parts = []
+                    string_start = i + 1
+            elif c == ':' and self._depth == 1:
+                self._key = self._last_string
+            elif c == '{' or c == '[':
+                self._depth += 1
+                if c == '[' and self._depth == 2 and self._key == 'experience':
+                    self._in_experience = True
+                elif c == '{' and self._depth == 3 and self._in_experience:
+                    self._element_parts = []
+                    element_start = i
+            elif c == '}' or c == ']':
+                if c == '}' and self._depth == 3 and self._element_parts is not None:
+                    self._element_parts.append(delta[element_start:i + 1])
+                    role = self._decode(''.join(self._element_parts))
+                    if role is not None:
+                        completed.append(role)
+                    self._element_parts = None
+                elif c == ']' and self._depth == 2 and self._in_experience:
+                    self._in_experience = False
+                self._depth -= 1
+
+        # Carry unfinished pieces over to the next delta
+        if self._string_parts is not None:
+            self._string_parts.append(delta[string_start:])
+        if self._element_parts is not None:
+            self._element_parts.append(delta[element_start:])
+
+        return completed
+
+    @staticmethod
+    def _decode(fragment: str) -> Optional[Dict]:
+        try:
+            value = json.loads(fragment)
+        except json.JSONDecodeError:
+            return None
+        return value if isinstance(value, dict) else None
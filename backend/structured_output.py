@@ -0,0 +1,278 @@
+"""
+Structured Tailoring Output
+Tool-use schema for the tailoring call, local repair of malformed output, and failure counters
+"""
+
+import json
+import re
+import threading
+from typing import Dict, List, Tuple
+
+
+TAILORING_TOOL_NAME = "submit_tailored_resume"
+
+TAILORING_TOOL = {
+    "name": TAILORING_TOOL_NAME,
+    "description": "Submit the tailored resume experience, skills and alignment for the target job.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "experience": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "company": {"type": "string"},
+                        "title": {"type": "string"},
+                        "duration": {"type": "string"},
+                        "bullets": {"type": "array", "items": {"type": "string"}}
+                    },
+                    "required": ["company", "title", "duration", "bullets"]
+                }
+            },
+            "skills": {
+                "type": "object",
+                "properties": {
+                    "technical": {"type": "array", "items": {"type": "string"}},
+                    "tools": {"type": "array", "items": {"type": "string"}},
+                    "soft_skills": {"type": "array", "items": {"type": "string"}}
+                },
+                "required": ["technical", "tools", "soft_skills"]
+            },
+            "alignment_score": {"type": "integer", "minimum": 0, "maximum": 100},
+            "key_matches": {"type": "array", "items": {"type": "string"}}
+        },
+        "required": ["experience", "skills", "alignment_score", "key_matches"]
+    }
+}
+
+BULLET_REWRITE_TOOL_NAME = "submit_bullet_rewrites"
+
+BULLET_REWRITE_TOOL = {
+    "name": BULLET_REWRITE_TOOL_NAME,
+    "description": "Submit rewrites for only the listed bullets (by id), plus the tailored skills and alignment.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "rewrites": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "id": {"type": "string"},
+                        "bullet": {"type": "string"}
+                    },
+                    "required": ["id", "bullet"]
+                }
+            },
+            "skills": TAILORING_TOOL["input_schema"]["properties"]["skills"],
+            "alignment_score": {"type": "integer", "minimum": 0, "maximum": 100},
+            "key_matches": {"type": "array", "items": {"type": "string"}}
+        },
+        "required": ["rewrites", "skills", "alignment_score", "key_matches"]
+    }
+}
+
+_FENCE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+_TRAILING_COMMA = re.compile(r",\s*([}\]])")
+
+
+class MalformedOutputError(ValueError):
+    """Model output could not be parsed or repaired into the tailoring shape."""
+
+
+def repair_json(text: str) -> Dict:
+    """
+    Salvage a JSON object from almost-JSON model text: strips markdown
+    fences and surrounding prose, drops trailing commas, and closes
+    brackets left open by a truncated response. An element that was cut
+    off inside a top-level array (e.g. the last experience role) is
+    dropped rather than closed, so the complete elements before it
+    still validate.
+    """
+
+    fenced = _FENCE.search(text)
+    if fenced:
+        text = fenced.group(1)
+
+    start = text.find('{')
+    if start < 0:
+        raise MalformedOutputError("no JSON object in model output")
+    end = text.rfind('}')
+    candidate = text[start:end + 1] if end > start else text[start:]
+
+    candidate = _TRAILING_COMMA.sub(r"\1", candidate)
+    try:
+        return json.loads(candidate)
+    except json.JSONDecodeError:
+        pass
+
+    # Truncated output: cut back to the last complete value and close what is open
+    closed, open_stack = _close_open_brackets(text[start:])
+    try:
+        value = json.loads(_TRAILING_COMMA.sub(r"\1", closed))
+    except json.JSONDecodeError as e:
+        raise MalformedOutputError(f"unrepairable model output: {e}") from e
+
+    # Cut inside an element of a top-level array: that element is partial
+    if isinstance(value, dict) and value and len(open_stack) >= 3 and open_stack[1] == ']':
+        items = value[list(value)[-1]]
+        if isinstance(items, list) and items:
+            items.pop()
+
+    return value
+
+
+def _close_open_brackets(text: str) -> Tuple[str, List[str]]:
+    """
+    Cut text back to its last complete value and append the missing
+    closers. Also returns the closers that were open at the cut,
+    outermost first.
+    """
+
+    stack = []
+    in_string = escape = False
+    cut, cut_stack = 0, []
+
+    for i, c in enumerate(text):
+        if in_string:
+            if escape:
+                escape = False
+            elif c == '\\':
+                escape = True
+            elif c == '"':
+                in_string = False
+            continue
+        if c == '"':
+            in_string = True
+        elif c in '{[':
+            stack.append('}' if c == '{' else ']')
+        elif c in '}]':
+            if stack:
+                stack.pop()
+            cut, cut_stack = i + 1, list(stack)
+        elif c == ',':
+            cut, cut_stack = i, list(stack)
+
+    return text[:cut] + ''.join(reversed(cut_stack)), cut_stack
+
+
+def parse_tailoring_text(text: str, tool_name: str = TAILORING_TOOL_NAME) -> Tuple[Dict, bool]:
+    """(content, repaired) from a text response."""
+
+    validate = VALIDATORS[tool_name]
+    try:
+        return validate(json.loads(text)), False
+    except (json.JSONDecodeError, MalformedOutputError):
+        pass
+
+    content = repair_json(text)
+    # Truncated before skills were written; the caller fills them from the master resume
+    if isinstance(content, dict) and 'skills' not in content:
+        content['skills'] = {}
+    return validate(content), True
+
+
+def parse_tailoring_response(response, tool_name: str = TAILORING_TOOL_NAME) -> Tuple[Dict, bool]:
+    """(content, repaired) from a Message; prefers the tool_use block."""
+
+    for block in response.content:
+        if getattr(block, 'type', None) == 'tool_use' and block.name == tool_name:
+            return VALIDATORS[tool_name](block.input), False
+
+    text = ''.join(getattr(block, 'text', '') for block in response.content)
+    return parse_tailoring_text(text, tool_name)
+
+
+def validate_tailoring(content) -> Dict:
+    """Check the tailoring shape and fill optional fields; raises MalformedOutputError."""
+
+    if not isinstance(content, dict):
+        raise MalformedOutputError("tailoring output is not an object")
+
+    experience = content.get('experience')
+    if not isinstance(experience, list) or not all(
+        isinstance(exp, dict) and isinstance(exp.get('bullets'), list) for exp in experience
+    ):
+        raise MalformedOutputError("experience must be a list of roles with bullets")
+
+    return _validate_common(content)
+
+
+def validate_bullet_rewrites(content) -> Dict:
+    """Check the bullet-rewrite shape; returns rewrites as an {id: bullet} dict."""
+
+    if not isinstance(content, dict):
+        raise MalformedOutputError("bullet rewrite output is not an object")
+
+    rewrites = content.get('rewrites')
+    if not isinstance(rewrites, list):
+        raise MalformedOutputError("rewrites must be a list")
+    content['rewrites'] = {
+        item['id']: item['bullet'] for item in rewrites
+        if isinstance(item, dict) and isinstance(item.get('id'), str) and isinstance(item.get('bullet'), str)
+    }
+
+    return _validate_common(content)
+
+
+def _validate_common(content: Dict) -> Dict:
+    if not isinstance(content.get('skills'), dict):
+        raise MalformedOutputError("skills must be an object")
+
+    try:
+        content['alignment_score'] = int(content.get('alignment_score'))
+    except (TypeError, ValueError):
+        content['alignment_score'] = None
+    if not isinstance(content.get('key_matches'), list):
+        content['key_matches'] = []
+
+    return content
+
+
+VALIDATORS = {
+    TAILORING_TOOL_NAME: validate_tailoring,
+    BULLET_REWRITE_TOOL_NAME: validate_bullet_rewrites
+}
+
+
+class OutputStats:
+    """Counters for tailoring output quality and the tokens spent on failed attempts."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.succeeded = 0
+        self.clean = 0
+        self.repaired = 0
+        self.failed_attempts = 0
+        self.retries = 0
+        self.wasted_tokens = 0
+
+    def success(self, repaired: bool):
+        with self._lock:
+            self.succeeded += 1
+            if repaired:
+                self.repaired += 1
+            else:
+                self.clean += 1
+
+    def failure(self, tokens: int, will_retry: bool):
+        with self._lock:
+            self.failed_attempts += 1
+            self.wasted_tokens += tokens
+            if will_retry:
+                self.retries += 1
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                'succeeded': self.succeeded,
+                'clean': self.clean,
+                'repaired': self.repaired,
+                'failed_attempts': self.failed_attempts,
+                'retries': self.retries,
+                'wasted_tokens': self.wasted_tokens,
+                'wasted_tokens_per_success': (
+                    round(self.wasted_tokens / self.succeeded, 1) if self.succeeded else 0.0
+                )
+            }
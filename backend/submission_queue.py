@@ -0,0 +1,569 @@
+"""
+Persistent Submission Queue
+Durable browser-submission jobs (SQLite or JSONL journal) worked by a tunable async worker pool with retries
+"""
+
+import asyncio
+import json
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from io_executor import IOExecutor
+
+
+STATES = ('queued', 'running', 'succeeded', 'failed')
+
+# Application Status written back to the database for each job state
+APPLICATION_STATUS = {
+    'queued': 'Queued',
+    'running': 'Submitting',
+    'succeeded': 'Applied',
+    'failed': 'Submission Failed'
+}
+
+JOB_FIELDS = ('id', 'app_id', 'payload', 'state', 'attempts', 'max_attempts',
+              'next_run_at', 'last_error', 'created_at', 'updated_at', 'finished_at')
+
+
+class QueueStore:
+    """
+    Base class for submission job persistence.
+
+    Jobs are plain dicts with JOB_FIELDS. claim() atomically moves the
+    next due queued job to running and counts the attempt, so a job
+    interrupted by a restart is never worked twice at once and cannot
+    loop forever.
+    """
+
+    name = "base"
+
+    def add(self, job: Dict) -> int:
+        raise NotImplementedError
+
+    def claim(self, now: float) -> Optional[Dict]:
+        raise NotImplementedError
+
+    def save(self, job: Dict):
+        raise NotImplementedError
+
+    def get(self, job_id: int) -> Optional[Dict]:
+        raise NotImplementedError
+
+    def jobs(self, state: Optional[str] = None, limit: int = 50) -> List[Dict]:
+        """Most recent jobs first."""
+        raise NotImplementedError
+
+    def counts(self) -> Dict[str, int]:
+        raise NotImplementedError
+
+    def next_due(self) -> Optional[float]:
+        """Earliest next_run_at among queued jobs."""
+        raise NotImplementedError
+
+    def recover(self) -> int:
+        """
+        Return jobs left running by a crash to the queue (or fail them
+        if they have no attempts left). Called once before workers start.
+        """
+        recovered = 0
+        for job in self.jobs(state='running', limit=1_000_000):
+            if job['attempts'] >= job['max_attempts']:
+                job.update(state='failed', last_error="interrupted by restart", finished_at=time.time())
+            else:
+                job.update(state='queued', next_run_at=time.time())
+            job['updated_at'] = time.time()
+            self.save(job)
+            recovered += 1
+        return recovered
+
+    def close(self):
+        pass
+
+
+class SQLiteQueueStore(QueueStore):
+    """One indexed table; every state change is a single-row commit (WAL)."""
+
+    name = "sqlite"
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS submission_jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                app_id TEXT,
+                payload TEXT,
+                state TEXT,
+                attempts INTEGER,
+                max_attempts INTEGER,
+                next_run_at REAL,
+                last_error TEXT,
+                created_at REAL,
+                updated_at REAL,
+                finished_at REAL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_submission_due ON submission_jobs (state, next_run_at)")
+        self.conn.commit()
+
+    @staticmethod
+    def _job(row: sqlite3.Row) -> Dict:
+        job = dict(row)
+        job['payload'] = json.loads(job['payload'])
+        return job
+
+    def add(self, job: Dict) -> int:
+        columns = [field for field in JOB_FIELDS if field != 'id']
+        values = [json.dumps(job['payload']) if c == 'payload' else job[c] for c in columns]
+        with self._lock:
+            cursor = self.conn.execute(
+                f"INSERT INTO submission_jobs ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                values
+            )
+            self.conn.commit()
+            return cursor.lastrowid
+
+    def claim(self, now: float) -> Optional[Dict]:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT * FROM submission_jobs WHERE state = 'queued' AND next_run_at <= ? "
+                "ORDER BY next_run_at, id LIMIT 1",
+                (now,)
+            ).fetchone()
+            if row is None:
+                return None
+            self.conn.execute(
+                "UPDATE submission_jobs SET state = 'running', attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                (now, row['id'])
+            )
+            self.conn.commit()
+            job = self._job(row)
+        job.update(state='running', attempts=job['attempts'] + 1, updated_at=now)
+        return job
+
+    def save(self, job: Dict):
+        columns = [field for field in JOB_FIELDS if field != 'id']
+        values = [json.dumps(job['payload']) if c == 'payload' else job[c] for c in columns]
+        with self._lock:
+            self.conn.execute(
+                f"UPDATE submission_jobs SET {', '.join(f'{c} = ?' for c in columns)} WHERE id = ?",
+                values + [job['id']]
+            )
+            self.conn.commit()
+
+    def get(self, job_id: int) -> Optional[Dict]:
+        with self._lock:
+            row = self.conn.execute("SELECT * FROM submission_jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._job(row) if row else None
+
+    def jobs(self, state: Optional[str] = None, limit: int = 50) -> List[Dict]:
+        with self._lock:
+            if state:
+                rows = self.conn.execute(
+                    "SELECT * FROM submission_jobs WHERE state = ? ORDER BY id DESC LIMIT ?", (state, limit)
+                ).fetchall()
+            else:
+                rows = self.conn.execute(
+                    "SELECT * FROM submission_jobs ORDER BY id DESC LIMIT ?", (limit,)
+                ).fetchall()
+        return [self._job(row) for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self.conn.execute("SELECT state, COUNT(*) FROM submission_jobs GROUP BY state").fetchall()
+        return {**{state: 0 for state in STATES}, **{row[0]: row[1] for row in rows}}
+
+    def next_due(self) -> Optional[float]:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT MIN(next_run_at) FROM submission_jobs WHERE state = 'queued'"
+            ).fetchone()
+        return row[0]
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+class JournalQueueStore(QueueStore):
+    """
+    Jobs held in memory and persisted as an append-only JSON-lines
+    journal of full job snapshots (replayed on start, last write wins).
+    The journal is compacted on load once superseded lines dominate.
+    """
+
+    name = "journal"
+
+    def __init__(self, path: Union[str, Path], fsync: bool = True):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.fsync = fsync
+
+        self._lock = threading.Lock()
+        self._jobs: Dict[int, Dict] = {}
+        self._next_id = 1
+        self._load()
+        self._journal = open(self.path, 'a', encoding='utf-8')
+
+    def _load(self):
+        if not self.path.exists():
+            return
+
+        lines = 0
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                lines += 1
+                try:
+                    job = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn final line from a crash
+                self._jobs[job['id']] = job
+        self._next_id = max(self._jobs, default=0) + 1
+
+        if lines > 2 * len(self._jobs):
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for job in self._jobs.values():
+                    f.write(json.dumps(job) + '\n')
+            os.replace(tmp_path, self.path)
+
+    def _write(self, job: Dict):
+        """Append one snapshot. Caller holds self._lock."""
+        self._journal.write(json.dumps(job) + '\n')
+        self._journal.flush()
+        if self.fsync:
+            os.fsync(self._journal.fileno())
+
+    def add(self, job: Dict) -> int:
+        with self._lock:
+            job = dict(job, id=self._next_id)
+            self._next_id += 1
+            self._jobs[job['id']] = job
+            self._write(job)
+            return job['id']
+
+    def claim(self, now: float) -> Optional[Dict]:
+        with self._lock:
+            due = [job for job in self._jobs.values() if job['state'] == 'queued' and job['next_run_at'] <= now]
+            if not due:
+                return None
+            job = min(due, key=lambda j: (j['next_run_at'], j['id']))
+            job.update(state='running', attempts=job['attempts'] + 1, updated_at=now)
+            self._write(job)
+            return dict(job)
+
+    def save(self, job: Dict):
+        with self._lock:
+            self._jobs[job['id']] = dict(job)
+            self._write(job)
+
+    def get(self, job_id: int) -> Optional[Dict]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    def jobs(self, state: Optional[str] = None, limit: int = 50) -> List[Dict]:
+        with self._lock:
+            matching = [dict(job) for job in reversed(self._jobs.values()) if state is None or job['state'] == state]
+        return matching[:limit]
+
+    def counts(self) -> Dict[str, int]:
+        counts = {state: 0 for state in STATES}
+        with self._lock:
+            for job in self._jobs.values():
+                counts[job['state']] += 1
+        return counts
+
+    def next_due(self) -> Optional[float]:
+        with self._lock:
+            return min((job['next_run_at'] for job in self._jobs.values() if job['state'] == 'queued'), default=None)
+
+    def close(self):
+        with self._lock:
+            self._journal.close()
+
+
+def create_queue_store(backend: Union[str, QueueStore], directory: Union[str, Path] = "database") -> QueueStore:
+    """Resolve 'sqlite' or 'journal' into a queue store under directory."""
+
+    if isinstance(backend, QueueStore):
+        return backend
+
+    directory = Path(directory)
+    if backend == 'sqlite':
+        return SQLiteQueueStore(directory / "submissions.sqlite3")
+    if backend == 'journal':
+        return JournalQueueStore(directory / "submissions.journal")
+
+    raise ValueError(f"Unknown queue backend: {backend}")
+
+
+class SubmissionQueue:
+    """
+    Durable queue of application submissions.
+
+    enqueue() persists a job and wakes the pool; `workers` asyncio tasks
+    claim due jobs and await handler(**payload), which returns True on
+    success. A failed attempt (False, an exception or a timeout) is
+    re-queued after exponential backoff until max_attempts is reached.
+    Each state change is written back to the application's Status via
+    on_status (e.g. ApplicationDatabase.update_status). Jobs survive a
+    restart; ones that were mid-submission are re-queued on start().
+    The worker count can be changed while running with set_workers().
+
+    pacer (e.g. HumanEmulator.can_proceed) returns (allowed, reason) and
+    is asked before every dequeue, first attempts and retries alike.
+    While it says no, workers leave jobs queued and re-check every
+    pace_seconds (or on wake()). The check, the claim and the start of
+    the handler happen under one lock, so the next worker only asks
+    once the previous submission is underway.
+    """
+
+    def __init__(self, store: QueueStore, handler: Callable[..., Awaitable[bool]],
+                 on_status: Optional[Callable[[str, str, str], None]] = None,
+                 executor: Optional[IOExecutor] = None, workers: int = 1, max_attempts: int = 3,
+                 backoff_seconds: float = 30.0, max_backoff_seconds: float = 900.0,
+                 job_timeout: float = 300.0, poll_interval: float = 1.0,
+                 pacer: Optional[Callable[[], Tuple[bool, Optional[str]]]] = None, pace_seconds: float = 30.0):
+        self.store = store
+        self.handler = handler
+        self.on_status = on_status
+        self.executor = executor or IOExecutor(max_workers=2)
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.job_timeout = job_timeout
+        self.poll_interval = poll_interval
+        self.pacer = pacer
+        self.pace_seconds = pace_seconds
+
+        self.logger = logging.getLogger(__name__)
+        self._tasks: Dict[int, asyncio.Task] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._pace_lock: Optional[asyncio.Lock] = None
+        self._running = False
+
+        # (finished_at, succeeded, seconds) of recent attempts, for throughput
+        self._attempts = deque(maxlen=2000)
+        self.retries = 0
+        self.paused_reason: Optional[str] = None
+
+    @classmethod
+    def from_env(cls, handler: Callable[..., Awaitable[bool]], **kwargs) -> "SubmissionQueue":
+        """
+        Queue configured from SUBMIT_QUEUE_BACKEND / SUBMIT_WORKERS /
+        SUBMIT_MAX_ATTEMPTS / SUBMIT_BACKOFF_SECONDS / SUBMIT_PACE_SECONDS.
+        """
+        return cls(
+            create_queue_store(os.environ.get("SUBMIT_QUEUE_BACKEND", "sqlite")),
+            handler,
+            workers=int(os.environ.get("SUBMIT_WORKERS", 1)),
+            max_attempts=int(os.environ.get("SUBMIT_MAX_ATTEMPTS", 3)),
+            backoff_seconds=float(os.environ.get("SUBMIT_BACKOFF_SECONDS", 30)),
+            pace_seconds=float(os.environ.get("SUBMIT_PACE_SECONDS", 30)),
+            **kwargs
+        )
+
+    async def start(self):
+        self._wakeup = asyncio.Event()
+        self._pace_lock = asyncio.Lock()
+        self._running = True
+        recovered = await self.executor.run(self.store.recover)
+        if recovered:
+            self.logger.info(f"Re-queued {recovered} interrupted submissions")
+        self._spawn()
+
+    async def stop(self):
+        """Stop the workers; a job being submitted is interrupted and re-queued on next start."""
+        self._running = False
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks = {}
+        await self.executor.run(self.store.close)
+
+    def set_workers(self, count: int):
+        """Grow or shrink the pool; surplus workers exit after their current job."""
+        self.workers = max(0, count)
+        if self._running:
+            self._spawn()
+            self._wakeup.set()
+
+    def wake(self):
+        """Re-check pacing and due jobs now (e.g. after a batch reset)."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _spawn(self):
+        for slot in range(self.workers):
+            task = self._tasks.get(slot)
+            if task is None or task.done():
+                self._tasks[slot] = asyncio.ensure_future(self._worker(slot))
+
+    async def enqueue(self, app_id: str, payload: Dict, max_attempts: Optional[int] = None) -> int:
+        now = time.time()
+        job = {
+            'app_id': app_id,
+            'payload': payload,
+            'state': 'queued',
+            'attempts': 0,
+            'max_attempts': max_attempts or self.max_attempts,
+            'next_run_at': now,
+            'last_error': None,
+            'created_at': now,
+            'updated_at': now,
+            'finished_at': None
+        }
+        job['id'] = await self.executor.run(self.store.add, job)
+        await self._write_back(job)
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return job['id']
+
+    def backoff(self, attempts: int) -> float:
+        """Exponential backoff with +/-20% jitter so retries of a batch do not line up."""
+        delay = min(self.max_backoff_seconds, self.backoff_seconds * 2 ** (attempts - 1))
+        return delay * random.uniform(0.8, 1.2)
+
+    async def _worker(self, slot: int):
+        while self._running and slot < self.workers:
+            job = attempt = started = None
+            async with self._pace_lock:
+                allowed = self._may_submit()
+                if allowed:
+                    job = await self.executor.run(self.store.claim, time.time())
+                if job is not None:
+                    attempt, started = await self._start(job)
+            
+            if not allowed:
+                await self._wait(self.pace_seconds)
+            elif job is None:
+                await self._idle()
+            else:
+                await self._finish(job, attempt, started)
+
+        # Retired by set_workers()
+        if self._tasks.get(slot) is asyncio.current_task():
+            del self._tasks[slot]
+
+    def _may_submit(self) -> bool:
+        if self.pacer is None:
+            return True
+        try:
+            allowed, reason = self.pacer()
+        except Exception as e:
+            allowed, reason = False, f"pacer failed: {type(e).__name__}: {e}"
+        if not allowed and reason != self.paused_reason:
+            self.logger.info(f"Submissions paused: {reason}")
+        self.paused_reason = None if allowed else (reason or "paused")
+        return allowed
+
+    async def _idle(self):
+        next_due = await self.executor.run(self.store.next_due)
+        timeout = self.poll_interval if next_due is None else min(self.poll_interval, max(0.0, next_due - time.time()))
+        await self._wait(timeout)
+
+    async def _wait(self, timeout: float):
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    async def _start(self, job: Dict) -> Tuple[asyncio.Task, float]:
+        """Mark the job as submitting and let its handler run up to its first await."""
+        await self._write_back(job)
+        started = time.perf_counter()
+        attempt = asyncio.ensure_future(asyncio.wait_for(self.handler(**job['payload']), self.job_timeout))
+        try:
+            await asyncio.sleep(0)
+        except asyncio.CancelledError:
+            attempt.cancel()
+            raise
+        return attempt, started
+
+    async def _finish(self, job: Dict, attempt: asyncio.Task, started: float):
+        try:
+            succeeded = bool(await attempt)
+            error = None if succeeded else "submission reported failure"
+        except asyncio.TimeoutError:
+            succeeded, error = False, f"timed out after {self.job_timeout:.0f}s"
+        except Exception as e:
+            succeeded, error = False, f"{type(e).__name__}: {e}"
+        seconds = time.perf_counter() - started
+
+        now = time.time()
+        job.update(updated_at=now, last_error=error)
+        if succeeded:
+            job.update(state='succeeded', finished_at=now)
+        elif job['attempts'] < job['max_attempts']:
+            job.update(state='queued', next_run_at=now + self.backoff(job['attempts']))
+            self.retries += 1
+        else:
+            job.update(state='failed', finished_at=now)
+
+        await self.executor.run(self.store.save, job)
+        self._attempts.append((now, succeeded, seconds))
+        await self._write_back(job)
+
+    async def _write_back(self, job: Dict):
+        if self.on_status is None:
+            return
+
+        notes = ""
+        if job['state'] == 'failed':
+            notes = f"Submission failed after {job['attempts']} attempts: {job['last_error']}"
+        elif job['state'] == 'queued' and job['last_error']:
+            notes = f"Attempt {job['attempts']} failed ({job['last_error']}); retrying"
+
+        try:
+            await self.executor.run(self.on_status, job['app_id'], APPLICATION_STATUS[job['state']], notes)
+        except KeyError:
+            self.logger.warning(f"Submission {job['id']}: application {job['app_id']} not found")
+
+    async def get(self, job_id: int) -> Optional[Dict]:
+        return await self.executor.run(self.store.get, job_id)
+
+    async def jobs(self, state: Optional[str] = None, limit: int = 50) -> List[Dict]:
+        return await self.executor.run(self.store.jobs, state, limit)
+
+    async def stats(self) -> Dict:
+        """Queue depth per state, worker pool size and recent submission throughput."""
+
+        counts = await self.executor.run(self.store.counts)
+        now = time.time()
+        attempts = list(self._attempts)
+        last_minute = [a for a in attempts if now - a[0] <= 60]
+        last_5_minutes = [a for a in attempts if now - a[0] <= 300]
+
+        return {
+            'backend': self.store.name,
+            'depth': counts['queued'],
+            'states': counts,
+            'workers': self.workers,
+            'active_workers': sum(1 for task in self._tasks.values() if not task.done()),
+            'retries': self.retries,
+            'paused': self.paused_reason,
+            'throughput': {
+                'attempts_last_minute': len(last_minute),
+                'succeeded_last_minute': sum(1 for a in last_minute if a[1]),
+                'per_minute_5m': round(sum(1 for a in last_5_minutes if a[1]) / 5, 2),
+                'success_rate': round(sum(1 for a in attempts if a[1]) / len(attempts), 3) if attempts else 0.0,
+                'avg_attempt_seconds': round(sum(a[2] for a in attempts) / len(attempts), 3) if attempts else 0.0
+            }
+        }
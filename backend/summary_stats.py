@@ -0,0 +1,141 @@
+"""
+Running Summary Statistics
+Incrementally maintained aggregates behind ApplicationDatabase.get_summary_stats()
+"""
+
+import pandas as pd
+from collections import Counter
+from datetime import date, datetime, timedelta
+from typing import Dict, Optional
+
+
+def _is_set(value) -> bool:
+    """True for a real value; False for None, NaN/NaT/NA and the '' sentinel."""
+    if value is None or value == '':
+        return False
+    try:
+        return not pd.isna(value)
+    except (TypeError, ValueError):
+        return True
+
+
+def _to_day(value) -> Optional[date]:
+    if not _is_set(value):
+        return None
+    if isinstance(value, str):
+        return date.fromisoformat(value[:10])
+    return pd.Timestamp(value).date()
+
+
+def _to_score(value) -> Optional[float]:
+    if not _is_set(value):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class SummaryStats:
+    """
+    Aggregates updated in O(1) per insert / status change:
+    counts, score sum for the average, and per-day application buckets
+    for the rolling 7-day window.
+    """
+
+    WINDOW_DAYS = 7
+
+    def __init__(self):
+        self.total = 0
+        self.responses = 0
+        self.interviews = 0
+        self.score_sum = 0.0
+        self.score_count = 0
+        self.daily = Counter()
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "SummaryStats":
+        """Build the aggregates once from a loaded table (vectorized)."""
+
+        stats = cls()
+        stats.total = len(df)
+        if stats.total == 0:
+            return stats
+
+        stats.responses = int(df['Response_Date'].map(_is_set).sum())
+        stats.interviews = int(df['Interview_Date'].map(_is_set).sum())
+
+        scores = pd.to_numeric(df['Tailoring_Score'], errors='coerce').dropna()
+        stats.score_sum = float(scores.sum())
+        stats.score_count = len(scores)
+
+        days = pd.to_datetime(df['Date_Applied'], errors='coerce').dropna().dt.date
+        stats.daily = Counter(days.value_counts().to_dict())
+
+        return stats
+
+    def add(self, row: Dict):
+        """Account for one newly inserted application row."""
+
+        self.total += 1
+
+        day = _to_day(row.get('Date_Applied'))
+        if day is not None:
+            self.daily[day] += 1
+
+        score = _to_score(row.get('Tailoring_Score'))
+        if score is not None:
+            self.score_sum += score
+            self.score_count += 1
+
+        self.responses += _is_set(row.get('Response_Date'))
+        self.interviews += _is_set(row.get('Interview_Date'))
+
+    def change(self, old: Dict, new: Dict):
+        """Account for an in-place update; old/new hold only the changed columns."""
+
+        for column, attr in (('Response_Date', 'responses'), ('Interview_Date', 'interviews')):
+            if column in new:
+                delta = int(_is_set(new[column])) - int(_is_set(old.get(column)))
+                setattr(self, attr, getattr(self, attr) + delta)
+
+        if 'Tailoring_Score' in new:
+            old_score = _to_score(old.get('Tailoring_Score'))
+            new_score = _to_score(new['Tailoring_Score'])
+            if old_score is not None:
+                self.score_sum -= old_score
+                self.score_count -= 1
+            if new_score is not None:
+                self.score_sum += new_score
+                self.score_count += 1
+
+    def this_week(self, now: Optional[datetime] = None) -> int:
+        """Applications dated on or after (now - 7 days), matching the old scan."""
+
+        now = now or datetime.now()
+        week_start = now - timedelta(days=self.WINDOW_DAYS)
+
+        # Buckets older than the window can never count again
+        for day in [d for d in self.daily if d < week_start.date()]:
+            del self.daily[day]
+
+        return sum(
+            count for day, count in self.daily.items()
+            if datetime.combine(day, datetime.min.time()) >= week_start
+        )
+
+    def snapshot(self, now: Optional[datetime] = None) -> Dict:
+        """Same shape as ApplicationDatabase.get_summary_stats()."""
+
+        total = self.total
+        response_rate = (self.responses / total * 100) if total > 0 else 0
+        interview_rate = (self.interviews / total * 100) if total > 0 else 0
+        avg_score = (self.score_sum / self.score_count) if self.score_count else 0
+
+        return {
+            'total_applications': total,
+            'this_week': self.this_week(now),
+            'response_rate': f"{response_rate:.1f}%",
+            'interview_rate': f"{interview_rate:.1f}%",
+            'avg_tailoring_score': round(avg_score, 1)
+        }
@@ -0,0 +1,309 @@
+"""
+Tailoring Result Cache
+Content-addressed LRU (memory) + JSON file (disk) cache for ResumeTailor outputs,
+plus a bullet-level cache of individual rewrites
+"""
+
+import copy
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+_NUMBER = re.compile(r"\d+(?:[.,]\d+)*")
+
+
+class TailoringCache:
+    """
+    Two-tier cache for model tailoring output.
+
+    Keys are SHA-256 digests of the full job description, the key
+    requirements and the canonicalized master resume, so any change to
+    the inputs is a miss and templated postings no longer collide.
+    The memory tier is an LRU bounded by entry count; both tiers expire
+    entries after ttl_seconds. Expired files are deleted when read and
+    the disk tier is pruned (expired first, then oldest) to
+    max_disk_entries files. Values are copied in and out, so callers
+    never share state with the cache.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = "cache/tailoring",
+                 max_entries: int = 256, ttl_seconds: float = 7 * 24 * 3600,
+                 max_disk_entries: int = 4096):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_disk_entries = max_disk_entries
+
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_evictions = 0
+        self._disk_files = 0
+
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._prune_disk()
+
+    @staticmethod
+    def make_key(master_resume: Dict, job_data: Dict, model: str = "") -> str:
+        """Content hash of everything that shapes the model's answer."""
+
+        payload = {
+            'model': model,
+            'company': job_data.get('company'),
+            'title': job_data.get('title'),
+            'jd': job_data.get('jd'),
+            'key_requirements': job_data.get('key_requirements', []),
+            'master_resume': master_resume
+        }
+        canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached value, or None on a miss / expired entry."""
+
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                created, value = entry
+                if now - created <= self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return copy.deepcopy(value)
+                del self._entries[key]
+
+        entry = self._read_disk(key)
+        if entry is not None and now - entry['created'] > self.ttl_seconds:
+            self._delete_disk(self._path(key))
+            entry = None
+
+        with self._lock:
+            if entry is not None:
+                self._remember(key, entry['created'], entry['value'])
+                self.hits += 1
+                self.disk_hits += 1
+                return copy.deepcopy(entry['value'])
+            self.misses += 1
+
+        return None
+
+    def set(self, key: str, value: Dict):
+        created = time.time()
+        value = copy.deepcopy(value)
+
+        with self._lock:
+            self._remember(key, created, value)
+        self._write_disk(key, created, value)
+
+    def _remember(self, key: str, created: float, value: Dict):
+        self._entries[key] = (created, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _read_disk(self, key: str) -> Optional[Dict]:
+        if not self.cache_dir:
+            return None
+
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def _write_disk(self, key: str, created: float, value: Dict):
+        if not self.cache_dir:
+            return
+
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        existed = path.exists()
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'created': created, 'value': value}, f)
+        os.replace(tmp_path, path)
+
+        if not existed:
+            with self._lock:
+                self._disk_files += 1
+                over = self._disk_files > self.max_disk_entries
+            if over:
+                self._prune_disk()
+
+    def _delete_disk(self, path: Path):
+        try:
+            path.unlink()
+        except OSError:
+            return
+        with self._lock:
+            self._disk_files -= 1
+            self.disk_evictions += 1
+
+    def _prune_disk(self):
+        """Delete expired files, then the oldest, leaving at most ~90% of max_disk_entries."""
+
+        files = []
+        for path in self.cache_dir.glob('*/*.json'):
+            try:
+                files.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+        files.sort()
+
+        keep = len(files)
+        if keep > self.max_disk_entries:
+            keep = self.max_disk_entries * 9 // 10
+        cutoff = time.time() - self.ttl_seconds
+
+        with self._lock:
+            self._disk_files = len(files)
+        for position, (mtime, path) in enumerate(files):
+            if position < len(files) - keep or mtime < cutoff:
+                self._delete_disk(path)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+                'evictions': self.evictions,
+                'disk_evictions': self.disk_evictions,
+                'memory_entries': len(self._entries),
+                'disk_entries': self._disk_files
+            }
+
+
+class BulletCache:
+    """
+    Rewrites of single resume bullets, keyed by (original bullet,
+    normalized requirement set), so jobs that share a requirement
+    cluster reuse earlier rephrasings instead of regenerating them.
+
+    Memory LRU with an append-only JSON-lines file for persistence
+    (replayed on start, last write wins). A cached rewrite is only
+    served if it introduces no numbers absent from the original.
+    """
+
+    def __init__(self, path: Optional[str] = "cache/bullets.jsonl", max_entries: int = 20000):
+        self.path = Path(path) if path else None
+        self.max_entries = max_entries
+
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.rejected = 0
+
+        if self.path:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._load()
+
+    @staticmethod
+    def requirement_key(requirements: Iterable[str]) -> str:
+        """Order-, case- and whitespace-insensitive form of a requirement list."""
+        normalized = {' '.join(r.lower().split()) for r in requirements if r and r.strip()}
+        return '|'.join(sorted(normalized))
+
+    @staticmethod
+    def make_key(bullet: str, requirement_key: str) -> str:
+        return hashlib.sha256(f"{bullet}\x00{requirement_key}".encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def acceptable(original: str, rewrite: str) -> bool:
+        """Cheap guard: a rewrite may not introduce numbers the original lacks."""
+        return isinstance(rewrite, str) and bool(rewrite.strip()) and \
+            set(_NUMBER.findall(rewrite)) <= set(_NUMBER.findall(original))
+
+    def get(self, bullet: str, requirement_key: str) -> Optional[str]:
+        key = self.make_key(bullet, requirement_key)
+
+        with self._lock:
+            rewrite = self._entries.get(key)
+            if rewrite is None:
+                self.misses += 1
+                return None
+            if not self.acceptable(bullet, rewrite):
+                self.rejected += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return rewrite
+
+    def set_many(self, rewrites: Dict[str, str], requirement_key: str):
+        """Store {original bullet: rewrite} pairs for one requirement set."""
+
+        lines = []
+        with self._lock:
+            for bullet, rewrite in rewrites.items():
+                if not self.acceptable(bullet, rewrite):
+                    continue
+                key = self.make_key(bullet, requirement_key)
+                if self._entries.get(key) == rewrite:
+                    continue
+                self._remember(key, rewrite)
+                lines.append(json.dumps({'key': key, 'rewrite': rewrite}))
+
+        if lines and self.path:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write('\n'.join(lines) + '\n')
+
+    def _remember(self, key: str, rewrite: str):
+        self._entries[key] = rewrite
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _load(self):
+        if not self.path.exists():
+            return
+
+        lines = 0
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                lines += 1
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn final line from a crash
+                self._remember(entry['key'], entry['rewrite'])
+
+        # Superseded and evicted lines accumulate; rewrite the file once they dominate
+        if lines > 2 * len(self._entries):
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for key, rewrite in self._entries.items():
+                    f.write(json.dumps({'key': key, 'rewrite': rewrite}) + '\n')
+            os.replace(tmp_path, self.path)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'rejected': self.rejected,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+                'entries': len(self._entries)
+            }
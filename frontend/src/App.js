@@ -310,8 +310,65 @@ const FiltersPanel = ({ filters, onChange }) => {
   );
 };
 
+// APPLICATIONS PAGING
+// Pages through /api/applications with its keyset cursor; falls back to
+// slicing the local list when the API is not reachable.
+const PAGE_SIZE = 25;
+
+const sourceFromUrl = (url = '') => {
+  const host = url.toLowerCase();
+  if (host.includes('linkedin')) return 'LinkedIn';
+  if (host.includes('indeed')) return 'Indeed';
+  if (host.includes('naukri')) return 'Naukri';
+  return 'Other';
+};
+
+const toTableRow = r => ({
+  id: r.Application_ID,
+  company: r.Company,
+  title: r.Job_Title,
+  date: r.Date_Applied,
+  status: r.Status,
+  score: r.Tailoring_Score ?? 0,
+  source: sourceFromUrl(r.Job_URL || ''),
+});
+
+const useApplicationsPage = (fallback) => {
+  const [cursors, setCursors] = useState([null]);
+  const [page, setPage] = useState({ items: fallback.slice(0, PAGE_SIZE), nextCursor: null, total: fallback.length });
+  const pageIndex = cursors.length - 1;
+
+  useEffect(() => {
+    let cancelled = false;
+    const params = new URLSearchParams({ limit: PAGE_SIZE });
+    if (cursors[pageIndex]) params.set('cursor', cursors[pageIndex]);
+
+    fetch(`/api/applications?${params}`)
+      .then(res => { if (!res.ok) throw new Error(res.statusText); return res.json(); })
+      .then(data => {
+        if (!cancelled) setPage({ items: data.items.map(toTableRow), nextCursor: data.next_cursor, total: data.total });
+      })
+      .catch(() => {
+        if (cancelled) return;
+        const start = pageIndex * PAGE_SIZE;
+        const hasMore = start + PAGE_SIZE < fallback.length;
+        setPage({ items: fallback.slice(start, start + PAGE_SIZE), nextCursor: hasMore ? String(start + PAGE_SIZE) : null, total: fallback.length });
+      });
+
+    return () => { cancelled = true; };
+  }, [cursors, pageIndex, fallback]);
+
+  return {
+    ...page,
+    pageIndex,
+    next: () => page.nextCursor && setCursors([...cursors, page.nextCursor]),
+    prev: () => pageIndex > 0 && setCursors(cursors.slice(0, -1)),
+  };
+};
+
 // ANALYTICS PANEL
 const AnalyticsPanel = ({ applications }) => {
+  const table = useApplicationsPage(applications);
   const total = applications.length;
   const interviews = applications.filter(a => a.status === 'Interview').length;
   const responses = applications.filter(a => a.status === 'Response' || a.status === 'Interview').length;
@@ -319,15 +376,12 @@ const AnalyticsPanel = ({ applications }) => {
   const bySource = applications.reduce((acc, a) => { acc[a.source] = (acc[a.source] || 0) + 1; return acc; }, {});
   const byStatus = applications.reduce((acc, a) => { acc[a.status] = (acc[a.status] || 0) + 1; return acc; }, {});
 
-  const exportToCSV = () => {
-    const headers = ['ID', 'Company', 'Title', 'Date', 'Status', 'Match Score', 'Source'];
-    const rows = applications.map(a => [a.id, a.company, a.title, a.date, a.status, a.score + '%', a.source]);
-    const csv = [headers, ...rows].map(r => r.join(',')).join('\n');
-    const blob = new Blob([csv], { type: 'text/csv' });
-    const url = URL.createObjectURL(blob);
+  // The server streams the export; the browser writes it straight to disk
+  const exportApplications = (format) => {
     const a = document.createElement('a');
-    a.href = url; a.download = 'job_applications.csv'; a.click();
-    URL.revokeObjectURL(url);
+    a.href = `/api/applications/export?format=${format}`;
+    a.download = `job_applications.${format}`;
+    a.click();
   };
 
   return (
@@ -335,9 +389,14 @@ const AnalyticsPanel = ({ applications }) => {
       {/* Header */}
       <div className="ap-header">
         <h2 className="ap-title">Analytics Dashboard</h2>
-        <button className="export-btn" onClick={exportToCSV}>
-          <Icon name="download" size={14} /> Export to Excel/CSV
-        </button>
+        <div className="export-actions">
+          <button className="export-btn" onClick={() => exportApplications('xlsx')}>
+            <Icon name="download" size={14} /> Export to Excel
+          </button>
+          <button className="export-btn" onClick={() => exportApplications('csv')}>
+            <Icon name="download" size={14} /> CSV
+          </button>
+        </div>
       </div>
 
       {/* KPI Cards */}
@@ -394,7 +453,11 @@ const AnalyticsPanel = ({ applications }) => {
       <div className="table-card">
         <div className="table-header">
           <h4 className="chart-title">All Applications</h4>
-          <span className="table-count">{total} total</span>
+          <div className="table-pager">
+            <button className="pager-btn" onClick={table.prev} disabled={table.pageIndex === 0}>‹ Prev</button>
+            <span className="table-count">Page {table.pageIndex + 1} · {table.total} total</span>
+            <button className="pager-btn" onClick={table.next} disabled={!table.nextCursor}>Next ›</button>
+          </div>
         </div>
         <div className="table-wrap">
           <table className="app-table">
@@ -404,7 +467,7 @@ const AnalyticsPanel = ({ applications }) => {
               </tr>
             </thead>
             <tbody>
-              {applications.map(a => (
+              {table.items.map(a => (
                 <tr key={a.id}>
                   <td className="td-id">{a.id}</td>
                   <td className="td-company">{a.company}</td>
@@ -42,6 +42,15 @@ USE_STEALTH=true
 
 # Database
 DB_PATH=../database/applications.xlsx
+DB_BACKEND=excel  # excel, write-behind or sqlite
+TAILOR_MAX_CONCURRENCY=4
+
+# Submission queue
+SUBMIT_QUEUE_BACKEND=sqlite  # sqlite or journal
+SUBMIT_WORKERS=1
+SUBMIT_MAX_ATTEMPTS=3
+SUBMIT_BACKOFF_SECONDS=30
+SUBMIT_PACE_SECONDS=30  # re-check interval while the emulator pauses submissions
 EOF
     echo "✓ Created .env file"
     echo "⚠️  Please add your ANTHROPIC_API_KEY to backend/.env"